@@ -0,0 +1,17 @@
+"""
+Benchmarks do mygameui.
+
+Os benchmarks rodam sem janela (SDL_VIDEODRIVER=dummy) e medem os caminhos mais usados a cada
+frame: desenho de formulários, tratamento de eventos, digitação no Textbox e construção de
+formulários grandes, além da memória ocupada por controle. Os resultados podem ser salvos em JSON e comparados com um baseline.
+
+Uso:
+    python -m benchmarks [--quick] [--only draw,events] [--output resultados.json]
+                         [--baseline baseline.json] [--tolerance 0.1]
+"""
+import os
+
+# Definido no pacote para valer antes de qualquer módulo importar o pygame
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
@@ -0,0 +1,137 @@
+"""
+Executa os benchmarks, salva os resultados em JSON e compara com um baseline.
+
+Uso:
+    python -m benchmarks [--quick] [--only draw,events] [--output resultados.json]
+                         [--baseline baseline.json] [--tolerance 0.1]
+
+Com --baseline, o processo termina com código 1 se algum caso ficar mais lento que o baseline
+além da tolerância.
+"""
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime
+
+import pygame
+
+from . import bench_build, bench_draw, bench_events, bench_import, bench_memory, bench_textbox
+
+SUITES = {
+    'draw': bench_draw,
+    'events': bench_events,
+    'textbox': bench_textbox,
+    'build': bench_build,
+    'memory': bench_memory,
+    'import': bench_import,
+}
+
+def run(names, quick = False):
+    """Executa os grupos de benchmarks informados.
+
+    Args:
+        names (list[str]): Os nomes dos grupos, chaves de SUITES.
+        quick (bool, optional): Usa cenas menores e menos repetições. Default é False.
+
+    Returns:
+        dict: Os metadados da execução e os resultados de cada caso.
+    """
+    results = {}
+    for name in names:
+        print(f'executando {name}...', file=sys.stderr)
+        results.update(SUITES[name].benchmark(quick))
+
+    return {
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'quick': quick,
+        },
+        'results': results,
+    }
+
+def speedup(current, baseline):
+    """Retorna quantas vezes o resultado atual é melhor que o do baseline (acima de 1 é mais rápido).
+
+    Args:
+        current (dict): O resultado atual.
+        baseline (dict): O resultado do baseline.
+
+    Returns:
+        float: A razão entre os dois resultados.
+    """
+    if current['higher_is_better']:
+        return current['value'] / baseline['value']
+
+    return baseline['value'] / current['value']
+
+def compare(report, baseline, tolerance):
+    """Compara os resultados com os de um baseline.
+
+    Args:
+        report (dict): Os resultados atuais, como retornados por run.
+        baseline (dict): Os resultados do baseline, no mesmo formato.
+        tolerance (float): A perda relativa aceita antes de considerar um caso como regressão.
+
+    Returns:
+        list[str]: Os nomes dos casos que regrediram.
+    """
+    regressions = []
+    base_results = baseline['results']
+
+    print(f"{'caso':<40} {'baseline':>12} {'atual':>12} {'':<9} {'speedup':>8}")
+    for name, current in report['results'].items():
+        base = base_results.get(name)
+        if base is None:
+            print(f"{name:<40} {'-':>12} {current['value']:12.3f} {current['unit']:<9} {'novo':>8}")
+            continue
+
+        ratio = speedup(current, base)
+        mark = ''
+        if ratio < 1 - tolerance:
+            regressions.append(name)
+            mark = '  REGRESSÃO'
+
+        print(f"{name:<40} {base['value']:12.3f} {current['value']:12.3f} {current['unit']:<9} {ratio:7.2f}x{mark}")
+
+    return regressions
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmarks do mygameui.')
+    parser.add_argument('--quick', action='store_true', help='usa cenas menores e menos repetições')
+    parser.add_argument('--only', default=','.join(SUITES), help='grupos a executar, separados por vírgula')
+    parser.add_argument('--output', help='arquivo JSON onde salvar os resultados')
+    parser.add_argument('--baseline', help='arquivo JSON de resultados anteriores para comparação')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='perda relativa aceita (padrão: 0.1)')
+    args = parser.parse_args(argv)
+
+    names = [name.strip() for name in args.only.split(',') if name.strip()]
+    unknown = [name for name in names if name not in SUITES]
+    if unknown:
+        parser.error(f"grupos desconhecidos: {', '.join(unknown)}")
+
+    report = run(names, args.quick)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f'{len(regressions)} caso(s) mais lentos que o baseline.', file=sys.stderr)
+            return 1
+    else:
+        for name, value in report['results'].items():
+            print(f"{name:<40} {value['value']:12.3f} {value['unit']}")
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Mede o tempo de construção de formulários grandes.
+
+Uso:
+    python -m benchmarks.bench_build
+"""
+import tempfile
+
+from . import common
+from .scenes import build_form, build_forms, form_spec
+from mygameui import load_ui, Form, ui_cache
+
+def benchmark(quick = False):
+    """Executa os benchmarks de construção.
+
+    Args:
+        quick (bool, optional): Usa formulários menores e menos repetições. Default é False.
+
+    Returns:
+        dict: Os resultados de cada caso, em milissegundos.
+    """
+    common.setup_display()
+    repeat = 3 if quick else 7
+    results = {}
+
+    for controls in (100, 1000) if not quick else (100,):
+        seconds = common.measure(lambda: build_form(0, 0, controls, columns=25), repeat)
+        results[f'build.form[{controls}]'] = common.result(seconds * 1000, 'ms')
+
+        spec = form_spec(0, 0, controls, columns=25)
+        seconds = common.measure(lambda: load_ui(spec), repeat)
+        results[f'build.loader[{controls}]'] = common.result(seconds * 1000, 'ms')
+
+    seconds = common.measure(lambda: build_forms(10, 90), repeat)
+    results['build.forms[10x90]'] = common.result(seconds * 1000, 'ms')
+
+    # Partida a frio: molduras de tamanhos diferentes, sem nada no cache em memória
+    def cold_forms():
+        ui_cache.slice_cache.clear()
+        return [Form(0, 0, 300 + i * 7, 200 + i * 5, 'cold') for i in range(40)]
+
+    seconds = common.measure(cold_forms, repeat)
+    results['build.cold[40 frames]'] = common.result(seconds * 1000, 'ms')
+
+    with tempfile.TemporaryDirectory() as directory:
+        ui_cache.set_disk_cache(directory)
+        try:
+            cold_forms() # Grava o cache em disco
+            seconds = common.measure(cold_forms, repeat)
+            results['build.cold[40 frames, disk cache]'] = common.result(seconds * 1000, 'ms')
+        finally:
+            ui_cache.set_disk_cache(None)
+
+    return results
+
+if __name__ == '__main__':
+    for name, value in benchmark().items():
+        print(f"{name:<36} {value['value']:10.2f} {value['unit']}")
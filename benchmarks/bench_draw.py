@@ -0,0 +1,121 @@
+"""
+Mede quantos frames por segundo são desenhados com N formulários de M controles, no desenho
+completo, no modo de retângulos sujos, com o cache de camada e com o desenho em lote, ao
+mover a cada frame um formulário com muitos descendentes aninhados e ao redimensionar um
+formulário arrastando o seu canto.
+
+Uso:
+    python -m benchmarks.bench_draw
+"""
+import pygame
+
+from mygameui import Form
+from . import common
+from .scenes import build_form, build_forms
+
+SIZES = [(1, 30), (5, 30), (10, 90)]
+QUICK_SIZES = [(1, 30), (5, 30)]
+
+def frames_per_second(screen, forms, repeat, frames):
+    """Mede o desenho de todos os formulários na tela e retorna os frames por segundo.
+
+    Args:
+        screen (Surface): A tela.
+        forms (list[Form]): Os formulários desenhados em cada frame.
+        repeat (int): Quantidade de medições.
+        frames (int): Quantidade de frames em cada medição.
+
+    Returns:
+        float: Os frames por segundo.
+    """
+    def frame():
+        screen.fill((0, 0, 0))
+        for form in forms:
+            form.draw(screen)
+
+    return 1 / common.measure(frame, repeat, frames)
+
+def benchmark(quick = False):
+    """Executa os benchmarks de desenho.
+
+    Args:
+        quick (bool, optional): Usa cenas menores e menos repetições. Default é False.
+
+    Returns:
+        dict: Os resultados de cada caso.
+    """
+    screen = common.setup_display()
+    repeat, frames = (3, 10) if quick else (7, 30)
+    results = {}
+
+    for count, controls in QUICK_SIZES if quick else SIZES:
+        forms = build_forms(count, controls)
+        fps = frames_per_second(screen, forms, repeat, frames)
+        results[f'draw.full[{count}x{controls}]'] = common.result(fps, 'fps', True)
+
+        for form in forms:
+            form.set_layer_cache(True)
+        fps = frames_per_second(screen, forms, repeat, frames)
+        results[f'draw.layer_cache[{count}x{controls}]'] = common.result(fps, 'fps', True)
+
+        for form in forms:
+            form.set_layer_cache(False)
+            form.set_batched_draw(True)
+        fps = frames_per_second(screen, forms, repeat, frames)
+        results[f'draw.batched[{count}x{controls}]'] = common.result(fps, 'fps', True)
+
+    # Modo de retângulos sujos: a cada frame o mouse entra ou sai de um botão
+    form = build_forms(1, 90)[0]
+    background = screen.copy()
+    form.set_dirty_mode(True, background)
+    form.draw(screen)
+
+    inside = common.mouse_motion((form.x + 20, form.y + 30))
+    outside = common.mouse_motion((form.x + 5, form.height - 2))
+    state = [False]
+
+    def frame():
+        state[0] = not state[0]
+        form.update(inside if state[0] else outside)
+        form.draw(screen)
+
+    fps = 1 / common.measure(frame, repeat, frames)
+    results['draw.dirty_hover[1x90]'] = common.result(fps, 'fps', True)
+
+    # Formulário com 1000 controles em formulários aninhados, movido a cada frame
+    outer = Form(0, 0, 1000, 700, 'nested')
+    for i in range(10):
+        inner = build_form(5 + (i % 2) * 480, 20 + (i // 2) * 130, 100, columns=5)
+        outer.add_control(inner)
+    step = [1]
+
+    def frame():
+        step[0] = -step[0]
+        outer.move_ip((step[0], 0))
+        screen.fill((0, 0, 0))
+        outer.draw(screen)
+
+    fps = 1 / common.measure(frame, repeat, frames)
+    results['draw.move_nested[10x100]'] = common.result(fps, 'fps', True)
+
+    # Formulário redimensionado pelo canto a cada frame, com a moldura gerada de forma incremental
+    form = build_form(0, 0, 30)
+    form.resizable = True
+    corner = form.resize_rect.center
+    form.update(common.mouse_button(pygame.MOUSEBUTTONDOWN, corner))
+    step = [0]
+
+    def frame():
+        step[0] = (step[0] + 1) % 100
+        form.update(common.mouse_motion((corner[0] + step[0] * 3, corner[1] + step[0] * 2)))
+        screen.fill((0, 0, 0))
+        form.draw(screen)
+
+    fps = 1 / common.measure(frame, repeat, frames)
+    results['draw.resize_drag[1x30]'] = common.result(fps, 'fps', True)
+
+    return results
+
+if __name__ == '__main__':
+    for name, value in benchmark().items():
+        print(f"{name:<36} {value['value']:10.1f} {value['unit']}")
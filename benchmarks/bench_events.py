@@ -0,0 +1,115 @@
+"""
+Mede quantos eventos por segundo um formulário processa em rajadas de movimento do mouse, em
+cliques que trocam o controle ativo e ao ser arrastado.
+
+Uso:
+    python -m benchmarks.bench_events
+"""
+import pygame
+
+from . import common
+from .scenes import build_form
+
+def motion_storm(form, count):
+    """Cria uma rajada de eventos de movimento que percorre o formulário em zigue-zague.
+
+    Args:
+        form (Form): O formulário percorrido.
+        count (int): A quantidade de eventos.
+
+    Returns:
+        list[Event]: Os eventos.
+    """
+    rect = form.rect
+    return [common.mouse_motion((rect.x + (i * 13) % rect.width, rect.y + (i * 7) % rect.height))
+            for i in range(count)]
+
+def click_sequence(form, count):
+    """Cria uma sequência de cliques alternados entre os botões do formulário.
+
+    Args:
+        form (Form): O formulário clicado.
+        count (int): A quantidade de cliques.
+
+    Returns:
+        list[Event]: Os eventos de pressionar e soltar cada clique.
+    """
+    buttons = [control for control in form._controls if type(control).__name__ == 'Button']
+    events = []
+    for i in range(count):
+        pos = buttons[(i * 7) % len(buttons)]._render_rect.center
+        events.append(common.mouse_button(pygame.MOUSEBUTTONDOWN, pos))
+        events.append(common.mouse_button(pygame.MOUSEBUTTONUP, pos))
+
+    return events
+
+def drag_sequence(form, count):
+    """Cria a sequência de eventos que arrasta o formulário pela barra de título e o devolve à posição inicial.
+
+    Args:
+        form (Form): O formulário arrastado.
+        count (int): A quantidade de eventos de movimento.
+
+    Returns:
+        list[Event]: Os eventos.
+    """
+    x, y = form.x + form.width // 2, form.y + 5
+    events = [common.mouse_button(pygame.MOUSEBUTTONDOWN, (x, y))]
+    for i in range(count):
+        step = 1 if i % 2 == 0 else -1
+        events.append(common.mouse_motion((x + max(step, 0), y + max(step, 0)), (step, step), (1, 0, 0)))
+    events.append(common.mouse_button(pygame.MOUSEBUTTONUP, (x, y)))
+
+    return events
+
+def events_per_second(form, events, repeat):
+    """Mede o processamento dos eventos, um a um, e retorna os eventos por segundo.
+
+    Args:
+        form (Form): O formulário que recebe os eventos.
+        events (list[Event]): Os eventos.
+        repeat (int): Quantidade de medições.
+
+    Returns:
+        float: Os eventos por segundo.
+    """
+    def run():
+        for event in events:
+            form.update(event)
+
+    return len(events) / common.measure(run, repeat)
+
+def benchmark(quick = False):
+    """Executa os benchmarks de eventos.
+
+    Args:
+        quick (bool, optional): Usa menos eventos e menos repetições. Default é False.
+
+    Returns:
+        dict: Os resultados de cada caso.
+    """
+    common.setup_display()
+    repeat, count = (3, 500) if quick else (7, 2000)
+    results = {}
+
+    for controls in (30, 300):
+        form = build_form(0, 0, controls, columns=15)
+        rate = events_per_second(form, motion_storm(form, count), repeat)
+        results[f'events.motion[{controls}]'] = common.result(rate, 'events/s', True)
+
+    # Formulários aninhados, para que trocar o controle ativo envolva subárvores
+    form = build_form(0, 0, 30, columns=15)
+    for i in range(10):
+        form.add_control(build_form(10 + i * 20, 120 + i * 10, 30, columns=15))
+    rate = events_per_second(form, click_sequence(form, count // 2), repeat)
+    results['events.click[10x30]'] = common.result(rate, 'events/s', True)
+
+    form = build_form(0, 0, 90)
+    rate = events_per_second(form, drag_sequence(form, count), repeat)
+    results['events.drag[90]'] = common.result(rate, 'events/s', True)
+
+    return results
+
+if __name__ == '__main__':
+    for name, value in benchmark().items():
+        print(f"{name:<36} {value['value']:10.1f} {value['unit']}")
@@ -0,0 +1,121 @@
+"""
+Mede o tempo de importação do mygameui em interpretadores novos.
+
+Compara a importação do pygame sozinho, a importação do mygameui (que não carrega tema nem
+fonte), o primeiro uso do tema e da fonte e a importação do mygameui de uma versão de
+referência do repositório, extraída com git archive para uma pasta temporária. A referência
+padrão é o primeiro commit, que ainda carregava o tema e a fonte na importação; sem git, o
+caso é omitido.
+
+Uso:
+    python -m benchmarks.bench_import [repeticoes] [referencia]
+"""
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+from io import BytesIO
+from statistics import median
+
+from . import common
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    'import pygame': 'import pygame',
+    'import mygameui': 'import mygameui',
+    'import mygameui + init()': (
+        'import pygame; pygame.display.init(); pygame.display.set_mode((1, 1))\n'
+        'import mygameui; mygameui.init()'
+    ),
+}
+
+TEMPLATE = '''
+import time
+_start = time.perf_counter()
+{code}
+print(time.perf_counter() - _start)
+'''
+
+def measure(code, repeat, root = ROOT):
+    """Executa o código em interpretadores novos e retorna os tempos medidos, em segundos.
+
+    Args:
+        code (str): O código a ser medido.
+        repeat (int): Quantidade de execuções.
+        root (str, optional): A pasta de onde o mygameui é importado. Default é este repositório.
+
+    Returns:
+        list[float]: O tempo de cada execução.
+    """
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy',
+               PYGAME_HIDE_SUPPORT_PROMPT='1', PYTHONPATH=root)
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', TEMPLATE.format(code=code)], env=env, cwd=root,
+                                capture_output=True, text=True, check=True).stdout
+        times.append(float(output.strip().splitlines()[-1]))
+
+    return times
+
+def _git(*args):
+    """
+    Executa um comando git no repositório e retorna a saída, ou None se o git falhar.
+    """
+    try:
+        return subprocess.run(['git', *args], cwd=ROOT, capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _extract(ref, directory):
+    """
+    Extrai o pacote mygameui da referência informada para a pasta. Retorna False se não for possível.
+    """
+    archive = _git('archive', '--format=tar', ref, 'mygameui')
+    if archive is None:
+        return False
+
+    with tarfile.open(fileobj=BytesIO(archive)) as tar:
+        tar.extractall(directory)
+    return True
+
+def run(repeat = 5, ref = None):
+    """Mede todos os casos e retorna o tempo mediano de cada um, em segundos.
+
+    Args:
+        repeat (int, optional): Quantidade de execuções de cada caso. Default é 5.
+        ref (str, optional): A referência do git cuja importação é medida para comparação.
+            Default é o primeiro commit do repositório.
+
+    Returns:
+        dict: O tempo mediano de cada caso.
+    """
+    results = {name: median(measure(code, repeat)) for name, code in CASES.items()}
+
+    if ref is None:
+        roots = _git('rev-list', '--max-parents=0', 'HEAD')
+        ref = roots.split()[-1].decode() if roots else None
+    if ref is not None:
+        with tempfile.TemporaryDirectory() as directory:
+            if _extract(ref, directory):
+                results[f'import mygameui ({ref[:7]})'] = median(measure('import mygameui', repeat, directory))
+
+    return results
+
+def benchmark(quick = False):
+    """Executa os benchmarks de importação.
+
+    Args:
+        quick (bool, optional): Usa menos repetições. Default é False.
+
+    Returns:
+        dict: Os resultados de cada caso, em milissegundos.
+    """
+    return {f'import.{name}': common.result(seconds * 1000, 'ms')
+            for name, seconds in run(2 if quick else 5).items()}
+
+if __name__ == '__main__':
+    results = run(int(sys.argv[1]) if len(sys.argv) > 1 else 5, sys.argv[2] if len(sys.argv) > 2 else None)
+    for name, seconds in results.items():
+        print(f'{name:<36} {seconds * 1000:8.1f} ms')
@@ -0,0 +1,104 @@
+"""
+Mede a memória ocupada por controle em cada classe de controle da biblioteca.
+
+Para cada classe são criadas várias instâncias e são reportados os bytes alocados pelo Python
+por controle (tracemalloc) e os bytes de pixels das Surfaces exclusivas de cada controle;
+Surfaces compartilhadas entre controles idênticos são contadas uma única vez.
+
+Uso:
+    python -m benchmarks.bench_memory
+"""
+import gc
+import tracemalloc
+
+from pygame import Surface
+
+from mygameui import Control, Button, Label, CheckBox, Textbox, TextArea, Form, ScrollView, ListBox
+from . import common
+
+CASES = {
+    'Control': lambda: Control(0, 0, 32, 32),
+    'Button': lambda: Button(0, 0, 32, 32, 'b'),
+    'Label': lambda: Label(0, 0, 'label'),
+    'CheckBox': lambda: CheckBox(0, 0, text='c'),
+    'Textbox': lambda: Textbox(0, 0, 80, 20, 'text'),
+    'TextArea': lambda: TextArea(0, 0, 120, 60, 'text'),
+    'Form': lambda: Form(0, 0, 64, 64, 'form'),
+    'ScrollView': lambda: ScrollView(0, 0, 64, 64),
+    'ListBox': lambda: ListBox(0, 0, 80, 60, ['item']),
+}
+
+def surfaces_of(control):
+    """Retorna as Surfaces referenciadas diretamente pelo controle.
+
+    Args:
+        control (Control): O controle.
+
+    Returns:
+        list[Surface]: As Surfaces encontradas nos atributos do controle.
+    """
+    names = set(getattr(control, '__dict__', ()))
+    for cls in type(control).__mro__:
+        for name in cls.__dict__.get('__slots__', ()):
+            # Nomes privados nos __slots__ são renomeados com o nome da classe
+            if name.startswith('__') and not name.endswith('__'):
+                name = f'_{cls.__name__.lstrip("_")}{name}'
+            names.add(name)
+
+    values = [getattr(control, name, None) for name in names]
+    return [value for value in values if isinstance(value, Surface)]
+
+def measure_class(factory, count):
+    """Mede a memória média ocupada por uma instância.
+
+    Args:
+        factory (function): Função que cria uma instância.
+        count (int): A quantidade de instâncias criadas.
+
+    Returns:
+        tuple: Os bytes alocados pelo Python e os bytes de pixels exclusivos, por controle.
+    """
+    # Aquece os caches de texto e de recortes, que são compartilhados e não contam por controle
+    warm = [factory() for _ in range(4)]
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    controls = [factory() for _ in range(count)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    shared = {id(surface) for control in warm for surface in surfaces_of(control)}
+    unique = {}
+    for control in controls:
+        for surface in surfaces_of(control):
+            if id(surface) not in shared:
+                unique[id(surface)] = surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+    # O tamanho da própria lista não conta como memória dos controles
+    return (after - before - 8 * count) / count, sum(unique.values()) / count
+
+def benchmark(quick = False):
+    """Executa os benchmarks de memória.
+
+    Args:
+        quick (bool, optional): Cria menos instâncias. Default é False.
+
+    Returns:
+        dict: Os resultados de cada classe, em bytes por controle.
+    """
+    common.setup_display()
+    count = 200 if quick else 2000
+    results = {}
+
+    for name, factory in CASES.items():
+        python_bytes, surface_bytes = measure_class(factory, count)
+        results[f'memory.python[{name}]'] = common.result(python_bytes, 'bytes')
+        results[f'memory.surfaces[{name}]'] = common.result(surface_bytes, 'bytes')
+
+    return results
+
+if __name__ == '__main__':
+    for name, value in benchmark().items():
+        print(f"{name:<36} {value['value']:10.0f} {value['unit']}")
@@ -0,0 +1,52 @@
+"""
+Mede a latência de cada tecla digitada no Textbox conforme o tamanho do texto cresce.
+
+Uso:
+    python -m benchmarks.bench_textbox
+"""
+import pygame
+
+from mygameui import Form, Textbox
+from . import common
+
+LENGTHS = [10, 100, 1000, 10000]
+QUICK_LENGTHS = [10, 1000]
+
+def benchmark(quick = False):
+    """Executa os benchmarks do Textbox.
+
+    Args:
+        quick (bool, optional): Usa menos tamanhos de texto e menos repetições. Default é False.
+
+    Returns:
+        dict: Os resultados de cada caso, em milissegundos por tecla.
+    """
+    screen = common.setup_display()
+    repeat, keys = (3, 50) if quick else (7, 200)
+    results = {}
+
+    key = common.key_down(pygame.K_a, 'a')
+
+    for length in QUICK_LENGTHS if quick else LENGTHS:
+        form = Form(0, 0, 300, 80)
+        textbox = Textbox(10, 30, 200, 24)
+        form.add_control(textbox)
+        form.update(common.mouse_button(pygame.MOUSEBUTTONDOWN, (textbox.x + 5, textbox.y + 5)))
+
+        base = 'x' * length
+
+        def reset():
+            textbox.text = base
+
+        def keystroke():
+            form.update(key)
+            textbox.draw(screen)
+
+        seconds = common.measure(keystroke, repeat, keys, reset)
+        results[f'textbox.keystroke[{length}]'] = common.result(seconds * 1000, 'ms')
+
+    return results
+
+if __name__ == '__main__':
+    for name, value in benchmark().items():
+        print(f"{name:<36} {value['value']:10.4f} {value['unit']}")
@@ -0,0 +1,85 @@
+"""
+Funções compartilhadas pelos benchmarks: configuração sem janela, medição de tempo e
+formato dos resultados.
+"""
+from statistics import median
+from time import perf_counter
+
+import pygame
+
+SCREEN_SIZE = (1280, 720)
+
+def setup_display(size = SCREEN_SIZE):
+    """Inicializa o pygame sem janela e retorna a tela.
+
+    Args:
+        size (tuple, optional): O tamanho da tela. Default é SCREEN_SIZE.
+
+    Returns:
+        Surface: A tela.
+    """
+    if not pygame.display.get_init():
+        pygame.display.init()
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != size:
+        screen = pygame.display.set_mode(size)
+
+    return screen
+
+def measure(func, repeat = 5, number = 1, setup = None):
+    """Mede o tempo de uma chamada da função.
+
+    Args:
+        func (function): A função medida.
+        repeat (int, optional): Quantidade de medições; o resultado é a mediana. Default é 5.
+        number (int, optional): Quantidade de chamadas em cada medição. Default é 1.
+        setup (function, optional): Função chamada antes de cada medição, fora do tempo medido.
+
+    Returns:
+        float: O tempo mediano de uma chamada, em segundos.
+    """
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        times.append((perf_counter() - start) / number)
+
+    return median(times)
+
+def result(value, unit, higher_is_better = False):
+    """Cria o registro de um resultado.
+
+    Args:
+        value (float): O valor medido.
+        unit (str): A unidade do valor.
+        higher_is_better (bool, optional): Indica se valores maiores são melhores. Default é False.
+
+    Returns:
+        dict: O resultado.
+    """
+    return {'value': value, 'unit': unit, 'higher_is_better': higher_is_better}
+
+def mouse_motion(pos, rel = (1, 1), buttons = (0, 0, 0)):
+    """
+    Cria um evento MOUSEMOTION.
+    """
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=rel, buttons=buttons)
+
+def mouse_button(event_type, pos, button = 1):
+    """
+    Cria um evento MOUSEBUTTONDOWN ou MOUSEBUTTONUP.
+    """
+    return pygame.event.Event(event_type, pos=pos, button=button)
+
+def key_down(key, unicode = ''):
+    """
+    Cria um evento KEYDOWN.
+    """
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0)
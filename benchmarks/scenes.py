@@ -0,0 +1,76 @@
+"""
+Cenas usadas pelos benchmarks.
+"""
+from mygameui import Form, Button, Label, CheckBox
+
+def build_form(x, y, controls, columns = 10, caption = 'bench'):
+    """Cria um formulário com botões, labels e checkboxes dispostos em grade.
+
+    Args:
+        x (int): A coordenada x do formulário.
+        y (int): A coordenada y do formulário.
+        controls (int): A quantidade de controles.
+        columns (int, optional): A quantidade de colunas da grade. Default é 10.
+        caption (str, optional): O título do formulário. Default é 'bench'.
+
+    Returns:
+        Form: O formulário criado.
+    """
+    rows = (controls + columns - 1) // columns
+    form = Form(x, y, columns * 90 + 10, rows * 30 + 30, caption)
+
+    for i in range(controls):
+        cx = 10 + (i % columns) * 90
+        cy = 25 + (i // columns) * 30
+        kind = i % 3
+        if kind == 0:
+            control = Button(cx, cy, 80, 24, f'b{i}')
+        elif kind == 1:
+            control = Label(cx, cy + 4, f'label {i}')
+        else:
+            control = CheckBox(cx, cy + 4, text=f'c{i}')
+        form.add_control(control)
+
+    return form
+
+def form_spec(x, y, controls, columns = 10, caption = 'bench'):
+    """Cria a especificação de load_ui equivalente ao formulário de build_form.
+
+    Args:
+        x (int): A coordenada x do formulário.
+        y (int): A coordenada y do formulário.
+        controls (int): A quantidade de controles.
+        columns (int, optional): A quantidade de colunas da grade. Default é 10.
+        caption (str, optional): O título do formulário. Default é 'bench'.
+
+    Returns:
+        dict: A especificação do formulário.
+    """
+    rows = (controls + columns - 1) // columns
+    children = []
+
+    for i in range(controls):
+        cx = 10 + (i % columns) * 90
+        cy = 25 + (i // columns) * 30
+        kind = i % 3
+        if kind == 0:
+            children.append({'type': 'Button', 'x': cx, 'y': cy, 'width': 80, 'height': 24, 'text': f'b{i}'})
+        elif kind == 1:
+            children.append({'type': 'Label', 'x': cx, 'y': cy + 4, 'text': f'label {i}'})
+        else:
+            children.append({'type': 'CheckBox', 'x': cx, 'y': cy + 4, 'text': f'c{i}'})
+
+    return {'type': 'Form', 'x': x, 'y': y, 'width': columns * 90 + 10, 'height': rows * 30 + 30,
+            'caption': caption, 'controls': children}
+
+def build_forms(count, controls):
+    """Cria vários formulários, deslocados em cascata.
+
+    Args:
+        count (int): A quantidade de formulários.
+        controls (int): A quantidade de controles em cada formulário.
+
+    Returns:
+        list[Form]: Os formulários criados.
+    """
+    return [build_form(10 + i * 20, 10 + i * 20, controls, caption=f'form {i}') for i in range(count)]
@@ -4,5 +4,52 @@ from .controls.button import Button
 from .controls.textbox import Textbox
 from .controls.label import Label
 from .controls.checkbox import CheckBox
+from .controls.textarea import TextArea
+from .controls.scrollview import ScrollView
+from .controls.listbox import ListBox
+from .controls.statsoverlay import StatsOverlay
+from .controls.layout import Panel, StackPanel, GridPanel, AnchorPanel, update_layout
 import mygameui.globals as ui_globals
-import mygameui.utils as ui_utils
\ No newline at end of file
+import mygameui.utils as ui_utils
+import mygameui.cache as ui_cache
+import mygameui.theme as ui_theme
+import mygameui.profiler as ui_profiler
+import mygameui.loader as ui_loader
+import mygameui.animation as ui_animation
+from .theme import Theme
+from .loader import load_ui, load_ui_file
+
+def init(theme = None, font = None, cache_dir = None):
+    """Carrega antecipadamente o tema e a fonte usados pelos controles.
+
+    Sem esta chamada, o tema e a fonte são carregados no primeiro acesso, ao criar o primeiro
+    controle. Chamar init depois de criar a janela do jogo evita esse custo no meio do jogo e
+    permite trocar o tema e a fonte padrão.
+
+    Args:
+        theme (str | Surface | Theme, optional): Caminho da imagem do tema, a própria Surface
+            ou um Theme. Se None, usa o tema padrão da biblioteca.
+        font (Font | tuple, optional): A fonte ou uma tupla (nome, tamanho) de uma fonte do sistema.
+            Se None, usa a fonte padrão da biblioteca.
+        cache_dir (str, optional): Pasta do cache em disco das molduras e fundos gerados para
+            os controles, que acelera as próximas execuções. Se None, o cache em disco não é usado.
+    """
+    if cache_dir is not None:
+        ui_cache.set_disk_cache(cache_dir)
+
+    set_theme(theme)
+    ui_globals.font = ui_globals.load_font(font)
+
+def set_theme(theme):
+    """Troca o tema global, redesenhando de uma só vez todos os controles que usam o tema atual.
+
+    Args:
+        theme (str | Surface | Theme): Caminho da imagem do tema, a própria Surface ou um Theme.
+            Se None, usa o tema padrão da biblioteca.
+    """
+    old = vars(ui_globals).get('theme')
+    new = ui_globals.load_theme(theme)
+    ui_globals.theme = new
+
+    if old is not None and old is not new:
+        ui_theme.apply_theme(old, new)
@@ -0,0 +1,342 @@
+import heapq
+
+from pygame import time
+
+# ========== Easing Function's ============
+
+def linear(t):
+    return t
+
+def ease_in_quad(t):
+    return t * t
+
+def ease_out_quad(t):
+    return t * (2 - t)
+
+def ease_in_out_quad(t):
+    return 2 * t * t if t < 0.5 else 1 - 2 * (1 - t) * (1 - t)
+
+def ease_out_cubic(t):
+    t -= 1
+    return t * t * t + 1
+
+# Funções de suavização que podem ser informadas pelo nome
+EASINGS = {
+    'linear': linear,
+    'ease_in_quad': ease_in_quad,
+    'ease_out_quad': ease_out_quad,
+    'ease_in_out_quad': ease_in_out_quad,
+    'ease_out_cubic': ease_out_cubic,
+}
+
+
+class Timer:
+    """Temporizador registrado no Scheduler, que chama uma função quando vence.
+
+    Attributes:
+        due (float): O instante, em milissegundos, em que o temporizador vence.
+        interval (float): O intervalo entre as chamadas de um temporizador repetido, ou None.
+        active (bool): False depois que o temporizador é cancelado ou, se não é repetido, chamado.
+
+    Methods:
+        cancel(): Cancela o temporizador.
+    """
+
+    __slots__ = ('due', 'interval', 'active', '_func', '_args')
+
+    def __init__(self, due, interval, func, args):
+        self.due = due
+        self.interval = interval
+        self.active = True
+        self._func = func
+        self._args = args
+
+    def cancel(self):
+        """Cancela o temporizador; ele é descartado quando chegar a sua vez na fila."""
+        self.active = False
+
+
+class Tween:
+    """Interpolação de um atributo de um objeto ao longo do tempo.
+
+    Números são interpolados diretamente e tuplas (posições, cores), elemento a elemento; valores
+    inteiros continuam inteiros. O atributo é alterado com setattr e, quando o objeto é um
+    controle, a área do próprio controle é marcada como alterada, inclusive para atributos
+    simples como font_color, que não são propriedades.
+
+    Attributes:
+        target: O objeto animado.
+        attribute (str): O nome do atributo animado.
+        duration (float): A duração da animação, em milissegundos.
+        elapsed (float): O tempo já decorrido da animação, em milissegundos.
+        active (bool): False depois que a animação termina ou é cancelada.
+
+    Methods:
+        cancel(): Cancela a animação, mantendo o valor atual do atributo.
+    """
+
+    __slots__ = ('target', 'attribute', 'duration', 'elapsed', 'active', '_start', '_end', '_easing', '_on_done')
+
+    def __init__(self, target, attribute, start, end, duration, easing, on_done):
+        self.target = target
+        self.attribute = attribute
+        self.duration = duration
+        self.elapsed = 0
+        self.active = True
+        self._start = start
+        self._end = end
+        self._easing = easing
+        self._on_done = on_done
+
+    # ========== Private Function's =========
+
+    def _value(self, t):
+        """
+        Retorna o valor do atributo na fração t da animação, já suavizada.
+        """
+        start, end = self._start, self._end
+        if isinstance(end, tuple):
+            return tuple(_lerp(a, b, t) for a, b in zip(start, end))
+
+        return _lerp(start, end, t)
+
+    def _advance(self, step):
+        """
+        Avança a animação em um passo de tempo e retorna True se ela terminou.
+        """
+        self.elapsed += step
+        if self.elapsed >= self.duration:
+            self._set(self._end)
+            return True
+
+        value = self._value(self._easing(self.elapsed / self.duration))
+        if value != getattr(self.target, self.attribute):
+            self._set(value)
+
+        return False
+
+    def _set(self, value):
+        """
+        Altera o atributo e marca a área do controle animado como alterada.
+        """
+        target = self.target
+        setattr(target, self.attribute, value)
+
+        invalidate = getattr(target, '_invalidate', None)
+        if invalidate is not None:
+            invalidate()
+
+    # ========== Public Function's ============
+
+    def cancel(self):
+        """Cancela a animação, mantendo o valor atual do atributo."""
+        self.active = False
+
+
+def _lerp(a, b, t):
+    """
+    Interpola entre a e b; entre dois inteiros o resultado é arredondado.
+    """
+    value = a + (b - a) * t
+    if isinstance(a, int) and isinstance(b, int):
+        return round(value)
+
+    return value
+
+
+class Scheduler:
+    """Agenda central de temporizadores e animações dos controles.
+
+    Os temporizadores ficam em uma fila de prioridade ordenada pelo vencimento, então cada
+    update só acorda os temporizadores vencidos, sem percorrer os demais. As animações avançam
+    em passos fixos de tempo (step), independentes da taxa de quadros: o tempo decorrido desde
+    o último update é acumulado e consumido em passos inteiros, até max_steps por update.
+
+    O formulário raiz chama update a cada draw; aplicações que desenham os controles sem um
+    formulário raiz devem chamar update uma vez por quadro.
+
+    Attributes:
+        step (float): A duração, em milissegundos, de cada passo das animações.
+        max_steps (int): O máximo de passos avançados em um update, para que um quadro lento
+            não seja seguido de uma sequência de passos atrasados.
+
+    Methods:
+        call_later(delay, func, args): Chama uma função depois de um tempo.
+        call_every(interval, func, args): Chama uma função repetidamente, a cada intervalo.
+        tween(target, attribute, end, duration, easing, start, on_done): Anima um atributo.
+        update(now): Chama os temporizadores vencidos e avança as animações.
+        clear(): Cancela todos os temporizadores e animações.
+    """
+
+    __slots__ = ('step', 'max_steps', '_timers', '_tweens', '_count', '_last', '_accumulator')
+
+    def __init__(self, step = 1000 / 60, max_steps = 5):
+        self.step = step
+        self.max_steps = max_steps
+
+        self._timers = []
+        # Animações em andamento, indexadas por (objeto, atributo): animar de novo um atributo substitui a anterior
+        self._tweens = {}
+        # Contador usado para desempatar temporizadores com o mesmo vencimento
+        self._count = 0
+        self._last = None
+        self._accumulator = 0
+
+    # ========== Private Function's =========
+
+    def _push(self, timer: Timer):
+        """
+        Coloca o temporizador na fila, ordenado pelo vencimento.
+        """
+        self._count += 1
+        heapq.heappush(self._timers, (timer.due, self._count, timer))
+        return timer
+
+    def _run_timers(self, now):
+        """
+        Chama os temporizadores vencidos até o instante informado.
+        """
+        timers = self._timers
+        while timers and timers[0][0] <= now:
+            timer = heapq.heappop(timers)[2]
+            if not timer.active:
+                continue
+
+            if timer.interval is None:
+                timer.active = False
+            else:
+                # Mantém a cadência, sem repetir as chamadas perdidas durante um quadro lento
+                timer.due += timer.interval
+                if timer.due <= now:
+                    timer.due = now + timer.interval
+                self._push(timer)
+
+            timer._func(*timer._args)
+
+    def _run_tweens(self, elapsed):
+        """
+        Avança as animações em passos fixos, consumindo o tempo acumulado.
+        """
+        if not self._tweens:
+            self._accumulator = 0
+            return
+
+        step = self.step
+        self._accumulator = min(self._accumulator + elapsed, step * self.max_steps)
+        while self._accumulator >= step and self._tweens:
+            self._accumulator -= step
+            for key, tween in list(self._tweens.items()):
+                if not tween.active:
+                    # Cancelada, ou substituída por outra animação do mesmo atributo
+                    if self._tweens.get(key) is tween:
+                        del self._tweens[key]
+                elif tween._advance(step):
+                    tween.active = False
+                    del self._tweens[key]
+                    if tween._on_done:
+                        tween._on_done[0](*tween._on_done[1])
+
+    # ========== Public Function's ============
+
+    def call_later(self, delay, func, args=()) -> Timer:
+        """Chama uma função uma única vez, depois de um tempo.
+
+        Args:
+            delay (float): O tempo, em milissegundos, até a chamada.
+            func: A função a ser chamada.
+            args (tuple, optional): Argumentos a serem passados para a função. Default é ().
+
+        Returns:
+            Timer: O temporizador, que pode ser cancelado.
+        """
+        return self._push(Timer(time.get_ticks() + delay, None, func, args))
+
+    def call_every(self, interval, func, args=()) -> Timer:
+        """Chama uma função repetidamente, a cada intervalo, até o temporizador ser cancelado.
+
+        Args:
+            interval (float): O intervalo, em milissegundos, entre as chamadas.
+            func: A função a ser chamada.
+            args (tuple, optional): Argumentos a serem passados para a função. Default é ().
+
+        Returns:
+            Timer: O temporizador, que pode ser cancelado.
+
+        Raises:
+            ValueError: Se o intervalo não é positivo.
+        """
+        if interval <= 0:
+            raise ValueError(f'o intervalo deve ser positivo: {interval!r}')
+
+        return self._push(Timer(time.get_ticks() + interval, interval, func, args))
+
+    def tween(self, target, attribute, end, duration, easing = ease_in_out_quad, start = None,
+              on_done = None, args = ()) -> Tween:
+        """Anima um atributo de um objeto até um valor final.
+
+        Args:
+            target: O objeto animado, como um controle.
+            attribute (str): O nome do atributo, como 'x', 'y', 'width' ou 'font_color'.
+            end: O valor final do atributo (número ou tupla de números).
+            duration (float): A duração da animação, em milissegundos.
+            easing (function | str, optional): A função de suavização, que recebe e retorna uma
+                fração entre 0 e 1, ou o seu nome em EASINGS. Default é ease_in_out_quad.
+            start (optional): O valor inicial. Default é o valor atual do atributo.
+            on_done (function, optional): Função chamada quando a animação termina.
+            args (tuple, optional): Argumentos a serem passados para on_done. Default é ().
+
+        Returns:
+            Tween: A animação, que pode ser cancelada.
+        """
+        if isinstance(easing, str):
+            easing = EASINGS[easing]
+        if start is None:
+            start = getattr(target, attribute)
+        else:
+            setattr(target, attribute, start)
+
+        tween = Tween(target, attribute, start, end, duration, easing, (on_done, args) if on_done else None)
+
+        previous = self._tweens.get((target, attribute))
+        if previous is not None:
+            previous.active = False
+        self._tweens[(target, attribute)] = tween
+
+        return tween
+
+    def update(self, now = None):
+        """Chama os temporizadores vencidos e avança as animações até o instante informado.
+
+        Chamar update mais de uma vez no mesmo instante não tem efeito.
+
+        Args:
+            now (float, optional): O instante atual, em milissegundos. Default é pygame.time.get_ticks().
+        """
+        if now is None:
+            now = time.get_ticks()
+
+        elapsed = 0 if self._last is None else now - self._last
+        self._last = now
+
+        if self._timers and self._timers[0][0] <= now:
+            self._run_timers(now)
+
+        self._run_tweens(elapsed)
+
+    def clear(self):
+        """Cancela todos os temporizadores e animações."""
+        for entry in self._timers:
+            entry[2].active = False
+        for tween in self._tweens.values():
+            tween.active = False
+
+        self._timers.clear()
+        self._tweens.clear()
+        self._accumulator = 0
+
+    def __len__(self):
+        return sum(1 for entry in self._timers if entry[2].active) + len(self._tweens)
+
+
+# Agenda usada pelos controles da biblioteca
+scheduler = Scheduler()
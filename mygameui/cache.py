@@ -0,0 +1,450 @@
+import hashlib
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+
+from pygame import Surface, SRCALPHA, image
+from pygame.font import Font
+
+# Cabeçalho dos arquivos do cache em disco: identificação, versão e máscaras do formato dos pixels
+_DISK_HEADER = struct.Struct('<8sI4I')
+_DISK_MAGIC = b'MGUISURF'
+_DISK_VERSION = 1
+# Registro de uma Surface: região de origem (x, y, largura, altura), tamanho gerado e bytes dos pixels
+_DISK_RECORD = struct.Struct('<6iI')
+
+
+class LRUCache:
+    """Cache com política de remoção LRU (menos usado recentemente).
+
+    Attributes:
+        maxsize (int): Número máximo de entradas mantidas no cache.
+        max_bytes (int): Limite de memória, em bytes, das entradas do cache (None para ilimitado).
+        nbytes (int): Memória, em bytes, ocupada atualmente pelas entradas do cache.
+        hits (int): Quantidade de consultas atendidas pelo cache.
+        misses (int): Quantidade de consultas que não estavam no cache.
+        evictions (int): Quantidade de entradas removidas por falta de espaço.
+
+    Methods:
+        get(key): Retorna o valor associado à chave ou None.
+        put(key, value, nbytes=0): Armazena um valor no cache.
+        clear(): Remove todas as entradas do cache.
+        stats(): Retorna um dicionário com os contadores do cache.
+    """
+
+    def __init__(self, maxsize=512, max_bytes=None):
+        self._data = OrderedDict()
+        self._maxsize = maxsize
+        self._max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ========= Property's =============
+
+    @property
+    def maxsize(self):
+        """
+        int: Número máximo de entradas mantidas no cache.
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        self._maxsize = value
+        self._evict()
+
+    @property
+    def max_bytes(self):
+        """
+        int: Limite de memória, em bytes, das entradas do cache (None para ilimitado).
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        self._max_bytes = value
+        self._evict()
+
+    # ========== Private Function's =========
+
+    def _evict(self):
+        """
+        Remove as entradas menos usadas até que o cache respeite o seu limite.
+        """
+        while len(self._data) > self._maxsize or \
+                (self._max_bytes is not None and self.nbytes > self._max_bytes and self._data):
+            _, (_, nbytes) = self._data.popitem(last=False)
+            self.nbytes -= nbytes
+            self.evictions += 1
+
+    # ========== Public Function's ============
+
+    def get(self, key):
+        """Retorna o valor associado à chave, marcando-o como usado recentemente.
+
+        Args:
+            key: A chave a ser consultada.
+
+        Returns:
+            O valor armazenado ou None caso a chave não esteja no cache.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, nbytes=0):
+        """Armazena um valor no cache, removendo entradas antigas se necessário.
+
+        Args:
+            key: A chave do valor.
+            value: O valor a ser armazenado.
+            nbytes (int, optional): Memória ocupada pelo valor, usada no limite max_bytes. Default é 0.
+        """
+        old = self._data.pop(key, None)
+        if old is not None:
+            self.nbytes -= old[1]
+
+        self._data[key] = (value, nbytes)
+        self.nbytes += nbytes
+        self._evict()
+
+    def clear(self):
+        """
+        Remove todas as entradas do cache e zera os contadores.
+        """
+        self._data.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        """Retorna os contadores do cache.
+
+        Returns:
+            dict: Dicionário com as chaves 'size', 'maxsize', 'nbytes', 'max_bytes',
+            'hits', 'misses' e 'evictions'.
+        """
+        return {
+            'size': len(self._data),
+            'maxsize': self._maxsize,
+            'nbytes': self.nbytes,
+            'max_bytes': self._max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+class _SurfacePack:
+    """
+    Arquivo do cache em disco com as Surfaces geradas a partir de uma mesma imagem de origem.
+    """
+
+    __slots__ = ('path', 'index', 'pending', 'data', 'file')
+
+    def __init__(self, path):
+        self.path = path
+        # Posição e tamanho dos pixels de cada registro no arquivo mapeado
+        self.index: dict[tuple, tuple] = {}
+        # Registros gravados depois que o arquivo foi mapeado
+        self.pending: set[tuple] = set()
+        self.data: mmap.mmap = None
+        self.file = None
+
+
+class DiskSurfaceCache:
+    """Cache em disco das Surfaces geradas por ui_utils.generate_surface_byrect.
+
+    As Surfaces de nove regiões dependem apenas da imagem do tema e do tamanho gerado. Este cache
+    guarda os pixels dessas Surfaces em disco, um arquivo por imagem de origem, nomeado com o hash
+    do conteúdo da imagem: trocar o arquivo do tema muda o hash, e o cache antigo deixa de ser
+    usado automaticamente. Os arquivos são mapeados em memória, e apenas os registros usados são
+    lidos do disco.
+
+    Os pixels são gravados no formato usado pela tela, e arquivos gravados com outro formato são
+    descartados. Registros incompletos no fim do arquivo (por exemplo, de um processo interrompido)
+    descartam o arquivo.
+
+    Attributes:
+        directory (str): A pasta onde os arquivos do cache são gravados.
+        hits (int): Quantidade de Surfaces carregadas do disco.
+        misses (int): Quantidade de Surfaces que não estavam no disco.
+        stores (int): Quantidade de Surfaces gravadas no disco.
+
+    Methods:
+        load(source, width, height): Carrega uma Surface gerada a partir da região informada.
+        store(source, width, height, surface): Grava uma Surface gerada.
+        close(): Fecha os arquivos abertos.
+        clear(): Apaga os arquivos do cache.
+        stats(): Retorna um dicionário com os contadores do cache.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+        self._packs: dict[str, _SurfacePack] = {}
+        self._hashes = WeakKeyDictionary()
+        self._masks = None
+
+    # ========== Private Function's =========
+
+    def _native_masks(self):
+        """
+        Retorna as máscaras do formato de pixels das Surfaces geradas (convert_alpha).
+        """
+        if self._masks is None:
+            self._masks = Surface((1, 1)).convert_alpha().get_masks()
+
+        return self._masks
+
+    def _content_hash(self, surface: Surface):
+        """
+        Retorna o hash do conteúdo de uma imagem de origem, calculado uma vez por Surface.
+        """
+        digest = self._hashes.get(surface)
+        if digest is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            hasher.update(struct.pack('<2i', *surface.get_size()))
+            hasher.update(image.tobytes(surface, 'RGBA'))
+            digest = self._hashes[surface] = hasher.hexdigest()
+
+        return digest
+
+    def _pack(self, source: Surface):
+        """
+        Retorna o arquivo do cache da imagem de origem da região, abrindo-o no primeiro uso.
+        """
+        digest = self._content_hash(source.get_abs_parent())
+        pack = self._packs.get(digest)
+        if pack is None:
+            pack = self._packs[digest] = _SurfacePack(os.path.join(self.directory, digest + '.surfaces'))
+            self._read(pack)
+
+        return pack
+
+    def _read(self, pack: _SurfacePack):
+        """
+        Mapeia o arquivo em memória e monta o índice dos seus registros.
+        """
+        if pack.data is not None:
+            pack.data.close()
+            pack.data = None
+        pack.index.clear()
+        pack.pending.clear()
+
+        try:
+            with open(pack.path, 'rb') as file:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return # Arquivo inexistente ou vazio
+
+        valid = len(data) >= _DISK_HEADER.size
+        if valid:
+            magic, version, *masks = _DISK_HEADER.unpack_from(data, 0)
+            valid = magic == _DISK_MAGIC and version == _DISK_VERSION and tuple(masks) == self._native_masks()
+
+        offset = _DISK_HEADER.size
+        while valid and offset < len(data):
+            if offset + _DISK_RECORD.size > len(data):
+                valid = False
+                break
+
+            *key, nbytes = _DISK_RECORD.unpack_from(data, offset)
+            start = offset + _DISK_RECORD.size
+            if start + nbytes > len(data):
+                valid = False
+                break
+
+            pack.index[tuple(key)] = (start, nbytes)
+            offset = start + nbytes
+
+        if valid:
+            pack.data = data
+            return
+
+        # Arquivo de outro formato ou incompleto: é descartado e gravado de novo
+        data.close()
+        pack.index.clear()
+        if pack.file is not None:
+            pack.file.close()
+            pack.file = None
+        try:
+            os.remove(pack.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _key(source: Surface, width, height):
+        """
+        Retorna a chave de um registro: a região de origem na imagem e o tamanho gerado.
+        """
+        return (*source.get_abs_offset(), *source.get_size(), width, height)
+
+    # ========== Public Function's ============
+
+    def load(self, source: Surface, width, height):
+        """Carrega do disco a Surface gerada a partir de uma região com o tamanho informado.
+
+        Args:
+            source (Surface): A região de origem (subsurface da imagem do tema).
+            width (int): A largura da Surface gerada.
+            height (int): A altura da Surface gerada.
+
+        Returns:
+            Surface: A Surface carregada ou None se ela não está no cache.
+        """
+        pack = self._pack(source)
+        key = self._key(source, width, height)
+        if key in pack.pending:
+            self._read(pack) # Mapeia de novo o arquivo, que cresceu desde que foi aberto
+
+        entry = pack.index.get(key)
+        if entry is None or entry[1] != width * height * 4:
+            self.misses += 1
+            return None
+
+        start, nbytes = entry
+        surface = Surface((width, height), SRCALPHA, 32, self._native_masks())
+        surface.get_buffer().write(pack.data[start:start + nbytes], 0)
+
+        self.hits += 1
+        return surface
+
+    def store(self, source: Surface, width, height, surface: Surface):
+        """Grava no disco uma Surface gerada a partir de uma região.
+
+        Args:
+            source (Surface): A região de origem (subsurface da imagem do tema).
+            width (int): A largura da Surface gerada.
+            height (int): A altura da Surface gerada.
+            surface (Surface): A Surface gerada.
+        """
+        masks = self._native_masks()
+        if surface.get_masks() != masks or surface.get_bytesize() != 4 or surface.get_pitch() != width * 4:
+            return # Formato diferente do usado pelo cache
+
+        pack = self._pack(source)
+        key = self._key(source, width, height)
+        if key in pack.index or key in pack.pending:
+            return
+
+        try:
+            if pack.file is None:
+                os.makedirs(self.directory, exist_ok=True)
+                pack.file = open(pack.path, 'ab')
+                if pack.file.tell() == 0:
+                    pack.file.write(_DISK_HEADER.pack(_DISK_MAGIC, _DISK_VERSION, *masks))
+
+            pixels = surface.get_buffer().raw
+            pack.file.write(_DISK_RECORD.pack(*key, len(pixels)) + pixels)
+            pack.file.flush()
+        except OSError:
+            return # O cache em disco é opcional: falhas de gravação são ignoradas
+
+        pack.pending.add(key)
+        self.stores += 1
+
+    def close(self):
+        """
+        Fecha os arquivos abertos. O cache continua utilizável e reabre os arquivos quando necessário.
+        """
+        for pack in self._packs.values():
+            if pack.file is not None:
+                pack.file.close()
+            if pack.data is not None:
+                pack.data.close()
+
+        self._packs.clear()
+
+    def clear(self):
+        """
+        Apaga todos os arquivos do cache.
+        """
+        self.close()
+
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith('.surfaces'):
+                    os.remove(os.path.join(self.directory, name))
+
+    def stats(self):
+        """Retorna os contadores do cache.
+
+        Returns:
+            dict: Dicionário com as chaves 'hits', 'misses' e 'stores'.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'stores': self.stores}
+
+
+# Cache compartilhado pelos controles para as superfícies de texto
+text_cache = LRUCache(512)
+
+# Cache compartilhado das superfícies geradas por ui_utils.generate_surface_byrect
+slice_cache = LRUCache(4096, max_bytes=16 * 1024 * 1024)
+
+# Cache em disco opcional das superfícies geradas, ativado com set_disk_cache
+disk_cache: DiskSurfaceCache = None
+
+
+def set_disk_cache(directory):
+    """Ativa ou desativa o cache em disco das Surfaces de nove regiões.
+
+    Com o cache ativo, as molduras e os fundos gerados para os controles são gravados na pasta
+    informada e, nas próximas execuções, carregados do disco em vez de gerados novamente.
+
+    Args:
+        directory (str): A pasta do cache, criada se necessário. None desativa o cache.
+
+    Returns:
+        DiskSurfaceCache: O cache ativado ou None.
+    """
+    global disk_cache
+    if disk_cache is not None:
+        disk_cache.close()
+
+    disk_cache = DiskSurfaceCache(directory) if directory is not None else None
+    return disk_cache
+
+
+def render_text(font: Font, text: str, antialias: bool, color, background=None) -> Surface:
+    """Renderiza um texto usando o cache compartilhado de superfícies de texto.
+
+    A Surface retornada é compartilhada entre todos que renderizam o mesmo texto,
+    portanto ela deve ser usada apenas para leitura (por exemplo, em blits).
+
+    Args:
+        font (Font): A fonte usada para renderizar o texto.
+        text (str): O texto a ser renderizado.
+        antialias (bool): Indica se o texto deve ser suavizado.
+        color: A cor do texto.
+        background: A cor de fundo do texto (opcional).
+
+    Returns:
+        Surface: A superfície contendo o texto renderizado.
+    """
+    key = (font, text, antialias, tuple(color), tuple(background) if background is not None else None)
+    render = text_cache.get(key)
+    if render is None:
+        render = font.render(text, antialias, color, background)
+        text_cache.put(key, render)
+
+    return render
@@ -3,4 +3,9 @@ from .button import Button
 from .form import Form
 from .textbox import Textbox
 from .label import Label
-from .checkbox import CheckBox
\ No newline at end of file
+from .checkbox import CheckBox
+from .textarea import TextArea
+from .scrollview import ScrollView
+from .listbox import ListBox
+from .statsoverlay import StatsOverlay
+from .layout import Panel, StackPanel, GridPanel, AnchorPanel, update_layout
\ No newline at end of file
@@ -2,7 +2,7 @@ from pygame import Surface, draw as pg_draw
 
 from .control import Control
 import mygameui.globals as ui_globals
-import mygameui.utils as ui_utils
+import mygameui.cache as ui_cache
 
 class Button(Control):
     """A classe Button representa um botão clicável em uma interface de usuário.
@@ -16,55 +16,73 @@ class Button(Control):
 
     Methods:
         set_surface_theme(theme: Surface): Define a aparência do botão com base em um tema Surface.
-        draw(screen: Surface): Desenha o botão na tela especificada.
+        draw(screen: Surface, offset): Desenha o botão na tela especificada.
     """
 
+    __slots__ = ('_text', 'font', 'text_color', 'normal_img', 'hover_img', 'click_img')
+
     def __init__(self, x, y, width, height, text=''):
         super().__init__(x, y, width, height)
 
-        self.text = text
+        self._text = text
         self.font = ui_globals.font
         self.text_color = (255, 255, 255)
 
         self.set_surface_theme(ui_globals.theme)
 
+    # ========== Property's ============
+
+    @property
+    def text(self):
+        """
+        str: O texto exibido no botão.
+        """
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        if self._text != value:
+            self._text = value
+            self._invalidate()
+
     # ========== Set Function's ============
 
     def set_surface_theme(self, theme: Surface):
         """Define a aparência do botão com base em um tema Surface.
 
         Args:
-            theme (Surface): O tema Surface que contém os elementos de estilo do botão.
+            theme (Theme | Surface): O tema que contém os elementos de estilo do botão.
 
         """
+        theme = self._use_theme(theme)
+
         # Criar imagens para diferentes estados do botão (normal, hover, clique)
-        self.normal_img = ui_utils.generate_surface_byrect(theme.subsurface(48, 16, 16, 16), 
-                                                        self.width, self.height)
-        self.hover_img = ui_utils.generate_surface_byrect(theme.subsurface(64, 16, 16, 16), 
-                                                        self.width, self.height)
-        self.click_img = ui_utils.generate_surface_byrect(theme.subsurface(80, 16, 16, 16), 
-                                                        self.width, self.height)
+        self.normal_img = theme.nine_slice('button', self.width, self.height)
+        self.hover_img = theme.nine_slice('button_hover', self.width, self.height)
+        self.click_img = theme.nine_slice('button_click', self.width, self.height)
+        self._invalidate()
 
     # ========= Public Function's
 
-    def draw(self, screen: Surface):
+    def draw(self, screen: Surface, offset=(0, 0)):
         if not self._visible:
             return # Não exibir controle caso não esteja visível
 
+        rect = self._render_rect.move(offset)
         if self._is_hovered:
             if self._is_clicked:
-                screen.blit(self.click_img, self._render_rect)
+                screen.blit(self.click_img, rect)
             else:
-                screen.blit(self.hover_img, self._render_rect)
+                screen.blit(self.hover_img, rect)
         else:
-            screen.blit(self.normal_img, self._render_rect)
+            screen.blit(self.normal_img, rect)
 
         # Desenhar o texto
-        if len(self.text) > 0:
-            render = self.font.render(self.text, True, self.text_color)
-            text_x = self._render_rect.center[0] - render.get_rect().center[0]
+        if len(self._text) > 0:
+            render = ui_cache.render_text(self.font, self._text, True, self.text_color)
+            text_x = rect.center[0] - render.get_rect().center[0]
             if self._is_clicked:
-                text_y = self._render_rect.center[1] - render.get_rect().center[1] + 1
+                text_y = rect.center[1] - render.get_rect().center[1] + 1
             else:
-                text_y = self._render_rect.center[1] - render.get_rect().center[1]
+                text_y = rect.center[1] - render.get_rect().center[1]
             screen.blit(render, (text_x, text_y))
\ No newline at end of file
@@ -1,15 +1,19 @@
-from pygame import Surface
+from pygame import Surface, Rect
 
 from .control import Control
 import mygameui.globals as ui_globals
+import mygameui.cache as ui_cache
 
 class CheckBox(Control):
+    __slots__ = ('_text', 'font', 'font_color', '_on_changed_value', '__value', '__normal_render', '__hover_render',
+                 '__checked_render')
+
     def __init__(self, x, y, value = False, text = ''):
         super().__init__(x, y, 16, 16)
 
         self.__value : bool = value
 
-        self.text = text
+        self._text = text
         self.font = ui_globals.font
         self.font_color = (255,255,255)
 
@@ -19,6 +23,18 @@ class CheckBox(Control):
 
     ## ========== Property's ==================
 
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        if self._text != value:
+            self._invalidate()
+            self._text = value
+            self._invalidate()
+            self._invalidate_layout()
+
     @property
     def value(self):
         return self.__value
@@ -27,18 +43,39 @@ class CheckBox(Control):
     def value(self, value):
         if self.__value != value:
             self.__value = value
+            self._invalidate()
             self._call_changed_value()
 
     ## ========== Set Function's ==============
 
     def set_surface_theme(self, theme: Surface):
-        self.__normal_render = theme.subsurface(48, 32, 16, 16)
-        self.__hover_render = theme.subsurface(64, 32, 16, 16)
-        self.__checked_render = theme.subsurface(80, 32, 16, 16)
+        theme = self._use_theme(theme)
+
+        self.__normal_render = theme.region('checkbox')
+        self.__hover_render = theme.region('checkbox_hover')
+        self.__checked_render = theme.region('checkbox_checked')
+        self._invalidate()
 
     def set_on_changed_value(self, func, args=()):
         self._on_changed_value = (func, args)
 
+    ## ========== Private Function's ==========
+
+    def _bounds(self):
+        if len(self._text) == 0:
+            return self._render_rect
+
+        width, height = self.font.size(self._text)
+        text_rect = Rect(self._render_rect.x + 18, self._render_rect.centery - height // 2 + 1, width, height)
+        return self._render_rect.union(text_rect)
+
+    def _desired_size(self):
+        if len(self._text) == 0:
+            return self._rect.size
+
+        width, height = self.font.size(self._text)
+        return (max(self.width, 18 + width), max(self.height, height))
+
     ## ========== Call Function's =============
 
     def _call_changed_value(self):
@@ -51,15 +88,19 @@ class CheckBox(Control):
         super()._call_on_mouse_down()
     ## ========== Public Function's ===========
 
-    def draw(self, screen: Surface):
+    def draw(self, screen: Surface, offset=(0, 0)):
+        if not self._visible:
+            return # Não exibir controle caso não esteja visível
+
+        rect = self._render_rect.move(offset)
         if self._is_hovered:
-            screen.blit(self.__hover_render, self._render_rect)
+            screen.blit(self.__hover_render, rect)
         else:
-            screen.blit(self.__normal_render, self._render_rect)
+            screen.blit(self.__normal_render, rect)
 
         if self.value:
-            screen.blit(self.__checked_render, self._render_rect)
+            screen.blit(self.__checked_render, rect)
 
-        if len(self.text) > 0:
-            render = self.font.render(self.text, True, self.font_color)
-            screen.blit(render, (self._render_rect.x + 18, self._render_rect.centery - render.get_rect().centery + 1))
\ No newline at end of file
+        if len(self._text) > 0:
+            render = ui_cache.render_text(self.font, self._text, True, self.font_color)
+            screen.blit(render, (rect.x + 18, rect.centery - render.get_rect().centery + 1))
\ No newline at end of file
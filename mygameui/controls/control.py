@@ -1,8 +1,27 @@
-from pygame import Rect, mouse
+from pygame import Rect
 from pygame import constants
 from pygame.surface import Surface
 from pygame.event import Event
 
+from mygameui.spatial import SpatialIndex
+import mygameui.utils as ui_utils
+import mygameui.theme as ui_theme
+import mygameui.animation as ui_animation
+
+# Lista de filhos compartilhada pelos controles sem filhos; substituída por um dicionário no primeiro add_control
+_NO_CONTROLS = ()
+
+# Eventos do mouse, encaminhados apenas ao controle filho sob o cursor
+MOUSE_EVENTS = (constants.MOUSEMOTION, constants.MOUSEBUTTONDOWN, constants.MOUSEBUTTONUP, constants.MOUSEWHEEL)
+
+# Último carimbo atribuído a um retângulo de renderização recalculado. Cada controle guarda o
+# carimbo do seu retângulo e o do retângulo do pai com que foi calculado, de modo que mover um
+# controle só desatualiza os retângulos da sua própria subárvore.
+_render_stamp = 0
+# Quantidade de mudanças de posição em toda a interface. Enquanto não muda, os retângulos em
+# cache são usados sem conferir os carimbos dos ancestrais.
+_transform_generation = 0
+
 class Control:
     """A classe base para todos os controles na interface do usuário.
 
@@ -20,28 +39,68 @@ class Control:
         set_active(value: bool): Define se o controle está ativo ou não.
         set_on_mouse_up(func, args=()): Define a função a ser chamada quando o mouse é liberado sobre o controle.
         set_on_mouse_down(func, args=()): Define a função a ser chamada quando o mouse é pressionado sobre o controle.
+        set_on_mouse_enter(func, args=()): Define a função a ser chamada quando o mouse entra no controle.
+        set_on_mouse_leave(func, args=()): Define a função a ser chamada quando o mouse sai do controle.
         set_surface_theme(theme: Surface): Define a aparência do controle com base em um tema.
         add_control(control): Adiciona um controle a este controle.
+        add_controls(controls): Adiciona vários controles de uma só vez.
         move_ip(pos_relative): Move o controle relativamente à sua posição atual.
+        resize(width, height): Muda a largura e a altura do controle de uma só vez.
+        animate(attribute, end, duration, easing, on_done, args): Anima um atributo do controle.
         reset(): Reseta o estado do controle.
-        draw(screen: Surface): Desenha o controle na tela especificada.
-        update(events: list[Event]): Atualiza o estado do controle com base nos eventos fornecidos.
+        draw(screen: Surface, offset): Desenha o controle na tela especificada.
+        update(event: Event, pos): Atualiza o estado do controle com base nos eventos fornecidos.
+        update_many(events: list[Event]): Atualiza o controle com todos os eventos de um quadro.
 
+    Os controles da biblioteca usam __slots__ para ocupar menos memória em interfaces com
+    milhares de controles. Subclasses que não declaram __slots__ continuam aceitando
+    atributos dinâmicos normalmente.
     """
 
+    __slots__ = ('_rect', '__render_rect', '__transform_version', '__render_version', '__render_stamp',
+                 '__origin_stamp', '__checked_generation', '__render', '_is_hovered', '_is_clicked', '_visible',
+                 '_parent', '_active', '_controls', '_focused', '_hovered', '_theme', '_index', '_layer_dirty',
+                 '_dirty_rects', '_on_mouse_up', '_on_mouse_down', '_on_mouse_enter', '_on_mouse_leave',
+                 '_on_actived', '__weakref__')
+
     def __init__(self, x, y, width, height):
         self._rect = Rect(x, y, width, height)
-        self._render_rect = self._rect
+        # Retângulo de renderização em cache. __transform_version muda quando este controle se move;
+        # o retângulo é válido enquanto foi calculado nessa versão e com o carimbo atual do pai.
+        self.__render_rect = self._rect
+        self.__transform_version = 0
+        self.__render_version = -1
+        self.__render_stamp = 0
+        self.__origin_stamp = -1
+        self.__checked_generation = -1
         self._is_hovered = False
         self._is_clicked = False
         self._visible = True
         self._parent: Control = None
         self._active = False
-        self._controls: list[Control] = []
+        # Controles filhos em ordem de desenho (do fundo para a frente); o dicionário permite
+        # trazer um controle para frente sem percorrer a lista
+        self._controls: dict[Control, None] = _NO_CONTROLS
+        # Controle filho ativo, se houver: a cadeia de _focused a partir da raiz é o caminho ativo
+        self._focused: Control = None
+        # Controle filho sob o cursor, se houver, para enviar a saída do mouse apenas a ele
+        self._hovered: Control = None
+        # Tema usado pelo controle, trocado junto com o tema global
+        self._theme: ui_theme.Theme = None
+        # Índice espacial dos controles filhos, criado ao adicionar o primeiro filho
+        self._index: SpatialIndex = None
+        # Indica se a camada composta do controle (quando houver) precisa ser redesenhada
+        self._layer_dirty = True
+        # Lista de áreas alteradas desde o último desenho (None se o modo de retângulos sujos estiver desligado)
+        self._dirty_rects: list[Rect] = None
+        # Imagem desenhada pelo controle base, definida com set_surface_theme
+        self.__render: Surface = None
 
         # Função a ser chamada quando o mouse é liberado sobre o controle
         self._on_mouse_up = None
         self._on_mouse_down = None
+        self._on_mouse_enter = None
+        self._on_mouse_leave = None
         self._on_actived = None
 
     # ========= Property's =============
@@ -59,7 +118,7 @@ class Control:
     @parent.setter
     def parent(self, control):
         self._parent = control
-        self._update_render_rect()
+        self._transform_changed()
             
     @property
     def rect(self):
@@ -71,6 +130,26 @@ class Control:
         """
         return self._rect
     
+    @property
+    def _render_rect(self):
+        """
+        Rect: O retângulo do controle em coordenadas absolutas da tela, recalculado apenas
+        quando a posição do controle ou de algum ancestral mudou desde o último acesso.
+        """
+        if self.__checked_generation != _transform_generation:
+            parent = self._parent
+            if parent is None:
+                origin = 0
+            else:
+                parent._render_rect # Valida antes o retângulo do pai e, com ele, o seu carimbo
+                origin = parent.__render_stamp
+
+            if self.__render_version != self.__transform_version or self.__origin_stamp != origin:
+                self._update_render_rect()
+            self.__checked_generation = _transform_generation
+
+        return self.__render_rect
+
     @property
     def x(self):
         """
@@ -80,8 +159,11 @@ class Control:
     
     @x.setter
     def x(self, value):
+        self._invalidate(content=False)
         self._rect.x = value
-        self._update_render_rect()
+        self._transform_changed()
+        self._reindex()
+        self._invalidate(content=False)
     
     @property
     def y(self):
@@ -92,8 +174,11 @@ class Control:
     
     @y.setter
     def y(self, value):
+        self._invalidate(content=False)
         self._rect.y = value
-        self._update_render_rect()
+        self._transform_changed()
+        self._reindex()
+        self._invalidate(content=False)
     
     @property
     def position(self):
@@ -111,8 +196,7 @@ class Control:
     
     @width.setter
     def width(self, value):
-        self._rect.width = value
-        self._update_render_rect()
+        self.resize(value, self._rect.height)
 
     @property
     def height(self):
@@ -123,8 +207,7 @@ class Control:
     
     @height.setter
     def height(self, value):
-        self._rect.height = value
-        self._update_render_rect()
+        self.resize(self._rect.width, value)
 
     @property
     def size(self):
@@ -150,7 +233,8 @@ class Control:
         """
         if self._visible != value:
             self._visible = value
-            # Adicionar funcionalidade caso altere a visibilidade
+            self._invalidate()
+            self._invalidate_layout()
 
     # ========== Set Function's ===========
 
@@ -160,24 +244,37 @@ class Control:
         Quando um controle é ativado, ele é trazido para frente em relação aos outros controles 
         no mesmo nível hierárquico e qualquer controle ativo anteriormente é desativado.
 
+        Cada controle guarda qual dos seus filhos está ativo, então apenas a cadeia ativa
+        anteriormente é desativada, sem percorrer os demais controles.
+
         Args:
             value (bool): True para ativar o controle, False para desativá-lo.
         """
+        parent = self._parent
+
         if value:
-            if self.parent:
-                self.parent.set_active(True)
+            if parent:
+                parent.set_active(True)
 
-                for control in self.parent._controls:
-                    control.set_active(False)
-                    
-                # Bring to the front
-                self.parent._controls.remove(self)
-                self.parent._controls.append(self)
+                previous = parent._focused
+                if previous is not None and previous is not self:
+                    previous.set_active(False)
+                parent._focused = self
+
+                # Traz para frente
+                controls = parent._controls
+                del controls[self]
+                controls[self] = None
+                if parent._index:
+                    parent._index.bring_to_front(self)
 
             self._call_actived()
         else:
-            for control in self._controls:
-                control.set_active(False)
+            if self._focused is not None:
+                self._focused.set_active(False)
+
+            if parent and parent._focused is self:
+                parent._focused = None
 
         self._active = value
     
@@ -201,6 +298,26 @@ class Control:
         """
         self._on_mouse_down = (func, args)
 
+    def set_on_mouse_enter(self, func, args=()):
+        """Define a função a ser chamada quando o mouse entra no controle.
+
+        Args:
+            func: A função a ser chamada quando o mouse entra no controle.
+            args (tuple, optional): Argumentos adicionais a serem passados para a função. Default é ().
+
+        """
+        self._on_mouse_enter = (func, args)
+
+    def set_on_mouse_leave(self, func, args=()):
+        """Define a função a ser chamada quando o mouse sai do controle.
+
+        Args:
+            func: A função a ser chamada quando o mouse sai do controle.
+            args (tuple, optional): Argumentos adicionais a serem passados para a função. Default é ().
+
+        """
+        self._on_mouse_leave = (func, args)
+
     def set_surface_theme(self, theme: Surface):
         """Define a aparência do controle com base em um tema.
 
@@ -237,22 +354,252 @@ class Control:
         if self._on_mouse_up:
             self._on_mouse_up[0](*self._on_mouse_up[1])
 
+    def _call_on_mouse_enter(self):
+        """
+        Chama a função definida para ser executada quando o mouse entra no controle.
+        """
+        if self._on_mouse_enter:
+            self._on_mouse_enter[0](*self._on_mouse_enter[1])
+
+    def _call_on_mouse_leave(self):
+        """
+        Chama a função definida para ser executada quando o mouse sai do controle.
+        """
+        if self._on_mouse_leave:
+            self._on_mouse_leave[0](*self._on_mouse_leave[1])
+
     # ========== Private Function's =========
 
+    def _update_hover(self, pos):
+        """
+        Atualiza o estado de hover do controle, chamando as funções de entrada e saída do mouse.
+
+        Args:
+            pos (tuple): Posição do cursor.
+        """
+        if self._render_rect.collidepoint(pos):
+            if not self._is_hovered:
+                self._is_hovered = True
+                self._hover_changed()
+                self._call_on_mouse_enter()
+        else:
+            self._leave()
+
+    def _leave(self):
+        """
+        Trata a saída do mouse do controle e do controle filho que estava sob o cursor.
+        """
+        hovered = self._hovered
+        if hovered is not None:
+            self._hovered = None
+            hovered._leave()
+
+        if self._is_hovered:
+            self._is_hovered = False
+            self._is_clicked = False
+            self._hover_changed()
+            self._call_on_mouse_leave()
+
+    def _hover_changed(self):
+        """
+        Chamada quando o mouse entra ou sai do controle. Por padrão o controle é redesenhado.
+        """
+        self._invalidate()
+
+    def _root(self):
+        """
+        Retorna o controle raiz da árvore à qual este controle pertence.
+        """
+        root = self
+        while root._parent:
+            root = root._parent
+
+        return root
+
+    def _bounds(self):
+        """
+        Retorna a área da tela, em coordenadas absolutas, em que o controle desenha.
+        """
+        return self._render_rect
+
+    def _invalidate(self, rect: Rect = None, content = True):
+        """
+        Marca uma área do controle como alterada.
+
+        As camadas compostas dos controles ancestrais são marcadas para serem redesenhadas e
+        a área é registrada no controle raiz, que a redesenha no próximo draw quando o modo
+        de retângulos sujos está ligado.
+
+        Args:
+            rect (Rect, optional): A área alterada, em coordenadas absolutas. Default é a área do controle.
+            content (bool, optional): False quando apenas a posição do controle mudou, o que
+                preserva a camada composta do próprio controle. Default é True.
+        """
+        if content:
+            self._layer_dirty = True
+
+        root = self
+        while root._parent:
+            root = root._parent
+            root._layer_dirty = True
+
+        if root._dirty_rects is not None:
+            root._dirty_rects.append(Rect(rect if rect else self._bounds()))
+
+    def _resized(self):
+        """
+        Atualiza a aparência do controle depois que o seu tamanho mudou.
+
+        Controles com tema geram de novo as Surfaces do novo tamanho; controles que guardam
+        outros dados dependentes do tamanho sobrescrevem esta função.
+        """
+        if self._theme is not None:
+            self.set_surface_theme(self._theme)
+
+    def _invalidate_layout(self):
+        """
+        Avisa o controle pai de que o tamanho desejado deste controle mudou.
+
+        Apenas os painéis de layout reagem, marcando a sua disposição como desatualizada; nos
+        demais controles as posições são absolutas.
+        """
+        if self._parent is not None:
+            self._parent._child_layout_changed(self)
+
+    def _child_layout_changed(self, control):
+        """
+        Chamada quando o tamanho desejado de um controle filho muda. Por padrão não faz nada.
+        """
+        pass
+
+    def _desired_size(self):
+        """
+        Retorna o tamanho que o controle deseja ocupar ao ser disposto por um painel de layout.
+        """
+        return self._bounds().size
+
+    def _use_theme(self, theme):
+        """
+        Registra o tema usado pelo controle, para que ele acompanhe as trocas do tema global.
+
+        Args:
+            theme (Theme | Surface): O tema ou a imagem do tema.
+
+        Returns:
+            Theme: O tema, já convertido em Theme.
+        """
+        theme = ui_theme.Theme.of(theme)
+        self._theme = theme
+        ui_theme.live_controls.add(self)
+        return theme
+
+    def _reindex(self):
+        """
+        Atualiza a posição do controle no índice espacial do controle pai.
+        """
+        if self._parent and self._parent._index:
+            self._parent._index.update(self)
+
+    def _child_origin(self):
+        """
+        Retorna a posição na tela, em coordenadas absolutas, da origem dos controles filhos.
+
+        Controles que rolam o seu conteúdo sobrescrevem esta função para descontar a rolagem.
+        """
+        return self._render_rect.topleft
+
+    def _transform_changed(self):
+        """
+        Invalida o retângulo de renderização em cache deste controle depois que a sua posição,
+        o seu tamanho ou a origem dos seus filhos mudou. Os controles descendentes percebem a
+        mudança pelo carimbo do pai e são atualizados no próximo acesso; as demais subárvores
+        não são afetadas.
+        """
+        global _transform_generation
+        _transform_generation += 1
+        self.__transform_version += 1
+
     def _update_render_rect(self):
         """
         Atualiza o retângulo de renderização do controle.
 
         Esta função atualiza o retângulo de renderização do controle com base na posição e
-        tamanho do retângulo do controle e do retângulo do pai, se houver. Se o controle
+        tamanho do retângulo do controle e da origem dos filhos do pai, se houver. Se o controle
         não tiver pai, o retângulo de renderização é definido como o próprio retângulo do controle.
+
+        É chamada ao acessar _render_rect depois de alguma posição mudar, e não deve ser chamada
+        diretamente; use _transform_changed.
         """
-        if self._parent:
-            self._render_rect = Rect(self._rect.x + self.parent.rect.x,
-                                     self._rect.y + self.parent.rect.y,
-                                     self._rect.width, self._rect.height)
+        global _render_stamp
+
+        parent = self._parent
+        changed = self.__render_version != self.__transform_version
+        self.__render_version = self.__transform_version
+
+        if parent:
+            ox, oy = parent._child_origin()
+            self.__origin_stamp = parent.__render_stamp
+            rect = self._rect
+            cached = self.__render_rect
+            # Mantém o mesmo Rect quando a posição absoluta não mudou
+            if cached is rect or cached.x != rect.x + ox or cached.y != rect.y + oy or cached.size != rect.size:
+                self.__render_rect = Rect(rect.x + ox, rect.y + oy, rect.width, rect.height)
+                changed = True
         else:
-            self._render_rect = self._rect
+            self.__origin_stamp = 0
+            self.__render_rect = self._rect
+
+        # Um novo carimbo avisa os filhos de que a sua origem pode ter mudado
+        if changed:
+            _render_stamp += 1
+            self.__render_stamp = _render_stamp
+
+    def _hit_child(self, pos):
+        """
+        Retorna o controle filho visível mais à frente sob a posição informada, ou None.
+        """
+        if not self._index:
+            return None
+
+        origin = self._child_origin()
+        return self._index.hit(pos[0] - origin[0], pos[1] - origin[1])
+
+    def _update_children(self, event: Event, pos):
+        """
+        Encaminha um evento aos controles filhos.
+
+        Eventos do mouse vão apenas para o controle mais à frente sob o cursor, e o controle
+        que estava sob o cursor antes recebe a saída do mouse; sem controle sob o cursor, o
+        evento vai para o controle ativo. Os demais eventos (teclado, texto) vão para o
+        controle ativo. O custo não depende da quantidade de controles filhos.
+
+        Args:
+            event (Event): O evento do pygame.
+            pos (tuple): Posição do cursor no evento.
+        """
+        if event.type in MOUSE_EVENTS:
+            control = self._hit_child(pos)
+
+            previous = self._hovered
+            if previous is not control:
+                self._hovered = control
+                if previous is not None:
+                    previous._leave()
+
+            if control:
+                # Clicar em outro controle tira o foco do controle ativo, mesmo que o controle
+                # clicado não se ative (como o corpo de um formulário aninhado)
+                focused = self._focused
+                if event.type == constants.MOUSEBUTTONDOWN and focused is not None and focused is not control:
+                    focused.set_active(False)
+
+                control.update(event, pos)
+                return
+
+        # Apenas o controle ativo recebe eventos do teclado e cliques fora dos demais controles
+        focused = self._focused
+        if focused is not None and focused._active:
+            focused.update(event, pos)
 
     # ========== Public Function's ============
 
@@ -263,9 +610,41 @@ class Control:
         Args:
             control (Control): O controle a ser adicionado à janela.
         """
-        self._controls.append(control)
+        if self._controls is _NO_CONTROLS:
+            self._controls = {}
+        self._controls[control] = None
         control.parent = self
 
+        if self._index is None:
+            self._index = SpatialIndex()
+        self._index.insert(control)
+        control._invalidate()
+
+    def add_controls(self, controls):
+        """
+        Adiciona vários controles de uma só vez.
+
+        Equivale a chamar add_control para cada controle, na ordem informada, mas as posições
+        absolutas e a área do controle são invalidadas uma única vez para todo o grupo.
+
+        Args:
+            controls (Iterable[Control]): Os controles a serem adicionados, de trás para a frente.
+        """
+        if self._controls is _NO_CONTROLS:
+            self._controls = {}
+        if self._index is None:
+            self._index = SpatialIndex()
+
+        controls = list(controls)
+        children = self._controls
+        for control in controls:
+            children[control] = None
+            control._parent = self
+        self._index.insert_many(controls)
+
+        self._transform_changed()
+        self._invalidate()
+
     def move_ip(self, pos_relative):
         """Move o controle relativamente à sua posição atual.
 
@@ -273,60 +652,127 @@ class Control:
             pos_relative (tuple): Uma tupla contendo as coordenadas x e y para mover o controle.
 
         """
+        self._invalidate(content=False)
         self.rect.move_ip(pos_relative)
-        self._update_render_rect()
-        for control in self._controls:
-            control._update_render_rect()
+        # Os controles descendentes recalculam a sua posição absoluta apenas quando forem usados
+        self._transform_changed()
+        self._reindex()
+        self._invalidate(content=False)
+
+    def resize(self, width, height):
+        """Muda a largura e a altura do controle de uma só vez.
+
+        A aparência do controle é gerada de novo uma única vez para o novo tamanho, em vez de
+        uma vez ao mudar a largura e outra ao mudar a altura.
+
+        Args:
+            width (int): A nova largura.
+            height (int): A nova altura.
+        """
+        if (width, height) == self._rect.size:
+            return
+
+        self._invalidate()
+        self._rect.size = (width, height)
+        self._transform_changed()
+        self._reindex()
+        self._resized()
+        self._invalidate()
+        self._invalidate_layout()
+
+    def animate(self, attribute, end, duration, easing = 'ease_in_out_quad', on_done = None, args = ()):
+        """Anima um atributo do controle, como a posição, o tamanho ou uma cor, até um valor final.
+
+        A animação é avançada pela agenda central (ui_animation.scheduler) em passos fixos de
+        tempo; a cada passo apenas a área do próprio controle é marcada como alterada.
+
+        Args:
+            attribute (str): O nome do atributo, como 'x', 'y', 'width' ou 'font_color'.
+            end: O valor final do atributo (número ou tupla de números).
+            duration (float): A duração da animação, em milissegundos.
+            easing (function | str, optional): A função de suavização ou o seu nome em
+                ui_animation.EASINGS. Default é 'ease_in_out_quad'.
+            on_done (function, optional): Função chamada quando a animação termina.
+            args (tuple, optional): Argumentos a serem passados para on_done. Default é ().
+
+        Returns:
+            Tween: A animação, que pode ser cancelada.
+        """
+        return ui_animation.scheduler.tween(self, attribute, end, duration, easing, on_done=on_done, args=args)
 
     def reset(self):
         """
         Reseta o estado do controle.
         """
+        if self._is_hovered or self._active:
+            self._invalidate()
+
+            if self._active and self._parent and self._parent._focused is self:
+                self._parent._focused = None
+
         self._is_hovered = False
         self._active = False
+        self._focused = None
+        self._hovered = None
 
         for control in self._controls:
             control.reset()
 
-    def draw(self, screen: Surface):
+    def draw(self, screen: Surface, offset=(0, 0)):
         """
         Método abstrato para desenhar o controle.
+
+        Args:
+            screen (Surface): A superfície onde o controle será desenhado.
+            offset (tuple, optional): Deslocamento aplicado à posição de desenho, usado ao
+                compor o controle na camada de um formulário. Default é (0, 0).
         """
-        if self.__render:
-            screen.blit(self.__render, self._render_rect)
+        if self.__render and self._visible:
+            screen.blit(self.__render, self._render_rect.move(offset))
 
-    def update(self, event: Event):
+    def update(self, event: Event, pos=None):
         """
         Atualiza o estado do controle com base nos eventos fornecidos.
 
         Args:
             events (Event): Eventos do pygame.
+            pos (tuple, optional): Posição do cursor no evento. Se None, é obtida com ui_utils.event_pos.
         """
         if not self._visible:
             return
-        
-        if self._render_rect.collidepoint(mouse.get_pos()):
-            if not self._is_hovered:
-                self._is_hovered = True
-                # TODO Mouse entered function
-        else:
-            if self._is_hovered:
-                self._is_hovered = False
-                self._is_clicked = False
-                # TODO Mouse leave function
+
+        if pos is None:
+            pos = ui_utils.event_pos(event)
+
+        self._update_hover(pos)
 
         if self._is_hovered:
             if event.type == constants.MOUSEBUTTONDOWN:
                 if not self._is_clicked:
                     self._is_clicked = True
+                    self._invalidate()
                     self._call_on_mouse_down()
             elif event.type == constants.MOUSEBUTTONUP:
                 if self._is_clicked:
                     self._is_clicked = False
+                    self._invalidate()
                     self._call_on_mouse_up()
         else:
             if event.type == constants.MOUSEBUTTONDOWN:
                 self.set_active(False)
 
         # TODO Implements tab next control
-                            
\ No newline at end of file
+
+    def update_many(self, events: list[Event]):
+        """
+        Atualiza o controle com todos os eventos de um quadro de uma só vez.
+
+        Movimentos consecutivos do mouse são juntados em um único evento (com o deslocamento
+        somado), de modo que o estado de hover é recalculado uma vez por sequência de
+        movimentos em vez de uma vez por evento.
+
+        Args:
+            events (list[Event]): Os eventos do quadro, por exemplo pygame.event.get().
+        """
+        for event in ui_utils.coalesce_motion(events):
+            self.update(event)
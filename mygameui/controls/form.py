@@ -1,9 +1,29 @@
-from pygame import Rect, Surface, transform, constants, mouse
+from pygame import Rect, Surface, constants
 from pygame.event import Event
 
 from .control import Control
 from .button import Button
+from .layout import update_layout
+from mygameui.drawlist import DrawList
 import mygameui.globals as ui_globals
+import mygameui.cache as ui_cache
+import mygameui.utils as ui_utils
+import mygameui.animation as ui_animation
+
+class _CloseButton(Button):
+    """
+    Botão de fechar do formulário, que usa as regiões de fechar do tema em vez da moldura de botão.
+    """
+
+    __slots__ = ()
+
+    def set_surface_theme(self, theme):
+        theme = self._use_theme(theme)
+
+        self.normal_img = theme.region('close')
+        self.click_img = theme.region('close')
+        self.hover_img = theme.region('close_hover')
+        self._invalidate()
 
 class Form(Control):
     """A classe Form representa uma janela de formulário na interface do usuário.
@@ -17,28 +37,82 @@ class Form(Control):
         caption_color (tuple): A cor do texto do título.
         closable (bool): Indica se o formulário possui botão de fechar.
         movable (bool): Indica se o formulário pode ser movido.
+        resizable (bool): Indica se o formulário pode ser redimensionado pelo canto inferior direito.
+        min_size (tuple): O menor tamanho (largura, altura) permitido ao redimensionar pelo mouse.
 
     Methods:
         set_surface_theme(theme): Define a aparência do formulário com base em um tema.
         set_surface_image(image: Surface): Define a imagem do formulário manualmente.
-        draw(screen): Desenha o formulário na tela especificada.
-        update(events: list[Event]): Atualiza o formulário com base nos eventos recebidos.
+        set_dirty_mode(value: bool, background: Surface): Liga ou desliga o modo de retângulos sujos.
+        set_layer_cache(value: bool): Liga ou desliga a camada composta do formulário.
+        set_batched_draw(value: bool): Liga ou desliga o desenho em lote do formulário.
+        draw(screen, offset): Desenha o formulário na tela especificada.
+        update(event: Event, pos): Atualiza o formulário com base nos eventos recebidos.
     """
 
-    def __init__(self, x, y, width, height, caption = '', closable = True, movable = True):
+    __slots__ = ('_caption', 'caption_color', 'dirty_background', 'movable', '__closable',
+                 '__close_button', '__full_redraw', '__layer', '__layer_enabled', '__draw_list', '__draw_key',
+                 '__batched', '__moving', '__render', 'resizable', 'min_size', '__resizing', '__grab',
+                 '__canvas', '__frame_stale')
+
+    def __init__(self, x, y, width, height, caption = '', closable = True, movable = True, resizable = False):
         super().__init__(x, y, width, height)
 
-        self.caption = caption
+        self._caption = caption
         self.caption_color = (200, 200, 200)
+        self.dirty_background: Surface = None
+        self.__full_redraw = True
+        self.__layer: Surface = None
+        self.__layer_enabled = False
+        # Lista de desenho gravada no modo em lote e o estado (tela, posição, recorte) em que foi gravada
+        self.__draw_list: DrawList = None
+        self.__draw_key = None
+        self.__batched = False
         self.closable = closable
         self.movable = movable
-        self.movable_rect = Rect(x, y, width, 16)
         self.__moving = False
+        self.resizable = resizable
+        self.min_size = (64, 48)
+        self.__resizing = False
+        # Distância entre o cursor e o canto inferior direito ao começar o redimensionamento
+        self.__grab = (0, 0)
+        # Moldura gerada de forma incremental enquanto o formulário é redimensionado pelo mouse
+        self.__canvas: ui_utils.NineSliceCanvas = None
+        self.__frame_stale = False
 
         self.set_surface_theme(ui_globals.theme)
 
     # ========== Property's ============
 
+    @property
+    def movable_rect(self):
+        """
+        Rect: A barra de título, em coordenadas absolutas, pela qual o formulário é arrastado.
+        """
+        rect = self._render_rect
+        return Rect(rect.x, rect.y, rect.width, 16)
+
+    @property
+    def resize_rect(self):
+        """
+        Rect: A alça no canto inferior direito, em coordenadas absolutas, pela qual o formulário é redimensionado.
+        """
+        rect = self._render_rect
+        return Rect(rect.right - 12, rect.bottom - 12, 12, 12)
+
+    @property
+    def caption(self):
+        """
+        str: O texto exibido como título do formulário.
+        """
+        return self._caption
+
+    @caption.setter
+    def caption(self, value):
+        if self._caption != value:
+            self._caption = value
+            self._invalidate()
+
     @property
     def closable(self):
         return self.__closable
@@ -52,75 +126,24 @@ class Form(Control):
         """
         self.__closable = value
         if value == True:
-            self.__close_button = Button(self.width - 16, 0, 16, 16)
+            self.__close_button = _CloseButton(self.width - 16, 0, 16, 16)
             self.__close_button.set_on_mouse_up(lambda: setattr(self, 'visible', False))
             self.add_control(self.__close_button)
 
-            # Configurar botão de fechar
-            if self.closable and self.__close_button:
-                self.__close_button.normal_img = ui_globals.theme.subsurface(96, 0, 16, 16)
-                self.__close_button.click_img = ui_globals.theme.subsurface(96, 0, 16, 16)
-                self.__close_button.hover_img = ui_globals.theme.subsurface(112, 0, 16, 16)
-
     # ======== Set Function's ===========
 
     def set_surface_theme(self, theme):
         """Define a aparência do formulário com base em um tema.
 
         Args:
-            theme: O tema que contém os elementos de estilo do formulário.
-
-        """
-        width = self._rect.width
-        height = self._rect.height
-        self.__render = Surface((self.width, self.height)).convert_alpha()
-        self.__render.fill((0,0,0,0))
-
-        ## ===== TOP =======
-        if self.movable:
-            # Canto superior esquerdo
-            render_left_top = theme.subsurface(48, 0, 16, 16)
-            # Centro superior
-            render_middle_top = transform.scale(theme.subsurface(64, 0, 16, 16), (width - 32, 16))
-            # Canto superior direito
-            render_right_top = theme.subsurface(80, 0, 16, 16)
-        else:
-            # Canto superior esquerdo
-            render_left_top = theme.subsurface(0, 0, 16, 16)
-            # Centro superior
-            render_middle_top = transform.scale(theme.subsurface(16, 0, 16, 16), (width - 32, 16))
-            # Canto superior direito
-            render_right_top = theme.subsurface(32, 0, 16, 16)
-
-        self.__render.blit(render_left_top, (0, 0))
-        self.__render.blit(render_middle_top, (16, 0))
-        self.__render.blit(render_right_top, (width - 16, 0))
-        
-        ## ===== MIDDLE =======
-        # Canto meio esquerdo
-        render_left_middle = transform.scale(theme.subsurface(0, 16, 16, 16), (16, height - 32))
-        self.__render.blit(render_left_middle, (0, 16))
-        
-        # Centro meio
-        self.__render_middle_middle = transform.scale(theme.subsurface(16, 16, 16, 16), (width - 32, height - 32))
-        self.__render.blit(self.__render_middle_middle, (16, 16))
-            
-        # Canto meio direito
-        self.__render_right_middle = transform.scale(theme.subsurface(32, 16, 16, 16), (16, height - 32))
-        self.__render.blit(self.__render_right_middle, (width - 16, 16))
-
-        ## ===== BOTTOM =======
-        # Canto inferior esquerdo
-        render_left_bottom = theme.subsurface(0, 32, 16, 16)
-        self.__render.blit(render_left_bottom, (0, height - 16))
-            
-        # Centro inferior
-        render_middle_bottom = transform.scale(theme.subsurface(16, 32, 16, 16), (width - 32, 16))
-        self.__render.blit(render_middle_bottom, (16, height - 16))
-            
-        # Canto inferior direito
-        render_right_bottom = theme.subsurface(32, 32, 16, 16)
-        self.__render.blit(render_right_bottom, (width - 16, height - 16))
+            theme (Theme | Surface): O tema que contém os elementos de estilo do formulário.
+
+        """
+        theme = self._use_theme(theme)
+
+        # A moldura é uma composição de nove regiões; formulários móveis usam a barra de título móvel
+        self.__render = theme.nine_slice('form_movable' if self.movable else 'form', self.width, self.height)
+        self._invalidate()
 
     def set_surface_image(self, image: Surface):
         """Define a imagem do formulário manualmente.
@@ -129,48 +152,284 @@ class Form(Control):
             image (Surface): A imagem a ser usada como aparência do formulário.
         """
         self.__render = image
+        self._invalidate()
 
-    # ======== Public Function's ========
+    def set_dirty_mode(self, value: bool, background: Surface = None):
+        """Liga ou desliga o modo de retângulos sujos.
+
+        Com o modo ligado, o formulário (quando é a raiz da árvore de controles) redesenha
+        somente as áreas alteradas desde o último draw, que passa a retornar a lista dessas
+        áreas para ser usada com pygame.display.update(rects). A tela não deve ser limpa a
+        cada quadro nesse modo.
+
+        Args:
+            value (bool): True para ligar o modo de retângulos sujos, False para desligá-lo.
+            background (Surface, optional): Imagem usada para restaurar o fundo das áreas que o
+                formulário deixou de cobrir (ao mover ou esconder o formulário). Se None, a
+                restauração dessas áreas fica a cargo de quem chama o draw.
+        """
+        self._dirty_rects = [] if value else None
+        self.dirty_background = background
+        self.__full_redraw = True
+
+    def set_layer_cache(self, value: bool):
+        """Liga ou desliga a camada composta do formulário.
+
+        Com a camada ligada, o fundo, o título e os controles do formulário são compostos em
+        uma Surface própria, que só é redesenhada quando algo dentro do formulário muda.
+        Nos demais quadros, inclusive enquanto o formulário é arrastado, o desenho custa
+        apenas um blit da camada.
+
+        Args:
+            value (bool): True para ligar a camada composta, False para desligá-la.
+        """
+        self.__layer_enabled = value
+        self.__layer = None
+        self._layer_dirty = True
+
+    def set_batched_draw(self, value: bool):
+        """Liga ou desliga o desenho em lote do formulário.
+
+        Com o desenho em lote ligado, os blits do fundo, do título e dos controles são gravados
+        em uma DrawList e enviados à tela com uma única chamada a Surface.blits; os blits que
+        ficam fora da área de recorte da tela são descartados na gravação. Nos quadros em que
+        nada muda dentro do formulário, a lista gravada é enviada de novo sem chamar o draw dos
+        controles. Diferente da camada composta, não é preciso manter uma Surface do tamanho do
+        formulário.
+
+        Controles próprios que desenham com pygame.draw não funcionam nesse modo. A camada
+        composta, quando ligada, tem prioridade, e o modo de retângulos sujos não usa a lista.
+
+        Args:
+            value (bool): True para ligar o desenho em lote, False para desligá-lo.
+        """
+        self.__batched = value
+        self.__draw_list = None
+        self.__draw_key = None
+
+    # ======== Private Function's ========
+
+    def _hover_changed(self):
+        # O formulário não muda de aparência com o mouse em cima
+        pass
+
+    def _resized(self):
+        if self.__closable:
+            self.__close_button.x = self.width - 16
+
+        if self.__resizing:
+            # Durante o arraste a moldura só é gerada no próximo desenho, uma vez por quadro
+            self.__frame_stale = True
+        else:
+            super()._resized()
+
+    def __end_resize(self):
+        """
+        Encerra o redimensionamento pelo mouse, gerando a moldura definitiva no tamanho final.
+        """
+        self.__resizing = False
+        self.__frame_stale = False
+        self.__canvas = None
+        if self._theme is not None:
+            self.set_surface_theme(self._theme)
+
+    def __update_frame(self):
+        """
+        Atualiza a moldura durante o redimensionamento, redesenhando somente as faixas alteradas.
+        """
+        self.__frame_stale = False
+        if self._theme is None:
+            return # Imagem definida manualmente, mantida como está
+
+        if self.__canvas is None:
+            name = 'form_movable' if self.movable else 'form'
+            self.__canvas = ui_utils.NineSliceCanvas(self._theme.region(name))
+
+        self.__render = self.__canvas.resize(self.width, self.height, exact=False)
+
+    def __paint(self, screen, offset=(0, 0)):
+        """Desenha o fundo, o título e os controles do formulário, recortados à área do formulário.
+
+        Controles invisíveis ou totalmente fora da área de recorte (a interseção do formulário
+        com o recorte atual da tela) não são desenhados.
+
+        Args:
+            screen (Surface): A superfície onde o formulário será desenhado.
+            offset (tuple, optional): Deslocamento aplicado à posição de desenho. Default é (0, 0).
+        """
+        if self.__frame_stale:
+            self.__update_frame()
+
+        rect = self._render_rect
+        previous = screen.get_clip()
+        clip = rect.move(offset).clip(previous)
+        if clip.width == 0 or clip.height == 0:
+            return # Formulário totalmente fora da área de recorte
+
+        screen.set_clip(clip)
+        x = rect.x + offset[0]
+        y = rect.y + offset[1]
 
-    def draw(self, screen):
-        if not self.visible:
-            return # Não mostrar controle caso ele não esteja visível
-        
-        x = self._rect.x
-        y = self._rect.y
-        
         if self.__render:
             screen.blit(self.__render, (x, y))
 
         # Desenhar o texto
-        if len(self.caption) > 0:
-            screen.blit(ui_globals.font.render(self.caption, True, self.caption_color), (x + 8, y + 3))
+        if len(self._caption) > 0:
+            screen.blit(ui_cache.render_text(ui_globals.font, self._caption, True, self.caption_color), (x + 8, y + 3))
+
+        # A área de recorte em coordenadas absolutas, comparada diretamente com os controles
+        visible = clip.move(-offset[0], -offset[1])
 
         # Render controls in order
         for control in self._controls:
-            control.draw(screen)
+            if control._visible and visible.colliderect(control._bounds()):
+                control.draw(screen, offset)
+
+        screen.set_clip(previous)
+
+    def __get_layer(self):
+        """Retorna a camada composta do formulário, redesenhando-a se algo mudou.
+
+        Returns:
+            Surface: A camada com o fundo, o título e os controles do formulário.
+        """
+        if self.__layer is None or self.__layer.get_size() != self.size:
+            self.__layer = Surface(self.size).convert_alpha()
+            self._layer_dirty = True
+
+        if self._layer_dirty:
+            self.__layer.fill((0, 0, 0, 0))
+            self.__paint(self.__layer, offset=(-self._render_rect.x, -self._render_rect.y))
+            self._layer_dirty = False
+
+        return self.__layer
+
+    def __draw_batched(self, screen: Surface, offset=(0, 0)):
+        """Envia a lista de desenho do formulário, gravando-a de novo se algo mudou.
+
+        Args:
+            screen (Surface): A superfície onde o formulário será desenhado.
+            offset (tuple, optional): Deslocamento aplicado à posição de desenho. Default é (0, 0).
+        """
+        if isinstance(screen, DrawList):
+            # Dentro de outro formulário em lote: os blits entram na lista do formulário externo
+            self.__paint(screen, offset=offset)
+            return
+
+        key = (screen, self._render_rect.topleft, tuple(offset), tuple(screen.get_clip()))
+        if self.__draw_list is None or self._layer_dirty or key != self.__draw_key:
+            self.__draw_list = DrawList(screen)
+            self.__paint(self.__draw_list, offset=offset)
+            self.__draw_key = key
+            self._layer_dirty = False
+
+        self.__draw_list.submit(screen)
+
+    def __draw_dirty(self, screen: Surface):
+        """Redesenha somente as áreas alteradas desde o último draw.
+
+        Args:
+            screen (Surface): A superfície onde o formulário será desenhado.
+
+        Returns:
+            list[Rect]: As áreas da tela que foram redesenhadas.
+        """
+        screen_clip = screen.get_clip()
+
+        if self.__full_redraw:
+            self.__full_redraw = False
+            rects = [self._render_rect.clip(screen_clip)]
+        else:
+            rects = []
+            for rect in self._dirty_rects:
+                rect = rect.clip(screen_clip)
+                if rect.width == 0 or rect.height == 0:
+                    continue
+
+                # Agrupa áreas sobrepostas para evitar redesenhar a mesma região mais de uma vez
+                index = rect.collidelist(rects)
+                while index != -1:
+                    rect.union_ip(rects.pop(index))
+                    index = rect.collidelist(rects)
+                rects.append(rect)
+
+        self._dirty_rects.clear()
+
+        for rect in rects:
+            screen.set_clip(rect)
+            if self.dirty_background:
+                screen.blit(self.dirty_background, rect, rect)
+            if self._visible:
+                if self.__layer_enabled:
+                    screen.blit(self.__get_layer(), self._render_rect)
+                else:
+                    self.__paint(screen)
+
+        screen.set_clip(screen_clip)
+        return rects
+
+    # ======== Public Function's ========
+
+    def draw(self, screen, offset=(0, 0)):
+        """Desenha o formulário na tela especificada.
+
+        Args:
+            screen (Surface): A superfície onde o formulário será desenhado.
+            offset (tuple, optional): Deslocamento aplicado à posição de desenho, usado ao
+                compor o formulário na camada de outro formulário. Default é (0, 0).
+
+        Returns:
+            list[Rect]: No modo de retângulos sujos, as áreas da tela que foram redesenhadas.
+        """
+        if not self._parent:
+            # Aplica de uma só vez as mudanças de disposição dos painéis de layout
+            update_layout()
+
+            # Acorda somente os temporizadores vencidos e avança as animações dos controles
+            ui_animation.scheduler.update()
+
+            if self._dirty_rects is not None:
+                return self.__draw_dirty(screen)
 
-    def update(self, event: Event):
+        if not self.visible:
+            return # Não mostrar controle caso ele não esteja visível
+
+        if self.__layer_enabled:
+            screen.blit(self.__get_layer(), self._render_rect.move(offset))
+        elif self.__batched:
+            self.__draw_batched(screen, offset)
+        else:
+            self.__paint(screen, offset=offset)
+
+    def update(self, event: Event, pos=None):
         if not self.visible:
             return # Não atualizar controle caso ele não esteja visível
-        
+
+        # A posição do cursor é calculada uma única vez por evento e repassada aos filhos
+        if pos is None:
+            pos = ui_utils.event_pos(event)
+
+        self._update_hover(pos)
+
         if event.type == constants.MOUSEBUTTONDOWN and event.button == 1:
             self._is_clicked = True
-            if self.movable and self.movable_rect.collidepoint(mouse.get_pos()):
+            if self.resizable and self.resize_rect.collidepoint(pos):
+                rect = self._render_rect
+                self.__resizing = True
+                self.__grab = (rect.right - pos[0], rect.bottom - pos[1])
+            elif self.movable and self.movable_rect.collidepoint(pos):
                 self.__moving = True
         elif event.type == constants.MOUSEBUTTONUP:
             self._is_clicked = False
             self.__moving = False
+            if self.__resizing:
+                self.__end_resize()
         elif event.type == constants.MOUSEMOTION:
-            if self.movable and self.__moving:
+            if self.__resizing:
+                rect = self._render_rect
+                self.resize(max(self.min_size[0], pos[0] + self.__grab[0] - rect.x),
+                            max(self.min_size[1], pos[1] + self.__grab[1] - rect.y))
+            elif self.movable and self.__moving:
                 self.move_ip(event.rel)
-                self.movable_rect.move_ip(event.rel)
-
-        for control in reversed(self._controls):
-            control.update(event)
-            if control.rect.collidepoint(mouse.get_pos()):
-                for c in self._controls:
-                    if c != control:
-                        c.reset()
 
-                break   
+        self._update_children(event, pos)   
@@ -1,16 +1,41 @@
-from pygame import Surface
+from pygame import Surface, Rect
 
 from .control import Control
 import mygameui.globals as ui_globals
+import mygameui.cache as ui_cache
 
 class Label(Control):
+    __slots__ = ('_text', 'font', 'font_color', 'background')
+
     def __init__(self, x, y, text):
         super().__init__(x, y, 0, 0)
 
-        self.text = text
+        self._text = text
         self.font = ui_globals.font
         self.font_color = (255, 255, 255)
         self.background = None
 
-    def draw(self, screen: Surface):
-        screen.blit(self.font.render(self.text, True, self.font_color, self.background), self._render_rect)
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        if self._text != value:
+            self._invalidate()
+            self._text = value
+            self._invalidate()
+            self._invalidate_layout()
+
+    def _bounds(self):
+        return Rect(self._render_rect.topleft, self.font.size(self._text))
+
+    def _desired_size(self):
+        return self.font.size(self._text)
+
+    def draw(self, screen: Surface, offset=(0, 0)):
+        if not self._visible:
+            return # Não exibir controle caso não esteja visível
+
+        screen.blit(ui_cache.render_text(self.font, self._text, True, self.font_color, self.background),
+                    self._render_rect.move(offset))
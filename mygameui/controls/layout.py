@@ -0,0 +1,399 @@
+from pygame import Rect, Surface
+from pygame.event import Event
+
+from .control import Control
+import mygameui.utils as ui_utils
+
+# Painéis com a disposição desatualizada, aplicados de uma só vez por update_layout
+_pending = set()
+
+def update_layout():
+    """Aplica de uma só vez todas as mudanças de disposição pendentes.
+
+    Mudar o tamanho ou o texto de um controle dentro de um painel apenas marca o painel e os
+    seus ancestrais como desatualizados; as novas posições são calculadas aqui, uma vez por
+    quadro. O Form raiz e os painéis chamam esta função automaticamente ao desenhar.
+    """
+    while _pending:
+        panels = list(_pending)
+        _pending.clear()
+
+        for panel in panels:
+            if not panel._needs_layout:
+                continue
+
+            # Painéis aninhados são dispostos pelo painel desatualizado mais externo
+            top = panel
+            while isinstance(top._parent, Panel) and top._parent._needs_layout:
+                top = top._parent
+            top.arrange()
+
+class Panel(Control):
+    """A classe Panel é a base dos contêineres que posicionam os controles filhos automaticamente.
+
+    A disposição é feita em duas etapas: a medição calcula o tamanho desejado de cada controle e
+    a disposição posiciona os controles dentro do painel. O tamanho medido fica em cache até que
+    algo dentro do painel mude, e apenas os painéis afetados por uma mudança são dispostos de novo.
+
+    O próprio Panel mantém os controles nas posições em que foram colocados e, com auto_size,
+    assume o tamanho da área ocupada por eles; as subclasses definem outras disposições.
+
+    Attributes:
+        x (int): A coordenada x do canto superior esquerdo do painel.
+        y (int): A coordenada y do canto superior esquerdo do painel.
+        width (int): A largura do painel.
+        height (int): A altura do painel.
+        padding (int): O espaço entre a borda do painel e os controles.
+        spacing (int): O espaço entre os controles.
+        auto_size (bool): Se True, o painel assume o tamanho do seu conteúdo.
+
+    Methods:
+        arrange(): Mede e posiciona imediatamente os controles do painel.
+        draw(screen, offset): Desenha os controles do painel na tela especificada.
+        update(event: Event, pos): Atualiza os controles do painel com base nos eventos recebidos.
+    """
+
+    __slots__ = ('padding', 'spacing', 'auto_size', '_needs_layout', '_desired', '_sizes', '_extent')
+
+    def __init__(self, x, y, width = 0, height = 0, padding = 0, spacing = 4, auto_size = False):
+        super().__init__(x, y, width, height)
+
+        self.padding = padding
+        self.spacing = spacing
+        self.auto_size = auto_size
+        self._needs_layout = False
+        # Tamanho do conteúdo medido, em cache até a disposição ficar desatualizada
+        self._desired = None
+        # Tamanho desejado de cada controle filho, em cache até o controle avisar que mudou
+        self._sizes = {}
+        # Área ocupada pelo painel e pelos controles dispostos, relativa ao painel
+        self._extent: Rect = None
+
+        self._invalidate_layout()
+
+    # ========== Private Function's =========
+
+    def _invalidate_layout(self):
+        self._desired = None
+
+        if not self._needs_layout:
+            self._needs_layout = True
+            _pending.add(self)
+            super()._invalidate_layout()
+
+    def _child_layout_changed(self, control):
+        self._sizes.pop(control, None)
+        self._invalidate_layout()
+
+    def _bounds(self):
+        # Os controles podem passar da área do painel, que pode até ter tamanho zero
+        if self._extent is None:
+            return self._render_rect
+
+        return self._extent.move(self._render_rect.topleft)
+
+    def _desired_size(self):
+        if not self.auto_size:
+            return self._rect.size
+
+        if self._desired is None:
+            self._desired = self._measure()
+        return self._desired
+
+    def _size_of(self, control):
+        """
+        Retorna o tamanho desejado de um controle filho, medindo-o apenas se ele mudou.
+        """
+        size = self._sizes.get(control)
+        if size is None:
+            size = self._sizes[control] = control._desired_size()
+
+        return size
+
+    def _visible_controls(self):
+        """
+        Retorna os controles filhos visíveis, que ocupam espaço na disposição.
+        """
+        return [control for control in self._controls if control._visible]
+
+    def _measure(self):
+        """Calcula o tamanho ocupado pelo conteúdo do painel, incluindo o padding.
+
+        Por padrão, a área que vai da origem do painel até o canto inferior direito do controle
+        filho mais afastado, nas posições em que os controles estão.
+
+        Returns:
+            tuple: A largura e a altura do conteúdo.
+        """
+        width = height = 0
+        for control in self._visible_controls():
+            w, h = self._size_of(control)
+            width = max(width, control._rect.x + w)
+            height = max(height, control._rect.y + h)
+
+        return (width + self.padding, height + self.padding)
+
+    def _place(self, inner: Rect):
+        """Posiciona os controles filhos dentro da área informada, usando _move_child.
+
+        Por padrão, os controles permanecem nas posições em que foram colocados.
+
+        Args:
+            inner (Rect): A área interna do painel, em coordenadas relativas ao painel.
+        """
+        pass
+
+    def _move_child(self, control, x, y):
+        """Move um controle filho sem passar pelos setters, que redesenhariam e invalidariam a cada chamada.
+
+        Args:
+            control (Control): O controle filho.
+            x (int): A nova coordenada x, relativa ao painel.
+            y (int): A nova coordenada y, relativa ao painel.
+
+        Returns:
+            bool: True se a posição do controle mudou.
+        """
+        rect = control._rect
+        moved = rect.x != x or rect.y != y
+        if moved:
+            rect.x = x
+            rect.y = y
+            self._index.update(control)
+
+        if isinstance(control, Panel) and control._needs_layout:
+            control.arrange()
+
+        return moved
+
+    # ========== Public Function's ============
+
+    def add_control(self, control):
+        super().add_control(control)
+        self._invalidate_layout()
+
+    def add_controls(self, controls):
+        super().add_controls(controls)
+        self._invalidate_layout()
+
+    def arrange(self):
+        """
+        Mede e posiciona imediatamente os controles do painel e dos painéis internos desatualizados.
+        """
+        self._needs_layout = False
+        _pending.discard(self)
+        self._invalidate()
+
+        if self.auto_size:
+            width, height = self._desired_size()
+            if (width, height) != self._rect.size:
+                self._rect.size = (width, height)
+                self._transform_changed()
+                self._reindex()
+
+        extent = Rect(0, 0, self.width, self.height)
+        if self._controls:
+            padding = self.padding
+            self._place(Rect(padding, padding, self.width - padding * 2, self.height - padding * 2))
+
+            for control in self._visible_controls():
+                if isinstance(control, Panel) and control._extent is not None:
+                    extent.union_ip(control._extent.move(control._rect.topleft))
+                else:
+                    extent.union_ip(Rect(control._rect.topleft, self._size_of(control)))
+        self._extent = extent
+
+        # As posições absolutas dos filhos são recalculadas no próximo acesso
+        self._transform_changed()
+        self._invalidate()
+
+    def draw(self, screen: Surface, offset=(0, 0)):
+        if not self._visible:
+            return # Não exibir controle caso não esteja visível
+
+        if _pending:
+            update_layout()
+
+        # Controles fora da área de recorte da tela não são desenhados; os painéis não recortam
+        # os filhos à sua própria área, que pode ser menor que o conteúdo
+        visible = screen.get_clip().move(-offset[0], -offset[1])
+        for control in self._controls:
+            if control._visible and visible.colliderect(control._bounds()):
+                control.draw(screen, offset)
+
+    def update(self, event: Event, pos=None):
+        if not self._visible:
+            return # Não atualizar controle caso ele não esteja visível
+
+        if pos is None:
+            pos = ui_utils.event_pos(event)
+
+        super().update(event, pos)
+        self._update_children(event, pos)
+
+class StackPanel(Panel):
+    """A classe StackPanel empilha os controles filhos na vertical ou na horizontal.
+
+    Attributes:
+        orientation (str): 'vertical' ou 'horizontal'.
+        align (str): O alinhamento no outro eixo: 'start', 'center' ou 'end'.
+    """
+
+    __slots__ = ('orientation', 'align')
+
+    def __init__(self, x, y, width = 0, height = 0, orientation = 'vertical', align = 'start',
+                 padding = 0, spacing = 4, auto_size = False):
+        self.orientation = orientation
+        self.align = align
+        super().__init__(x, y, width, height, padding, spacing, auto_size)
+
+    # ========== Private Function's =========
+
+    def _measure(self):
+        sizes = [self._size_of(control) for control in self._visible_controls()]
+        gaps = self.spacing * max(len(sizes) - 1, 0)
+
+        if self.orientation == 'vertical':
+            width = max((w for w, _ in sizes), default=0)
+            height = sum(h for _, h in sizes) + gaps
+        else:
+            width = sum(w for w, _ in sizes) + gaps
+            height = max((h for _, h in sizes), default=0)
+
+        return (width + self.padding * 2, height + self.padding * 2)
+
+    def _place(self, inner: Rect):
+        factor = {'start': 0, 'center': 0.5, 'end': 1}[self.align]
+        vertical = self.orientation == 'vertical'
+        cursor = inner.y if vertical else inner.x
+
+        for control in self._visible_controls():
+            width, height = self._size_of(control)
+            if vertical:
+                self._move_child(control, inner.x + int((inner.width - width) * factor), cursor)
+                cursor += height + self.spacing
+            else:
+                self._move_child(control, cursor, inner.y + int((inner.height - height) * factor))
+                cursor += width + self.spacing
+
+class GridPanel(Panel):
+    """A classe GridPanel dispõe os controles filhos em uma grade, linha por linha.
+
+    Cada coluna tem a largura do seu controle mais largo e cada linha a altura do seu controle
+    mais alto, a menos que um tamanho fixo de célula seja informado.
+
+    Attributes:
+        columns (int): A quantidade de colunas.
+        cell_size (tuple): O tamanho fixo de cada célula, ou None para medir os controles.
+    """
+
+    __slots__ = ('columns', 'cell_size')
+
+    def __init__(self, x, y, width = 0, height = 0, columns = 2, cell_size = None,
+                 padding = 0, spacing = 4, auto_size = False):
+        self.columns = columns
+        self.cell_size = cell_size
+        super().__init__(x, y, width, height, padding, spacing, auto_size)
+
+    # ========== Private Function's =========
+
+    def _tracks(self, controls):
+        """
+        Retorna as larguras das colunas e as alturas das linhas da grade.
+        """
+        rows = (len(controls) + self.columns - 1) // self.columns
+        if self.cell_size:
+            return [self.cell_size[0]] * self.columns, [self.cell_size[1]] * rows
+
+        widths = [0] * self.columns
+        heights = [0] * rows
+        for i, control in enumerate(controls):
+            width, height = self._size_of(control)
+            column, row = i % self.columns, i // self.columns
+            widths[column] = max(widths[column], width)
+            heights[row] = max(heights[row], height)
+
+        return widths, heights
+
+    def _measure(self):
+        widths, heights = self._tracks(self._visible_controls())
+        width = sum(widths) + self.spacing * max(len(widths) - 1, 0)
+        height = sum(heights) + self.spacing * max(len(heights) - 1, 0)
+        return (width + self.padding * 2, height + self.padding * 2)
+
+    def _place(self, inner: Rect):
+        controls = self._visible_controls()
+        widths, heights = self._tracks(controls)
+
+        xs = [inner.x]
+        for width in widths[:-1]:
+            xs.append(xs[-1] + width + self.spacing)
+        ys = [inner.y]
+        for height in heights[:-1]:
+            ys.append(ys[-1] + height + self.spacing)
+
+        for i, control in enumerate(controls):
+            self._move_child(control, xs[i % self.columns], ys[i // self.columns])
+
+class AnchorPanel(Panel):
+    """A classe AnchorPanel prende cada controle filho a um ponto do painel.
+
+    Os pontos são os nomes de pontos de um Rect do pygame: 'topleft', 'midtop', 'topright',
+    'midleft', 'center', 'midright', 'bottomleft', 'midbottom' e 'bottomright'. Quando o painel
+    muda de tamanho, os controles acompanham os seus pontos.
+
+    Methods:
+        add_control(control, anchor, margin): Adiciona um controle preso a um ponto do painel.
+        add_controls(controls, anchor, margin): Adiciona vários controles presos ao mesmo ponto.
+    """
+
+    __slots__ = ('__anchors',)
+
+    def __init__(self, x, y, width = 0, height = 0, padding = 0, auto_size = False):
+        self.__anchors = {}
+        super().__init__(x, y, width, height, padding, 0, auto_size)
+
+    # ========== Private Function's =========
+
+    def _measure(self):
+        width = height = 0
+        for control in self._visible_controls():
+            w, h = self._size_of(control)
+            _, (mx, my) = self.__anchors[control]
+            width = max(width, w + abs(mx))
+            height = max(height, h + abs(my))
+
+        return (width + self.padding * 2, height + self.padding * 2)
+
+    def _place(self, inner: Rect):
+        for control in self._visible_controls():
+            anchor, (mx, my) = self.__anchors[control]
+            rect = Rect((0, 0), self._size_of(control))
+            setattr(rect, anchor, getattr(inner, anchor))
+            self._move_child(control, rect.x + mx, rect.y + my)
+
+    # ========== Public Function's ============
+
+    def add_control(self, control, anchor = 'topleft', margin = (0, 0)):
+        """Adiciona um controle preso a um ponto do painel.
+
+        Args:
+            control (Control): O controle a ser adicionado.
+            anchor (str, optional): O ponto do painel ao qual o controle é preso. Default é 'topleft'.
+            margin (tuple, optional): O deslocamento do controle em relação ao ponto. Default é (0, 0).
+        """
+        self.__anchors[control] = (anchor, margin)
+        super().add_control(control)
+
+    def add_controls(self, controls, anchor = 'topleft', margin = (0, 0)):
+        """Adiciona vários controles de uma só vez, todos presos ao mesmo ponto do painel.
+
+        Args:
+            controls (Iterable[Control]): Os controles a serem adicionados.
+            anchor (str, optional): O ponto do painel ao qual os controles são presos. Default é 'topleft'.
+            margin (tuple, optional): O deslocamento dos controles em relação ao ponto. Default é (0, 0).
+        """
+        controls = list(controls)
+        for control in controls:
+            self.__anchors[control] = (anchor, margin)
+        super().add_controls(controls)
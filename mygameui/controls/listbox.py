@@ -0,0 +1,257 @@
+from pygame import Rect, Surface, constants
+from pygame.event import Event
+
+from .control import Control
+from .scrollview import ScrollView
+import mygameui.globals as ui_globals
+import mygameui.cache as ui_cache
+
+class _ListRow(Control):
+    """
+    Linha reutilizável de um ListBox, que exibe o item cujo índice recebeu por último.
+    """
+
+    __slots__ = ('index', 'text', '__listbox')
+
+    def __init__(self, listbox, width, height):
+        super().__init__(0, 0, width, height)
+
+        self.index = -1
+        self.text = ''
+        self.__listbox = listbox
+
+    def bind(self, index, text):
+        """
+        Associa a linha a um item, movendo-a para a posição do item no conteúdo.
+        """
+        self.index = index
+        self.text = text
+        self._rect.y = index * self._rect.height
+        self._transform_changed()
+
+    def draw(self, screen: Surface, offset=(0, 0)):
+        listbox = self.__listbox
+        rect = self._render_rect.move(offset)
+
+        if self.index == listbox.selected_index:
+            screen.fill(listbox.selected_color, rect)
+        elif self._is_hovered:
+            screen.fill(listbox.hover_color, rect)
+
+        if len(self.text) > 0:
+            render = ui_cache.render_text(listbox.font, self.text, True, listbox.font_color)
+            screen.blit(render, (rect.x + listbox.padding, rect.centery - render.get_height() // 2))
+
+class ListBox(ScrollView):
+    """A classe ListBox representa uma lista rolável de itens, virtualizada para grandes quantidades.
+
+    Apenas as linhas dentro da área visível existem: um pequeno conjunto de linhas é reutilizado
+    enquanto a lista rola, de modo que o custo de desenho e de eventos não depende da quantidade
+    de itens. Os itens vêm de uma sequência (set_items) ou de funções (set_data_source).
+
+    Attributes:
+        x (int): A coordenada x do canto superior esquerdo da lista.
+        y (int): A coordenada y do canto superior esquerdo da lista.
+        width (int): A largura da lista.
+        height (int): A altura da lista.
+        row_height (int): A altura de cada linha.
+        selected_index (int): O índice do item selecionado, ou -1.
+        selected_item: O item selecionado, ou None.
+        count (int): A quantidade de itens.
+
+    Methods:
+        set_items(items): Define os itens a partir de uma sequência.
+        set_data_source(count, get_item): Define os itens a partir de funções.
+        set_on_selected(func, args=()): Define a função a ser chamada quando um item é selecionado.
+        refresh(): Atualiza as linhas depois que os itens mudaram.
+    """
+
+    __slots__ = ('row_height', 'font', 'font_color', 'selected_color', 'hover_color', 'padding', '_on_selected',
+                 '__selected_index', '__count', '__get_item', '__first', '__background', '__rows')
+
+    def __init__(self, x, y, width, height, items = None, row_height = 18):
+        super().__init__(x, y, width, height)
+
+        self.row_height = row_height
+        self.font = ui_globals.font
+        self.font_color = (255, 255, 255)
+        self.selected_color = (70, 90, 140)
+        self.hover_color = (60, 60, 60)
+        self.padding = 6
+
+        self._on_selected = None
+        self.__selected_index = -1
+        self.__count = lambda: 0
+        self.__get_item = None
+        self.__first = -1
+        self.__background: Surface = None
+
+        # Conjunto de linhas reutilizadas: o suficiente para cobrir a área visível durante a rolagem
+        self.__rows: list[_ListRow] = []
+        for _ in range(height // row_height + 2):
+            row = _ListRow(self, width - 6, row_height)
+            row.set_on_mouse_down(self.__select_row, (row,))
+            Control.add_control(self, row)
+            self.__rows.append(row)
+
+        self.set_surface_theme(ui_globals.theme)
+        self.set_items(items if items is not None else [])
+
+    # ========== Property's ============
+
+    @property
+    def count(self):
+        """
+        int: A quantidade de itens.
+        """
+        return self.__count()
+
+    @property
+    def selected_index(self):
+        """
+        int: O índice do item selecionado, ou -1.
+        """
+        return self.__selected_index
+
+    @selected_index.setter
+    def selected_index(self, value):
+        if self.__selected_index != value:
+            self.__selected_index = value
+            self._invalidate()
+            self._call_selected()
+
+    @property
+    def selected_item(self):
+        """
+        O item selecionado, ou None.
+        """
+        if 0 <= self.__selected_index < self.__count():
+            return self.__get_item(self.__selected_index)
+
+        return None
+
+    # ========== Set Function's ===========
+
+    def set_surface_theme(self, theme):
+        """Define a aparência da lista com base em um tema.
+
+        Args:
+            theme (Theme | Surface): O tema que contém os elementos de estilo da lista.
+        """
+        theme = self._use_theme(theme)
+
+        self.__background = theme.nine_slice('textbox', self.width, self.height)
+        self._invalidate()
+
+    def set_items(self, items):
+        """Define os itens da lista a partir de uma sequência.
+
+        Args:
+            items (Sequence): Os itens; cada linha exibe str(item).
+        """
+        self.set_data_source(lambda: len(items), items.__getitem__)
+
+    def set_data_source(self, count, get_item):
+        """Define os itens da lista a partir de funções, sem precisar de uma sequência em memória.
+
+        Args:
+            count (function): Função sem argumentos que retorna a quantidade de itens.
+            get_item (function): Função que recebe um índice e retorna o item; cada linha exibe str(item).
+        """
+        self.__count = count
+        self.__get_item = get_item
+        self.refresh()
+
+    def set_on_selected(self, func, args=()):
+        """Define a função a ser chamada quando um item é selecionado.
+
+        Args:
+            func: A função a ser chamada quando um item é selecionado.
+            args (tuple, optional): Argumentos adicionais a serem passados para a função. Default é ().
+        """
+        self._on_selected = (func, args)
+
+    # ========== Call Function's ===========
+
+    def _call_selected(self):
+        """
+        Chama a função associada à seleção de um item, se houver.
+        """
+        if self._on_selected:
+            self._on_selected[0](*self._on_selected[1])
+
+    # ========== Private Function's =========
+
+    def _content_window(self):
+        # Apenas as linhas do conjunto reutilizável ficam na Surface em cache
+        return Rect(0, max(self.__first, 0) * self.row_height, self.width, len(self.__rows) * self.row_height)
+
+    def _scrolled(self):
+        first = self._scroll_y // self.row_height
+        if first != self.__first:
+            self.__bind_rows(first)
+
+        super()._scrolled()
+
+    def _draw_background(self, screen: Surface, rect: Rect):
+        if self.__background:
+            screen.blit(self.__background, rect)
+
+    def __bind_rows(self, first):
+        """
+        Associa as linhas reutilizáveis aos itens a partir do índice informado.
+        """
+        self.__first = first
+        count = self.__count()
+
+        for i, row in enumerate(self.__rows):
+            index = first + i
+            if index < count:
+                row.bind(index, str(self.__get_item(index)))
+                row._visible = True
+            else:
+                row.bind(index, '')
+                row._visible = False
+            self._index.update(row)
+
+        self._layer_dirty = True
+
+    def __select_row(self, row):
+        """
+        Seleciona o item exibido pela linha clicada.
+        """
+        if row.index < self.__count():
+            self.selected_index = row.index
+
+    # ========== Public Function's ============
+
+    def refresh(self):
+        """
+        Atualiza as linhas depois que os itens mudaram.
+        """
+        self.content_size = (self.width, max(self.height, self.__count() * self.row_height))
+        self.__bind_rows(self._scroll_y // self.row_height)
+        self._invalidate()
+
+    def ensure_visible(self, index):
+        """Rola a lista, se necessário, para que o item informado fique visível.
+
+        Args:
+            index (int): O índice do item.
+        """
+        top = index * self.row_height
+        if top < self._scroll_y:
+            self.scroll_to(self._scroll_x, top)
+        elif top + self.row_height > self._scroll_y + self.height:
+            self.scroll_to(self._scroll_x, top + self.row_height - self.height)
+
+    def update(self, event: Event, pos=None):
+        super().update(event, pos)
+
+        if event.type == constants.KEYDOWN and self._active and self.__count() > 0:
+            if event.key == constants.K_UP:
+                self.selected_index = max(self.__selected_index - 1, 0)
+                self.ensure_visible(self.__selected_index)
+            elif event.key == constants.K_DOWN:
+                self.selected_index = min(self.__selected_index + 1, self.__count() - 1)
+                self.ensure_visible(self.__selected_index)
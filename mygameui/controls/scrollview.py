@@ -0,0 +1,208 @@
+from pygame import Rect, Surface, constants
+from pygame.event import Event
+
+from .control import Control
+import mygameui.utils as ui_utils
+
+class ScrollView(Control):
+    """A classe ScrollView representa uma área rolável que contém outros controles.
+
+    Os controles filhos são posicionados em coordenadas do conteúdo. O conteúdo é composto em
+    uma Surface em cache, redesenhada apenas quando algo dentro dela muda; rolar custa somente
+    um blit dessa Surface com outro deslocamento.
+
+    Attributes:
+        x (int): A coordenada x do canto superior esquerdo da área visível.
+        y (int): A coordenada y do canto superior esquerdo da área visível.
+        width (int): A largura da área visível.
+        height (int): A altura da área visível.
+        content_size (tuple): A largura e a altura do conteúdo.
+        scroll_x (int): O deslocamento horizontal da rolagem.
+        scroll_y (int): O deslocamento vertical da rolagem.
+        scroll_step (int): Quantos pixels cada passo da roda do mouse rola.
+
+    Methods:
+        scroll_to(x, y): Rola o conteúdo até a posição informada.
+        draw(screen, offset): Desenha a área visível do conteúdo na tela especificada.
+        update(event: Event, pos): Atualiza a área rolável com base nos eventos recebidos.
+    """
+
+    __slots__ = ('_scroll_x', '_scroll_y', '_content_width', '_content_height', 'scroll_step', 'scrollbar_color',
+                 '__content', '__content_window')
+
+    def __init__(self, x, y, width, height):
+        super().__init__(x, y, width, height)
+
+        self._scroll_x = 0
+        self._scroll_y = 0
+        self._content_width = width
+        self._content_height = height
+        self.scroll_step = 24
+        self.scrollbar_color = (200, 200, 200)
+
+        self.__content: Surface = None
+        self.__content_window: Rect = None
+
+    # ========== Property's ============
+
+    @property
+    def content_size(self):
+        """
+        tuple: A largura e a altura do conteúdo.
+        """
+        return (self._content_width, self._content_height)
+
+    @content_size.setter
+    def content_size(self, value):
+        self._content_width, self._content_height = value
+        self.scroll_to(self._scroll_x, self._scroll_y)
+        self._invalidate()
+
+    @property
+    def scroll_x(self):
+        """
+        int: O deslocamento horizontal da rolagem.
+        """
+        return self._scroll_x
+
+    @scroll_x.setter
+    def scroll_x(self, value):
+        self.scroll_to(value, self._scroll_y)
+
+    @property
+    def scroll_y(self):
+        """
+        int: O deslocamento vertical da rolagem.
+        """
+        return self._scroll_y
+
+    @scroll_y.setter
+    def scroll_y(self, value):
+        self.scroll_to(self._scroll_x, value)
+
+    # ========== Private Function's =========
+
+    def _child_origin(self):
+        return (self._render_rect.x - self._scroll_x, self._render_rect.y - self._scroll_y)
+
+    def _content_window(self):
+        """
+        Retorna a parte do conteúdo, em coordenadas do conteúdo, guardada na Surface em cache.
+
+        Por padrão todo o conteúdo é guardado; controles virtualizados guardam apenas a parte visível.
+        """
+        return Rect(0, 0, self._content_width, self._content_height)
+
+    def _scrolled(self):
+        """
+        Chamada depois que a rolagem muda.
+        """
+        self._transform_changed()
+
+    def _hit_child(self, pos):
+        # Controles fora da área visível não podem ser atingidos
+        if not self._render_rect.collidepoint(pos):
+            return None
+
+        return super()._hit_child(pos)
+
+    def __get_content(self, window: Rect):
+        """Retorna a Surface com a parte do conteúdo informada, redesenhando-a se algo mudou.
+
+        Args:
+            window (Rect): A parte do conteúdo a ser guardada na Surface.
+
+        Returns:
+            Surface: A Surface com o conteúdo.
+        """
+        if self.__content is None or self.__content.get_size() != window.size:
+            self.__content = Surface(window.size).convert_alpha()
+            self._layer_dirty = True
+
+        if self._layer_dirty or window != self.__content_window:
+            origin = self._child_origin()
+            offset = (-origin[0] - window.x, -origin[1] - window.y)
+
+            self.__content.fill((0, 0, 0, 0))
+            for control in self._controls:
+                if control._visible and control.rect.colliderect(window):
+                    control.draw(self.__content, offset)
+
+            self.__content_window = Rect(window)
+            self._layer_dirty = False
+
+        return self.__content
+
+    def _draw_background(self, screen: Surface, rect: Rect):
+        """
+        Desenha o fundo da área rolável. Por padrão a área não tem fundo.
+        """
+        pass
+
+    # ========== Public Function's ============
+
+    def add_control(self, control):
+        super().add_control(control)
+
+        # O conteúdo cresce para caber os controles adicionados
+        self._content_width = max(self._content_width, control.rect.right)
+        self._content_height = max(self._content_height, control.rect.bottom)
+
+    def add_controls(self, controls):
+        controls = list(controls)
+        super().add_controls(controls)
+
+        for control in controls:
+            self._content_width = max(self._content_width, control.rect.right)
+            self._content_height = max(self._content_height, control.rect.bottom)
+
+    def scroll_to(self, x, y):
+        """Rola o conteúdo até a posição informada, limitada ao tamanho do conteúdo.
+
+        Args:
+            x (int): O deslocamento horizontal desejado.
+            y (int): O deslocamento vertical desejado.
+        """
+        x = min(max(x, 0), max(0, self._content_width - self.width))
+        y = min(max(y, 0), max(0, self._content_height - self.height))
+
+        if (x, y) != (self._scroll_x, self._scroll_y):
+            self._scroll_x = x
+            self._scroll_y = y
+            self._scrolled()
+            # A Surface do conteúdo continua válida; apenas a parte exibida muda
+            self._invalidate(content=False)
+
+    def draw(self, screen: Surface, offset=(0, 0)):
+        if not self._visible:
+            return # Não exibir controle caso não esteja visível
+
+        rect = self._render_rect.move(offset)
+        self._draw_background(screen, rect)
+
+        window = self._content_window()
+        content = self.__get_content(window)
+        area = Rect(self._scroll_x - window.x, self._scroll_y - window.y, self.width, self.height)
+        screen.blit(content, rect, area)
+
+        # Barra de rolagem vertical
+        if self._content_height > self.height:
+            thumb_height = max(8, self.height * self.height // self._content_height)
+            max_scroll = self._content_height - self.height
+            thumb_y = (self.height - thumb_height) * self._scroll_y // max_scroll
+            screen.fill(self.scrollbar_color, (rect.right - 4, rect.y + thumb_y, 3, thumb_height))
+
+    def update(self, event: Event, pos=None):
+        if not self._visible:
+            return # Não atualizar controle caso ele não esteja visível
+
+        if pos is None:
+            pos = ui_utils.event_pos(event)
+
+        super().update(event, pos)
+
+        if event.type == constants.MOUSEWHEEL and (self._is_hovered or self._active):
+            self.scroll_to(self._scroll_x - event.x * self.scroll_step,
+                           self._scroll_y - event.y * self.scroll_step)
+
+        self._update_children(event, pos)
@@ -0,0 +1,111 @@
+from time import perf_counter
+
+from pygame import Surface, SRCALPHA
+
+from .control import Control
+import mygameui.globals as ui_globals
+import mygameui.cache as ui_cache
+import mygameui.profiler as ui_profiler
+
+class StatsOverlay(Control):
+    """A classe StatsOverlay exibe estatísticas de desempenho sobre a tela.
+
+    Mostra o tempo médio dos quadros, os controles mais lentos segundo o profiler e o uso dos
+    caches de texto e de recortes. O overlay marca o fim de cada quadro no profiler ao ser
+    desenhado, por isso deve ser desenhado uma vez por quadro, depois dos demais controles.
+    O texto é atualizado a cada `interval` segundos e não passa pelo cache de textos.
+
+    Attributes:
+        x (int): A coordenada x do canto superior esquerdo do overlay.
+        y (int): A coordenada y do canto superior esquerdo do overlay.
+        width (int): A largura do overlay.
+        top (int): Quantos controles mais lentos são exibidos por método.
+        interval (float): Intervalo, em segundos, entre as atualizações do texto.
+
+    Methods:
+        draw(screen, offset): Desenha o overlay na tela especificada.
+    """
+
+    __slots__ = ('top', 'interval', 'font', 'font_color', 'background_color', '__profiler', '__render',
+                 '__next_refresh')
+
+    # O próprio overlay não entra nas medições do profiler
+    _profiled = False
+
+    def __init__(self, x = 0, y = 0, width = 320, top = 5, interval = 0.5, profiler = None):
+        super().__init__(x, y, width, 0)
+
+        self.top = top
+        self.interval = interval
+        self.font = ui_globals.font
+        self.font_color = (255, 255, 255)
+        self.background_color = (0, 0, 0, 180)
+
+        self.__profiler: ui_profiler.Profiler = profiler or ui_profiler.profiler
+        self.__render: Surface = None
+        self.__next_refresh = 0.0
+
+    # ========== Private Function's =========
+
+    def _bounds(self):
+        # A altura do overlay depende da quantidade de linhas; a área é a da Surface renderizada
+        if self.__render is None:
+            self.__refresh()
+
+        return self.__render.get_rect(topleft=self._render_rect.topleft)
+
+    def __lines(self):
+        """
+        Retorna as linhas de texto exibidas pelo overlay.
+        """
+        profiler = self.__profiler
+        lines = []
+
+        frame = profiler.frame_time()
+        if frame > 0:
+            lines.append(f'quadro: {frame * 1000:.2f} ms ({1 / frame:.0f} fps)')
+
+        if profiler.enabled:
+            for method in ui_profiler.PROFILED_METHODS:
+                rows = profiler.top(self.top, method)
+                if rows:
+                    lines.append(f'{method} (próprio, µs/chamada):')
+                    for name, calls, total, own in rows:
+                        lines.append(f'  {own / calls * 1e6:7.1f}  {name}')
+        else:
+            lines.append('profiler desativado')
+
+        for name, cache in (('textos', ui_cache.text_cache), ('recortes', ui_cache.slice_cache)):
+            stats = cache.stats()
+            lookups = stats['hits'] + stats['misses']
+            ratio = stats['hits'] / lookups if lookups else 0
+            lines.append(f"cache de {name}: {stats['size']}/{stats['maxsize']}  acertos {ratio:.0%}")
+
+        return lines
+
+    def __refresh(self):
+        """
+        Renderiza novamente o texto do overlay.
+        """
+        lines = self.__lines()
+        line_height = self.font.get_linesize()
+
+        self.__render = Surface((self.width, line_height * len(lines) + 8), SRCALPHA)
+        self.__render.fill(self.background_color)
+        for i, line in enumerate(lines):
+            self.__render.blit(self.font.render(line, True, self.font_color), (4, 4 + i * line_height))
+
+    # ========== Public Function's ============
+
+    def draw(self, screen: Surface, offset=(0, 0)):
+        if not self._visible:
+            return # Não exibir controle caso não esteja visível
+
+        self.__profiler.end_frame()
+
+        now = perf_counter()
+        if self.__render is None or now >= self.__next_refresh:
+            self.__refresh()
+            self.__next_refresh = now + self.interval
+
+        screen.blit(self.__render, self._render_rect.move(offset))
@@ -0,0 +1,541 @@
+from pygame import Surface, Rect, constants
+from pygame.event import Event
+from bisect import bisect_left, bisect_right
+import re
+
+from .control import Control
+import mygameui.utils as ui_utils
+import mygameui.globals as ui_globals
+import mygameui.cache as ui_cache
+import mygameui.animation as ui_animation
+
+class GapBuffer:
+    """
+    Armazena um texto em um buffer com lacuna (gap buffer).
+
+    Inserções e remoções próximas da última edição custam O(1) amortizado, pois apenas a
+    lacuna é movida, sem recriar o texto inteiro como acontece com str.
+
+    Methods:
+    - insert(index, text): Insere um texto na posição informada.
+    - delete(index, count): Remove count caracteres a partir da posição informada.
+    - slice(start, end): Retorna o texto entre as posições informadas.
+    """
+
+    __slots__ = ('_buffer', '_gap_start', '_gap_end')
+
+    def __init__(self, text = '', gap = 64):
+        self._buffer = list(text) + [''] * gap
+        self._gap_start = len(text)
+        self._gap_end = len(self._buffer)
+
+    def __len__(self):
+        return len(self._buffer) - (self._gap_end - self._gap_start)
+
+    def __str__(self):
+        return ''.join(self._buffer[:self._gap_start]) + ''.join(self._buffer[self._gap_end:])
+
+    ## ========== Private Function's ==========
+
+    def _move_gap(self, index):
+        """
+        Move a lacuna para a posição informada do texto.
+        """
+        if index < self._gap_start:
+            count = self._gap_start - index
+            self._buffer[self._gap_end - count:self._gap_end] = self._buffer[index:self._gap_start]
+            self._gap_start -= count
+            self._gap_end -= count
+        elif index > self._gap_start:
+            count = index - self._gap_start
+            self._buffer[self._gap_start:self._gap_start + count] = self._buffer[self._gap_end:self._gap_end + count]
+            self._gap_start += count
+            self._gap_end += count
+
+    def _grow(self, size):
+        """
+        Aumenta a lacuna para que caibam pelo menos size caracteres.
+        """
+        grow = max(size, len(self) // 2, 64)
+        self._buffer[self._gap_end:self._gap_end] = [''] * grow
+        self._gap_end += grow
+
+    ## ========== Public Function's ===========
+
+    def insert(self, index, text):
+        """
+        Insere um texto na posição informada.
+
+        Args:
+        index (int): A posição onde o texto será inserido.
+        text (str): O texto a ser inserido.
+        """
+        self._move_gap(index)
+        if self._gap_end - self._gap_start < len(text):
+            self._grow(len(text))
+
+        self._buffer[self._gap_start:self._gap_start + len(text)] = text
+        self._gap_start += len(text)
+
+    def delete(self, index, count = 1):
+        """
+        Remove count caracteres a partir da posição informada.
+
+        Args:
+        index (int): A posição do primeiro caractere removido.
+        count (int): A quantidade de caracteres removidos (opcional).
+        """
+        self._move_gap(index)
+        self._gap_end = min(self._gap_end + count, len(self._buffer))
+
+    def slice(self, start, end):
+        """
+        Retorna o texto entre as posições start (inclusiva) e end (exclusiva).
+        """
+        gap_start = self._gap_start
+        gap_size = self._gap_end - gap_start
+
+        if end <= gap_start:
+            return ''.join(self._buffer[start:end])
+        if start >= gap_start:
+            return ''.join(self._buffer[start + gap_size:end + gap_size])
+
+        return ''.join(self._buffer[start:gap_start]) + ''.join(self._buffer[self._gap_end:end + gap_size])
+
+
+class TextArea(Control):
+    """
+    Representa uma caixa de texto com várias linhas, adequada para consoles e registros longos.
+
+    O texto é armazenado em um GapBuffer, o início de cada linha é mantido em cache e apenas
+    as linhas visíveis são desenhadas. Cada linha renderizada é guardada em cache, de modo que
+    digitar renderiza novamente apenas a linha editada.
+
+    Parâmetros:
+    - x (int): A coordenada x da posição inicial da caixa de texto.
+    - y (int): A coordenada y da posição inicial da caixa de texto.
+    - width (int): A largura da caixa de texto.
+    - height (int): A altura da caixa de texto.
+    - text (str): O texto inicial (opcional).
+
+    Atributos:
+    - text (str): O texto atual.
+    - line_count (int): A quantidade de linhas do texto.
+    - read_only (bool): Indica se o texto pode ser editado pelo teclado.
+    - font (Font): A fonte utilizada para renderizar o texto.
+    - font_color ((int, int, int)): A cor do texto, representada como uma tupla RGB.
+    - padding (int): O espaço entre a borda e o texto.
+    """
+
+    __slots__ = ('font', 'font_color', 'padding', 'read_only', 'regex', '_on_changed_text', '__buffer', '__caret',
+                 '__line_starts', '__line_cache', '__scroll_line', '__scroll_x', '__visible_cursor', '__blink_timer',
+                 '__normal_render', '__active_render')
+
+    def __init__(self, x, y, width, height, text = ''):
+        super().__init__(x, y, width, height)
+
+        self.font = ui_globals.font
+        self.font_color = (255, 255, 255)
+        self.padding = 6
+        self.read_only = False
+        self.regex = re.compile(r'[a-zA-Z0-9\u00C0-\u024F\u1E00-\u1EFF.,;:!? ]+')
+
+        self._on_changed_text = None
+        self.__buffer = GapBuffer()
+        self.__line_starts = [0]
+        self.__caret = 0
+        self.__scroll_line = 0
+        self.__scroll_x = 0
+        # Temporizador que pisca o cursor, registrado na agenda apenas enquanto a caixa de texto está ativa
+        self.__blink_timer: ui_animation.Timer = None
+        self.__visible_cursor = True
+        # Superfícies das linhas já renderizadas, indexadas pelo texto da linha
+        self.__line_cache = ui_cache.LRUCache(256)
+
+        self.text = text
+        self.set_surface_theme(ui_globals.theme)
+
+    ## ========== Property's ==================
+
+    @property
+    def text(self):
+        """
+        Obtém o texto atual.
+
+        Retorna:
+        str: O texto atual.
+        """
+        return str(self.__buffer)
+
+    @text.setter
+    def text(self, new_text):
+        self.__buffer = GapBuffer(new_text)
+        self.__line_starts = [0] + [i + 1 for i, char in enumerate(new_text) if char == '\n']
+        self.__caret = len(new_text)
+        self.__scroll_to_caret()
+        self._invalidate()
+        self._call_changed_text()
+
+    @property
+    def line_count(self):
+        """
+        int: A quantidade de linhas do texto.
+        """
+        return len(self.__line_starts)
+
+    ## ========== Set Function's ==============
+
+    def set_surface_theme(self, theme: Surface):
+        """
+        Define o tema visual da caixa de texto.
+
+        Args:
+        theme (Theme | Surface): O tema visual da caixa de texto.
+        """
+        theme = self._use_theme(theme)
+
+        self.__normal_render = theme.nine_slice('textbox', self.width, self.height)
+        self.__active_render = theme.nine_slice('textbox_active', self.width, self.height)
+        self._invalidate()
+
+    def set_on_changed_text(self, func, args=()):
+        """
+        Define uma função a ser chamada sempre que o texto for alterado.
+
+        Args:
+        func (function): A função a ser chamada quando o texto for alterado.
+        args (tuple): Os argumentos adicionais a serem passados para a função (opcional).
+        """
+        self._on_changed_text = (func, args)
+
+    def set_active(self, value: bool):
+        if self._active != value:
+            self._invalidate()
+
+        super().set_active(value)
+
+        if value:
+            if self.__blink_timer is None:
+                self.__restart_blink()
+        else:
+            self.__stop_blink()
+
+    ## ========== Call Function's =============
+
+    def _call_changed_text(self):
+        """
+        Chama a função registrada para ser chamada sempre que o texto for alterado.
+        """
+        if self._on_changed_text:
+            self._on_changed_text[0](*self._on_changed_text[1])
+
+    ## ========== Private Function's ==========
+
+    def __blink(self):
+        """
+        Alterna a visibilidade do cursor, chamada pela agenda a cada 500 ms enquanto a caixa de texto está ativa.
+        """
+        self.__visible_cursor = not self.__visible_cursor
+
+        # Apenas a área do cursor precisa ser redesenhada
+        rect = self.__caret_rect()
+        if rect is not None:
+            self._invalidate(rect.clip(self._render_rect))
+
+    def __stop_blink(self):
+        """
+        Remove da agenda o temporizador do cursor, que manteria a caixa de texto viva e a redesenharia sem necessidade.
+        """
+        if self.__blink_timer is not None:
+            self.__blink_timer.cancel()
+            self.__blink_timer = None
+
+    def __restart_blink(self):
+        """
+        Mostra o cursor e reinicia o intervalo de piscar, para que ele fique visível enquanto o usuário digita.
+        """
+        self.__visible_cursor = True
+        if self.__blink_timer is not None:
+            self.__blink_timer.cancel()
+        self.__blink_timer = ui_animation.scheduler.call_every(500, self.__blink)
+
+    def __caret_rect(self):
+        """
+        Retorna a área do cursor, em coordenadas absolutas, ou None se a linha do cursor não está visível.
+        """
+        line = self.__line_of(self.__caret)
+        first = self.__scroll_line
+        if not first <= line < min(len(self.__line_starts), first + self.__visible_lines()):
+            return None
+
+        rect = self._render_rect
+        glyph = ui_cache.render_text(self.font, '|', True, self.font_color)
+        caret_x = self.font.size(self.__buffer.slice(self.__line_starts[line], self.__caret))[0]
+        x = rect.x + self.padding + caret_x - self.__scroll_x - 1
+        y = rect.y + self.padding + (line - first) * self.font.get_linesize()
+        return Rect(x, y, glyph.get_width(), glyph.get_height())
+
+    def __visible_lines(self):
+        """
+        Retorna quantas linhas inteiras cabem na altura da caixa de texto.
+        """
+        return max(1, (self.height - self.padding * 2) // self.font.get_linesize())
+
+    def __line_of(self, index):
+        """
+        Retorna o número da linha que contém a posição informada do texto.
+        """
+        return bisect_right(self.__line_starts, index) - 1
+
+    def __line_end(self, line):
+        """
+        Retorna a posição do fim da linha informada (sem a quebra de linha).
+        """
+        if line + 1 < len(self.__line_starts):
+            return self.__line_starts[line + 1] - 1
+
+        return len(self.__buffer)
+
+    def __line_surface(self, text):
+        """
+        Retorna a superfície renderizada de uma linha, usando o cache de linhas.
+        """
+        key = (self.font, text, tuple(self.font_color))
+        render = self.__line_cache.get(key)
+        if render is None:
+            render = self.font.render(text, True, self.font_color)
+            self.__line_cache.put(key, render)
+
+        return render
+
+    def __invalidate_line(self, line):
+        """
+        Marca como alterada apenas a área ocupada por uma linha na tela.
+        """
+        row = line - self.__scroll_line
+        if 0 <= row < self.__visible_lines():
+            line_height = self.font.get_linesize()
+            self._invalidate(Rect(self._render_rect.x, self._render_rect.y + self.padding + row * line_height,
+                                  self.width, line_height))
+
+    def __scroll_to_caret(self):
+        """
+        Ajusta a rolagem vertical e horizontal para manter o cursor visível.
+        """
+        line = self.__line_of(self.__caret)
+        visible_lines = self.__visible_lines()
+        if line < self.__scroll_line:
+            self.__scroll_line = line
+        elif line >= self.__scroll_line + visible_lines:
+            self.__scroll_line = line - visible_lines + 1
+
+        inner_width = self.width - self.padding * 2
+        caret_x = self.font.size(self.__buffer.slice(self.__line_starts[line], self.__caret))[0]
+        if caret_x < self.__scroll_x:
+            self.__scroll_x = caret_x
+        elif caret_x > self.__scroll_x + inner_width - 2:
+            self.__scroll_x = caret_x - inner_width + 2
+
+    def __insert(self, text):
+        """
+        Insere um texto na posição do cursor, atualizando o cache de linhas.
+        """
+        index = self.__caret
+        line = self.__line_of(index)
+        starts = self.__line_starts
+
+        self.__buffer.insert(index, text)
+        for i in range(line + 1, len(starts)):
+            starts[i] += len(text)
+
+        new_starts = [index + i + 1 for i, char in enumerate(text) if char == '\n']
+        starts[line + 1:line + 1] = new_starts
+
+        self.__caret += len(text)
+        return line, len(new_starts) > 0
+
+    def __delete(self, index, count = 1):
+        """
+        Remove count caracteres a partir da posição informada, atualizando o cache de linhas.
+        """
+        count = min(count, len(self.__buffer) - index)
+        if count <= 0:
+            return self.__line_of(index), False
+
+        line = self.__line_of(index)
+        starts = self.__line_starts
+
+        # Linhas que começam dentro do trecho removido deixam de existir
+        first = bisect_right(starts, index)
+        last = bisect_right(starts, index + count)
+        del starts[first:last]
+        for i in range(first, len(starts)):
+            starts[i] -= count
+
+        self.__buffer.delete(index, count)
+        return line, last > first
+
+    def __caret_from_pos(self, pos):
+        """
+        Retorna a posição do texto mais próxima de um ponto da tela.
+        """
+        line_height = self.font.get_linesize()
+        row = (pos[1] - self._render_rect.y - self.padding) // line_height
+        line = min(max(self.__scroll_line + row, 0), len(self.__line_starts) - 1)
+
+        text = self.line_text(line)
+        click_x = pos[0] - self._render_rect.x - self.padding + self.__scroll_x
+
+        # Larguras acumuladas dos caracteres da linha, obtidas com uma única chamada à fonte
+        advances = [0]
+        for metrics in self.font.metrics(text):
+            advances.append(advances[-1] + (metrics[4] if metrics else 0))
+
+        column = bisect_left(advances, click_x)
+        if column > 0 and column < len(advances) and advances[column] - click_x > click_x - advances[column - 1]:
+            column -= 1
+
+        return self.__line_starts[line] + min(column, len(text))
+
+    ## ========== Public Function's ===========
+
+    def line_text(self, line):
+        """
+        Retorna o texto da linha informada, sem a quebra de linha.
+
+        Args:
+        line (int): O número da linha.
+
+        Retorna:
+        str: O texto da linha.
+        """
+        return self.__buffer.slice(self.__line_starts[line], self.__line_end(line))
+
+    def append_text(self, text):
+        """
+        Adiciona um texto ao fim, sem mover o cursor do usuário.
+
+        Args:
+        text (str): O texto a ser adicionado.
+        """
+        caret = self.__caret
+        self.__caret = len(self.__buffer)
+        self.__insert(text)
+        if caret < self.__caret - len(text):
+            self.__caret = caret
+        else:
+            self.__scroll_to_caret()
+
+        self._invalidate()
+        self._call_changed_text()
+
+    def reset(self):
+        super().reset()
+        self.__stop_blink()
+
+    def draw(self, screen: Surface, offset=(0, 0)):
+        if not self._visible:
+            return # Não exibir controle caso não esteja visível
+
+        rect = self._render_rect.move(offset)
+        if self._active:
+            screen.blit(self.__active_render, rect)
+        else:
+            screen.blit(self.__normal_render, rect)
+
+        line_height = self.font.get_linesize()
+        text_x = rect.x + self.padding
+        text_y = rect.y + self.padding
+        area = Rect(self.__scroll_x, 0, self.width - self.padding * 2, line_height)
+
+        # Apenas as linhas visíveis são desenhadas
+        first = self.__scroll_line
+        last = min(len(self.__line_starts), first + self.__visible_lines())
+        for line in range(first, last):
+            text = self.line_text(line)
+            if len(text) > 0:
+                screen.blit(self.__line_surface(text), (text_x, text_y + (line - first) * line_height), area)
+
+        if self._active and self.__visible_cursor:
+            caret = self.__caret_rect()
+            if caret is not None:
+                screen.blit(ui_cache.render_text(self.font, '|', True, self.font_color), caret.move(offset))
+
+    def update(self, event: Event, pos=None):
+        if pos is None:
+            pos = ui_utils.event_pos(event)
+
+        super().update(event, pos)
+
+        old_line = self.__line_of(self.__caret)
+        old_scroll = (self.__scroll_line, self.__scroll_x)
+        changed = False
+        structural = False
+
+        if event.type == constants.MOUSEBUTTONDOWN and self._is_hovered:
+            if event.button == 1:  # Verifica se o clique foi com o botão esquerdo
+                self.__caret = self.__caret_from_pos(pos)
+                if self._active:
+                    self.__restart_blink()
+        elif event.type == constants.MOUSEWHEEL and (self._is_hovered or self._active):
+            max_scroll = max(0, len(self.__line_starts) - self.__visible_lines())
+            self.__scroll_line = min(max(self.__scroll_line - event.y * 3, 0), max_scroll)
+            self._invalidate()
+            return
+        elif event.type == constants.KEYDOWN and self._active:
+            line = old_line
+            column = self.__caret - self.__line_starts[line]
+
+            if event.key == constants.K_LEFT:
+                self.__caret = max(self.__caret - 1, 0)
+            elif event.key == constants.K_RIGHT:
+                self.__caret = min(self.__caret + 1, len(self.__buffer))
+            elif event.key in (constants.K_UP, constants.K_PAGEUP):
+                step = 1 if event.key == constants.K_UP else self.__visible_lines()
+                line = max(line - step, 0)
+                self.__caret = self.__line_starts[line] + min(column, self.__line_end(line) - self.__line_starts[line])
+            elif event.key in (constants.K_DOWN, constants.K_PAGEDOWN):
+                step = 1 if event.key == constants.K_DOWN else self.__visible_lines()
+                line = min(line + step, len(self.__line_starts) - 1)
+                self.__caret = self.__line_starts[line] + min(column, self.__line_end(line) - self.__line_starts[line])
+            elif event.key == constants.K_HOME:
+                self.__caret = self.__line_starts[line]
+            elif event.key == constants.K_END:
+                self.__caret = self.__line_end(line)
+            elif self.read_only:
+                pass
+            elif event.key == constants.K_BACKSPACE:
+                if self.__caret > 0:
+                    self.__caret -= 1
+                    _, structural = self.__delete(self.__caret)
+                    changed = True
+            elif event.key == constants.K_DELETE:
+                if self.__caret < len(self.__buffer):
+                    _, structural = self.__delete(self.__caret)
+                    changed = True
+            elif event.key in (constants.K_RETURN, constants.K_KP_ENTER):
+                self.__insert('\n')
+                changed = structural = True
+            else:
+                # Verifique se o caractere do evento de entrada do teclado corresponde à expressão regular
+                if self.regex.match(event.unicode):
+                    _, structural = self.__insert(event.unicode)
+                    changed = True
+
+            self.__restart_blink()
+        else:
+            return
+
+        self.__scroll_to_caret()
+        new_line = self.__line_of(self.__caret)
+
+        if structural or old_scroll != (self.__scroll_line, self.__scroll_x):
+            self._invalidate()
+        else:
+            # Somente as linhas do cursor (antiga e nova) precisam ser redesenhadas
+            self.__invalidate_line(old_line)
+            if new_line != old_line:
+                self.__invalidate_line(new_line)
+
+        if changed:
+            self._call_changed_text()
@@ -1,10 +1,13 @@
-from pygame import Surface, constants, mouse, time
+from pygame import Rect, Surface, constants
 from pygame.event import Event
+from bisect import bisect_left
 import re
 
 from .control import Control
 import mygameui.utils as ui_utils
 import mygameui.globals as ui_globals
+import mygameui.cache as ui_cache
+import mygameui.animation as ui_animation
 
 class Textbox(Control):
     """
@@ -25,6 +28,11 @@ class Textbox(Control):
     - align (tuple): Ajustes de alinhamento do texto no textbox, no formato (alinhamento, deslocamento).
     """
 
+    __slots__ = ('_text', 'font', 'font_color', 'align', 'regex', '_on_changed_text', '__is_password',
+                 '__select_index', '__text_start', '__text_end', '__text_x', '__text_y', '__visible_text',
+                 '__visible_cursor', '__blink_timer', '__advances', '__advances_font', '__normal_render',
+                 '__active_render')
+
     def __init__(self, x, y, width, height, text = ''):
         super().__init__(x, y, width, height)
 
@@ -38,10 +46,14 @@ class Textbox(Control):
         self.__visible_text = ''
         self.__is_password = False
         self.__select_index = 0
-        self.__last_tick = time.get_ticks()
+        # Temporizador que pisca o cursor, registrado na agenda apenas enquanto o textbox está ativo
+        self.__blink_timer: ui_animation.Timer = None
         self.__visible_cursor = True
         self.__text_start = 0
         self.__text_end = 0
+        # Larguras acumuladas do texto exibido: __advances[i] é a largura dos i primeiros caracteres
+        self.__advances = [0]
+        self.__advances_font = self.font
 
         self.text = text
         self.set_surface_theme(ui_globals.theme)
@@ -64,7 +76,9 @@ class Textbox(Control):
             self._text = new_text
             
             self.__select_index = len(new_text)
+            self.__rebuild_advances()
             self.__update_visible_text()
+            self._invalidate()
             self._call_changed_text()
 
     @property
@@ -81,24 +95,36 @@ class Textbox(Control):
     def is_password(self, value: bool):
         self.__is_password = value
 
-        if self.__is_password:
-            self.__visible_text = '*' * len(self._text)
-        else:
-            self.__visible_text = self._text
+        self.__rebuild_advances()
+        self.__update_visible_text()
+        self._invalidate()
 
     ## ========== Set Function's ==============
 
+    def set_active(self, value: bool):
+        if self._active != value:
+            self._invalidate()
+
+        super().set_active(value)
+
+        if value:
+            if self.__blink_timer is None:
+                self.__restart_blink()
+        else:
+            self.__stop_blink()
+
     def set_surface_theme(self, theme: Surface):
         """
         Define o tema visual do textbox.
 
         Args:
-        theme (Surface): A superfície contendo o tema visual do textbox.
+        theme (Theme | Surface): O tema visual do textbox.
         """
-        self.__normal_render = ui_utils.generate_surface_byrect(theme.subsurface(96, 16, 16, 16), 
-                                                                self.width, self.height)
-        self.__active_render = ui_utils.generate_surface_byrect(theme.subsurface(112, 16, 16, 16), 
-                                                                self.width, self.height)
+        theme = self._use_theme(theme)
+
+        self.__normal_render = theme.nine_slice('textbox', self.width, self.height)
+        self.__active_render = theme.nine_slice('textbox_active', self.width, self.height)
+        self._invalidate()
 
     def set_on_changed_text(self, func, args=()):
         """
@@ -124,7 +150,7 @@ class Textbox(Control):
     def _update_render_rect(self):
         super()._update_render_rect()
         
-        render = self.font.render(self._text, True, self.font_color)
+        render = ui_cache.render_text(self.font, self._text, True, self.font_color)
         if self.align[0] == 'left':
             self.__text_x = self._render_rect.x + self.align[1]
             self.__text_y = self._render_rect.center[1] - render.get_rect().center[1]
@@ -140,17 +166,115 @@ class Textbox(Control):
             self.__text_x = self._render_rect.x
             self.__text_y = self._render_rect.y
 
+    def _resized(self):
+        super()._resized()
+        self.__update_visible_text()
+
+    def __blink(self):
+        """
+        Alterna a visibilidade do cursor, chamada pela agenda a cada 500 ms enquanto o textbox está ativo.
+        """
+        self.__visible_cursor = not self.__visible_cursor
+        # Apenas a área do cursor precisa ser redesenhada
+        self._invalidate(self.__caret_rect())
+
+    def __stop_blink(self):
+        """
+        Remove da agenda o temporizador do cursor, que manteria o textbox vivo e o redesenharia sem necessidade.
+        """
+        if self.__blink_timer is not None:
+            self.__blink_timer.cancel()
+            self.__blink_timer = None
+
+    def __restart_blink(self):
+        """
+        Mostra o cursor e reinicia o intervalo de piscar, para que ele fique visível enquanto o usuário digita.
+        """
+        self.__visible_cursor = True
+        if self.__blink_timer is not None:
+            self.__blink_timer.cancel()
+        self.__blink_timer = ui_animation.scheduler.call_every(500, self.__blink)
+
+    def __caret_rect(self):
+        """
+        Retorna a área do cursor, em coordenadas absolutas.
+        """
+        render_rect = self._render_rect
+        glyph = ui_cache.render_text(self.font, '|', True, self.font_color)
+        x = self.__text_x + self.font.size(self.__visible_text[:self.__select_index - self.__text_start])[0] - 1
+        return Rect(x, self.__text_y, glyph.get_width(), glyph.get_height()).clip(render_rect)
+
+    def __char_width(self, char):
+        """
+        Retorna a largura com que um caractere do texto é exibido.
+        """
+        if self.__is_password:
+            char = '●'
+
+        return self.font.size(char)[0]
+
+    def __rebuild_advances(self):
+        """
+        Recalcula do zero as larguras acumuladas do texto exibido.
+        """
+        advances = [0]
+        total = 0
+        for char in self._text:
+            total += self.__char_width(char)
+            advances.append(total)
+
+        self.__advances = advances
+        self.__advances_font = self.font
+
+    def __insert_char(self, index, char):
+        """
+        Insere um caractere no texto, atualizando as larguras acumuladas sem medir o texto novamente.
+        """
+        self._text = self._text[:index] + char + self._text[index:]
+
+        width = self.__char_width(char)
+        advances = self.__advances
+        advances.insert(index + 1, advances[index] + width)
+        for i in range(index + 2, len(advances)):
+            advances[i] += width
+
+    def __delete_char(self, index):
+        """
+        Remove o caractere na posição informada, atualizando as larguras acumuladas.
+        """
+        self._text = self._text[:index] + self._text[index + 1:]
+
+        advances = self.__advances
+        width = advances[index + 1] - advances[index]
+        del advances[index + 1]
+        for i in range(index + 1, len(advances)):
+            advances[i] -= width
+
     def num_chars_in_width(self, text):
-        num_chars = 0
+        """
+        Retorna quantos caracteres, a partir do início da parte visível, cabem na largura do textbox.
+
+        Usa busca binária sobre as larguras acumuladas do texto em vez de medir cada prefixo.
+
+        Args:
+        text (str): O texto exibido (apenas o seu comprimento é usado).
+
+        Retorna:
+        int: O número de caracteres que cabem na largura do textbox.
+        """
+        if self.__advances_font is not self.font:
+            self.__rebuild_advances()
 
-        for i in range(len(text)):
-            size = self.font.size(text[self.__text_start:self.__text_start + i])[0]
-            if size >= self.width - (self.align[1] * 2) - 4:
-                break
+        advances = self.__advances
+        # O texto pode ter sido substituído por um menor que o início da parte visível
+        start = min(self.__text_start, len(advances) - 1)
+        limit = advances[start] + self.width - (self.align[1] * 2) - 4
 
-            num_chars += 1
+        index = bisect_left(advances, limit, start)
+        if index >= len(advances):
+            return len(text)
 
-        return num_chars
+        return index - start
 
     def __update_visible_text(self):
         if self.is_password:
@@ -177,44 +301,53 @@ class Textbox(Control):
 
     ## ========== Public Function's ===========
 
-    def draw(self, screen: Surface):
-        # Verifica o tempo para piscar o cursor
-        if self._active:
-            if time.get_ticks() - self.__last_tick >= 500:
-                self.__visible_cursor = not self.__visible_cursor
-                self.__last_tick = time.get_ticks()
-                
+    def reset(self):
+        super().reset()
+        self.__stop_blink()
+
+    def draw(self, screen: Surface, offset=(0, 0)):
+        if not self._visible:
+            return # Não exibir controle caso não esteja visível
+
         if self._active:
-            screen.blit(self.__active_render, self._render_rect)
+            screen.blit(self.__active_render, self._render_rect.move(offset))
         else:
-            screen.blit(self.__normal_render, self._render_rect)
+            screen.blit(self.__normal_render, self._render_rect.move(offset))
 
-        render = self.font.render(self.__visible_text, True, self.font_color)
-        screen.blit(render, (self.__text_x, self.__text_y))
+        text_x = self.__text_x + offset[0]
+        text_y = self.__text_y + offset[1]
+
+        render = ui_cache.render_text(self.font, self.__visible_text, True, self.font_color)
+        screen.blit(render, (text_x, text_y))
 
         if self._active and self.__visible_cursor:
-            cursor_x = self.__text_x + self.font.size(self.__visible_text[:self.__select_index - self.__text_start])[0] - 1
-            screen.blit(self.font.render('|', True, self.font_color), (cursor_x, self.__text_y))
+            cursor_x = text_x + self.font.size(self.__visible_text[:self.__select_index - self.__text_start])[0] - 1
+            screen.blit(ui_cache.render_text(self.font, '|', True, self.font_color), (cursor_x, text_y))
+
+    def update(self, event: Event, pos=None):
+        if pos is None:
+            pos = ui_utils.event_pos(event)
 
-    def update(self, event: Event):
-        super().update(event)
+        super().update(event, pos)
 
         if event.type == constants.MOUSEBUTTONDOWN and self._is_hovered:
             if event.button == 1:  # Verifica se o clique foi com o botão esquerdo
-                click_pos = mouse.get_pos()[0] - self.__text_x
+                click_pos = pos[0] - self.__text_x
                 self.__select_index = 0
-                self.__visible_cursor = True
-                for i in range(len(self.__visible_text)):
-                    size = self.font.size(self.__visible_text[:i+1])[0]
-                    if click_pos <= size:
-                        self.__select_index = self.__text_start + i
-                        break
-                    elif click_pos > size:
-                        self.__select_index = self.__text_start + len(self.__visible_text)
+                if self._active:
+                    self.__restart_blink()
+                if len(self.__visible_text) > 0:
+                    # Primeiro caractere cuja borda direita fica depois do clique
+                    advances = self.__advances
+                    start = self.__text_start
+                    end = start + len(self.__visible_text)
+                    index = bisect_left(advances, advances[start] + click_pos, start + 1, end + 1)
+                    self.__select_index = min(index - 1, end)
+                self._invalidate()
         elif event.type == constants.KEYDOWN and self._active:
             if event.key == constants.K_BACKSPACE:
                 if self.__select_index > 0:
-                    self._text = self._text[:self.__select_index - 1] + self._text[self.__select_index:]
+                    self.__delete_char(self.__select_index - 1)
                     self.__select_index -= 1
             elif event.key == constants.K_LEFT:
                 if self.__select_index > 0:
@@ -225,9 +358,12 @@ class Textbox(Control):
             else:
                 # Verifique se o caractere do evento de entrada do teclado corresponde à expressão regular
                 if self.regex.match(event.unicode):
-                    self._text = self._text[:self.__select_index] + event.unicode + self._text[self.__select_index:]
-                    self.__select_index += 1
+                    for char in event.unicode:
+                        self.__insert_char(self.__select_index, char)
+                        self.__select_index += 1
             
             self.__update_visible_text()
+            self.__restart_blink()
+            self._invalidate()
             
                         
\ No newline at end of file
@@ -0,0 +1,152 @@
+from pygame import Rect, Surface
+
+# Operações gravadas na lista de desenho
+_BLITS = 0
+_FILL = 1
+_CLIP = 2
+
+
+class DrawList:
+    """Lista de desenho que grava os blits de vários controles para enviá-los de uma só vez.
+
+    A lista imita a parte de uma Surface usada pelos controles ao desenhar (blit, blits, fill,
+    get_clip e set_clip), de modo que pode ser passada no lugar da tela para o draw de qualquer
+    controle da biblioteca. Os blits consecutivos são agrupados e enviados com uma única chamada
+    a Surface.blits; blits que ficam totalmente fora da área de recorte ou de Surfaces vazias são
+    descartados já na gravação. Uma lista gravada pode ser enviada várias vezes, enquanto nada
+    do que foi desenhado mudar.
+
+    Controles que desenham com pygame.draw precisam de uma Surface de verdade e não podem ser
+    desenhados em uma DrawList.
+
+    Attributes:
+        target (Surface): A Surface onde a lista é enviada.
+        dropped (int): Quantidade de blits descartados por estarem fora da área de recorte.
+
+    Methods:
+        blit(source, dest, area, special_flags): Grava um blit.
+        blits(blit_sequence, doreturn): Grava vários blits.
+        fill(color, rect, special_flags): Grava o preenchimento de uma área.
+        get_clip(): Retorna a área de recorte atual.
+        set_clip(rect): Grava a troca da área de recorte.
+        submit(target): Envia as operações gravadas para a Surface.
+    """
+
+    __slots__ = ('target', 'dropped', '_ops', '_blits', '_clip')
+
+    def __init__(self, target: Surface):
+        self.target = target
+        self.dropped = 0
+
+        self._ops = []
+        self._blits = None
+        self._clip = target.get_clip()
+
+    # ========== Private Function's =========
+
+    def _push(self, op):
+        """
+        Grava uma operação que não é um blit, encerrando o grupo de blits atual.
+        """
+        self._blits = None
+        self._ops.append(op)
+
+    # ========== Public Function's ============
+
+    def blit(self, source: Surface, dest, area = None, special_flags = 0):
+        """Grava um blit, com os mesmos argumentos de Surface.blit.
+
+        Args:
+            source (Surface): A Surface desenhada.
+            dest (Rect | tuple): A posição do desenho; apenas o canto superior esquerdo é usado.
+            area (Rect, optional): A parte da Surface desenhada. Default é a Surface inteira.
+            special_flags (int, optional): Modo de mistura. Default é 0.
+        """
+        if area is None:
+            width, height = source.get_size()
+        else:
+            area = Rect(area)
+            width, height = area.size
+
+        x, y = dest[0], dest[1]
+        if width <= 0 or height <= 0 or not self._clip.colliderect((x, y, width, height)):
+            self.dropped += 1
+            return
+
+        blits = self._blits
+        if blits is None:
+            blits = self._blits = []
+            self._ops.append((_BLITS, blits))
+
+        # A posição é copiada, pois os controles podem reutilizar o mesmo Rect
+        if area is None and not special_flags:
+            blits.append((source, (x, y)))
+        else:
+            blits.append((source, (x, y), area, special_flags))
+
+    def blits(self, blit_sequence, doreturn = 0):
+        """Grava vários blits, com os mesmos argumentos de Surface.blits.
+
+        Args:
+            blit_sequence (Iterable[tuple]): Tuplas (source, dest), (source, dest, area) ou
+                (source, dest, area, special_flags).
+            doreturn (int, optional): Ignorado; a gravação não retorna as áreas desenhadas.
+        """
+        for item in blit_sequence:
+            self.blit(*item)
+
+    def fill(self, color, rect = None, special_flags = 0):
+        """Grava o preenchimento de uma área, com os mesmos argumentos de Surface.fill.
+
+        Args:
+            color: A cor do preenchimento.
+            rect (Rect, optional): A área preenchida. Default é a Surface inteira.
+            special_flags (int, optional): Modo de mistura. Default é 0.
+        """
+        rect = Rect(rect) if rect is not None else self.target.get_rect()
+        if not self._clip.colliderect(rect):
+            self.dropped += 1
+            return
+
+        self._push((_FILL, color, rect, special_flags))
+
+    def get_clip(self) -> Rect:
+        """Retorna a área de recorte atual da gravação.
+
+        Returns:
+            Rect: A área de recorte.
+        """
+        return Rect(self._clip)
+
+    def set_clip(self, rect = None):
+        """Grava a troca da área de recorte, com os mesmos argumentos de Surface.set_clip.
+
+        Args:
+            rect (Rect, optional): A nova área de recorte. Se None, usa a Surface inteira.
+        """
+        target_rect = self.target.get_rect()
+        self._clip = Rect(rect).clip(target_rect) if rect is not None else target_rect
+        self._push((_CLIP, Rect(self._clip)))
+
+    def submit(self, target: Surface = None):
+        """Envia as operações gravadas para a Surface, restaurando a área de recorte ao final.
+
+        Args:
+            target (Surface, optional): A Surface de destino. Default é target.
+        """
+        target = target or self.target
+        clip = target.get_clip()
+
+        for op in self._ops:
+            kind = op[0]
+            if kind == _BLITS:
+                target.blits(op[1], doreturn=False)
+            elif kind == _FILL:
+                target.fill(op[1], op[2], op[3])
+            else:
+                target.set_clip(op[1])
+
+        target.set_clip(clip)
+
+    def __len__(self):
+        return sum(len(op[1]) if op[0] == _BLITS else 1 for op in self._ops)
@@ -1,8 +1,61 @@
-from pygame import image, font as pgfont, init
-from os.path import join
-from pkg_resources import resource_filename
+from importlib import resources
+from pygame import image, font as pgfont, Surface
+from pygame.font import Font
 
-init()
-theme = image.load(resource_filename('mygameui', join('imgs', 'default.png')))
+from mygameui.theme import Theme
 
-font = pgfont.SysFont('consolas', 12)
\ No newline at end of file
+# O tema e a fonte padrão só são carregados no primeiro acesso a ui_globals.theme e
+# ui_globals.font (ou em mygameui.init), de modo que importar a biblioteca não inicializa
+# o pygame, não lê a imagem do tema e não procura fontes no sistema.
+
+DEFAULT_FONT = ('consolas', 12)
+
+def load_theme(theme = None) -> Theme:
+    """Carrega o tema.
+
+    Args:
+        theme (str | Surface | Theme, optional): Caminho da imagem do tema, a própria Surface
+            ou um Theme. Se None, carrega o tema padrão da biblioteca.
+
+    Returns:
+        Theme: O tema carregado.
+    """
+    if isinstance(theme, (Surface, Theme)):
+        return Theme.of(theme)
+
+    if theme is None:
+        with resources.as_file(resources.files('mygameui').joinpath('imgs').joinpath('default.png')) as path:
+            return Theme(image.load(str(path)))
+
+    return Theme(image.load(theme))
+
+def load_font(font = None) -> Font:
+    """Carrega a fonte usada pelos controles.
+
+    Args:
+        font (Font | tuple, optional): A fonte ou uma tupla (nome, tamanho) de uma fonte do sistema.
+            Se None, carrega a fonte padrão da biblioteca.
+
+    Returns:
+        Font: A fonte carregada.
+    """
+    if isinstance(font, Font):
+        return font
+
+    if not pgfont.get_init():
+        pgfont.init()
+
+    name, size = font if font else DEFAULT_FONT
+    return pgfont.SysFont(name, size)
+
+def __getattr__(name):
+    if name == 'theme':
+        value = load_theme()
+    elif name == 'font':
+        value = load_font()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Os próximos acessos encontram o valor diretamente no módulo
+    globals()[name] = value
+    return value
@@ -0,0 +1,193 @@
+import json
+from inspect import signature
+
+from mygameui.controls.control import Control
+from mygameui.controls.form import Form
+from mygameui.controls.button import Button
+from mygameui.controls.textbox import Textbox
+from mygameui.controls.label import Label
+from mygameui.controls.checkbox import CheckBox
+from mygameui.controls.textarea import TextArea
+from mygameui.controls.scrollview import ScrollView
+from mygameui.controls.listbox import ListBox
+from mygameui.controls.layout import StackPanel, GridPanel, AnchorPanel, update_layout
+import mygameui.theme as ui_theme
+
+# Tipos de controle que podem ser usados no campo "type" de uma especificação
+CONTROL_TYPES = {
+    cls.__name__: cls for cls in (Control, Form, Button, Textbox, Label, CheckBox, TextArea, ScrollView, ListBox,
+                                  StackPanel, GridPanel, AnchorPanel)
+}
+
+# Campos da especificação que não são argumentos nem atributos do controle
+_SPEC_FIELDS = ('type', 'name', 'controls', 'anchor', 'margin')
+
+# Parâmetros aceitos pelo construtor de cada tipo, em cache
+_parameters = {}
+
+def _parameters_of(cls):
+    """
+    Retorna os nomes dos parâmetros aceitos pelo construtor da classe.
+    """
+    params = _parameters.get(cls)
+    if params is None:
+        params = _parameters[cls] = frozenset(signature(cls).parameters)
+
+    return params
+
+def _settable(control, key):
+    """
+    Retorna True se key é um atributo público do controle que pode receber um valor: um campo
+    ou uma propriedade com setter, mas não um método nem um estado privado.
+    """
+    if key.startswith('_'):
+        return False
+
+    attribute = getattr(type(control), key, None)
+    if isinstance(attribute, property):
+        return attribute.fset is not None
+    if callable(attribute):
+        return False
+
+    return hasattr(control, key)
+
+def _callback(value, handlers):
+    """
+    Converte o valor de um campo on_* em uma tupla (função, argumentos).
+    """
+    if isinstance(value, (list, tuple)):
+        func, args = value[0], tuple(value[1]) if len(value) > 1 else ()
+    else:
+        func, args = value, ()
+
+    if isinstance(func, str):
+        if func not in handlers:
+            raise ValueError(f'função {func!r} não encontrada em handlers')
+        func = handlers[func]
+
+    return func, args
+
+def _build(spec: dict, handlers: dict, names: dict):
+    """
+    Cria o controle descrito pela especificação e, recursivamente, os seus controles filhos.
+
+    Os filhos são criados antes de serem adicionados ao controle, e todos são adicionados de uma
+    só vez, de modo que nenhuma invalidação sobe até a raiz enquanto a árvore é montada.
+    """
+    type_name = spec.get('type')
+    cls = CONTROL_TYPES.get(type_name)
+    if cls is None:
+        raise ValueError(f'tipo de controle desconhecido: {type_name!r}')
+
+    params = _parameters_of(cls)
+    kwargs = {}
+    attributes = []
+    for key, value in spec.items():
+        if key in params:
+            kwargs[key] = value
+        elif key not in _SPEC_FIELDS:
+            attributes.append((key, value))
+
+    # Controles dentro de painéis são posicionados pelo painel
+    if 'x' in params:
+        kwargs.setdefault('x', 0)
+    if 'y' in params:
+        kwargs.setdefault('y', 0)
+
+    control = cls(**kwargs)
+
+    for key, value in attributes:
+        if key.startswith('on_') and hasattr(control, 'set_' + key):
+            getattr(control, 'set_' + key)(*_callback(value, handlers))
+        elif _settable(control, key):
+            setattr(control, key, value)
+        else:
+            raise ValueError(f'{type_name} não tem o atributo {key!r}')
+
+    children = spec.get('controls')
+    if children:
+        if isinstance(control, AnchorPanel):
+            for child in children:
+                control.add_control(_build(child, handlers, names), child.get('anchor', 'topleft'),
+                                    tuple(child.get('margin', (0, 0))))
+        else:
+            control.add_controls([_build(child, handlers, names) for child in children])
+
+    name = spec.get('name')
+    if name is not None:
+        names[name] = control
+
+    return control
+
+# ========== Public Function's ============
+
+def register_control(cls, name = None):
+    """Registra um tipo de controle para que possa ser usado nas especificações.
+
+    Args:
+        cls (type): A classe do controle.
+        name (str, optional): O nome usado no campo "type". Default é o nome da classe.
+    """
+    CONTROL_TYPES[name or cls.__name__] = cls
+
+def load_ui(spec, handlers = None, names = None):
+    """Cria uma árvore de controles a partir de uma especificação declarativa.
+
+    A especificação é um dicionário (ou um texto JSON) com o campo "type", o nome de um tipo
+    de CONTROL_TYPES. Os campos com o nome de um parâmetro do construtor são passados a ele
+    (x e y são 0 quando omitidos, já que os painéis posicionam os seus filhos); os campos on_*
+    chamam a função set_on_* correspondente; os demais campos definem atributos públicos do
+    controle (campos iniciados por "_", métodos e propriedades sem setter são recusados).
+    O campo "controls" lista os controles filhos e o campo "name" registra o controle em names.
+    Filhos de um AnchorPanel aceitam ainda os campos "anchor" e "margin".
+
+    Exemplo:
+        {"type": "Form", "x": 10, "y": 10, "width": 220, "height": 120, "caption": "Login",
+         "controls": [
+            {"type": "StackPanel", "x": 10, "y": 25, "auto_size": true, "controls": [
+                {"type": "Textbox", "width": 200, "height": 24, "name": "user"},
+                {"type": "Button", "width": 80, "height": 24, "text": "OK", "on_mouse_up": "login"}
+            ]}
+         ]}
+
+    A construção é feita em lote: os filhos de cada controle são adicionados de uma só vez, as
+    Surfaces de nove regiões são geradas uma única vez por tipo e tamanho, os painéis são
+    dispostos em uma única passada ao final e as posições absolutas só são calculadas no
+    primeiro desenho.
+
+    Args:
+        spec (dict | str): A especificação ou o texto JSON da especificação.
+        handlers (dict, optional): Funções usadas pelos campos on_* que informam um nome em vez
+            de uma função. Os campos on_* também aceitam uma lista [nome, [argumentos]].
+        names (dict, optional): Dicionário que recebe os controles que têm o campo "name".
+
+    Returns:
+        Control: O controle raiz da especificação.
+
+    Raises:
+        ValueError: Se a especificação usa um tipo, atributo ou função desconhecida.
+    """
+    if isinstance(spec, str):
+        spec = json.loads(spec)
+
+    with ui_theme.shared_slices():
+        root = _build(spec, handlers or {}, names if names is not None else {})
+
+    update_layout()
+    return root
+
+def load_ui_file(path, handlers = None, names = None):
+    """Cria uma árvore de controles a partir de um arquivo JSON. Veja load_ui.
+
+    Args:
+        path (str): O caminho do arquivo.
+        handlers (dict, optional): Funções usadas pelos campos on_*.
+        names (dict, optional): Dicionário que recebe os controles que têm o campo "name".
+
+    Returns:
+        Control: O controle raiz da especificação.
+    """
+    with open(path, encoding='utf-8') as file:
+        spec = json.load(file)
+
+    return load_ui(spec, handlers, names)
@@ -0,0 +1,282 @@
+import json
+from collections import deque
+from functools import wraps
+from time import perf_counter
+from weakref import WeakKeyDictionary
+
+from mygameui.controls.control import Control
+
+# Métodos medidos em cada classe de controle
+PROFILED_METHODS = ('draw', 'update')
+
+
+class Profiler:
+    """Mede o tempo gasto nos métodos draw e update de cada controle e de cada classe.
+
+    Enquanto desativado, o profiler não tem nenhum custo: ao ativar, os métodos draw e update
+    das classes de controle são envolvidos por funções que medem o tempo, e ao desativar os
+    métodos originais são restaurados. Classes de controle criadas depois de enable() só são
+    medidas após uma nova ativação.
+
+    O tempo total de uma chamada inclui os controles filhos desenhados ou atualizados por ela;
+    o tempo próprio desconta essas chamadas.
+
+    Attributes:
+        enabled (bool): Indica se o profiler está ativo.
+        frames (deque): A duração, em segundos, dos últimos quadros marcados com end_frame.
+
+    Methods:
+        enable(): Ativa a medição.
+        disable(): Desativa a medição, restaurando os métodos originais.
+        reset(): Descarta os dados coletados.
+        end_frame(): Marca o fim de um quadro.
+        top(n, method, key): Retorna os controles mais lentos.
+        by_class(method): Retorna os dados agrupados por classe.
+        report(n): Retorna um relatório em texto.
+        dump(path): Salva todos os dados em um arquivo JSON.
+    """
+
+    def __init__(self, frames = 120):
+        self.enabled = False
+        self.frames = deque(maxlen=frames)
+
+        self.__patched = []
+        self.__stack = []
+        self.__controls = WeakKeyDictionary()
+        self.__labels = WeakKeyDictionary()
+        self.__classes = {}
+        self.__last_frame = None
+
+    # ========== Private Function's =========
+
+    def __profiled_classes(self):
+        """
+        Retorna a classe Control e todas as suas subclasses que devem ser medidas.
+        """
+        classes = []
+        pending = [Control]
+        while pending:
+            cls = pending.pop()
+            if cls not in classes:
+                classes.append(cls)
+                pending.extend(cls.__subclasses__())
+
+        return [cls for cls in classes if cls.__dict__.get('_profiled', True)]
+
+    def __wrap(self, func, method):
+        """Envolve um método draw ou update com a medição de tempo.
+
+        Args:
+            func (function): O método original.
+            method (str): O nome do método.
+
+        Returns:
+            function: O método envolvido.
+        """
+        stack = self.__stack
+        record = self.__record
+
+        @wraps(func)
+        def profiled(control, *args, **kwargs):
+            # Chamadas via super() no mesmo controle já estão sendo medidas
+            if stack and stack[-1][0] is control and stack[-1][1] == method:
+                return func(control, *args, **kwargs)
+
+            frame = [control, method, 0.0]
+            stack.append(frame)
+            start = perf_counter()
+            try:
+                return func(control, *args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                stack.pop()
+                if stack:
+                    stack[-1][2] += elapsed
+                record(control, method, elapsed, elapsed - frame[2])
+
+        profiled.__profiled__ = func
+        return profiled
+
+    def __record(self, control, method, total, own):
+        """
+        Acumula uma chamada medida nos dados do controle e da sua classe.
+        """
+        stats = self.__controls.get(control)
+        if stats is None:
+            stats = self.__controls[control] = {}
+            self.__labels[control] = self.label(control)
+
+        for table in (stats, self.__classes.setdefault(type(control).__name__, {})):
+            entry = table.get(method)
+            if entry is None:
+                table[method] = [1, total, own]
+            else:
+                entry[0] += 1
+                entry[1] += total
+                entry[2] += own
+
+    @staticmethod
+    def __rows(items, method, key):
+        """
+        Converte os dados coletados em linhas ordenadas pela coluna informada.
+        """
+        column = {'calls': 0, 'total': 1, 'own': 2}[key]
+        rows = []
+        for name, stats in items:
+            entry = stats.get(method)
+            if entry:
+                rows.append((name, entry[0], entry[1], entry[2]))
+
+        rows.sort(key=lambda row: row[column + 1], reverse=True)
+        return rows
+
+    # ========== Public Function's ============
+
+    @staticmethod
+    def label(control):
+        """Retorna um nome legível para o controle, usado nos relatórios.
+
+        Args:
+            control (Control): O controle.
+
+        Returns:
+            str: O nome do controle.
+        """
+        name = type(control).__name__
+        text = getattr(control, 'caption', None) or getattr(control, 'text', None)
+        if isinstance(text, str) and text:
+            name += f' {text[:16]!r}'
+
+        return f'{name} @{control.x},{control.y} #{id(control) & 0xffff:04x}'
+
+    def enable(self):
+        """
+        Ativa a medição, envolvendo os métodos draw e update das classes de controle.
+        """
+        if self.enabled:
+            return
+
+        for cls in self.__profiled_classes():
+            for method in PROFILED_METHODS:
+                func = cls.__dict__.get(method)
+                if func is not None:
+                    setattr(cls, method, self.__wrap(func, method))
+                    self.__patched.append((cls, method, func))
+
+        self.enabled = True
+
+    def disable(self):
+        """
+        Desativa a medição, restaurando os métodos originais. Os dados coletados são mantidos.
+        """
+        for cls, method, func in self.__patched:
+            setattr(cls, method, func)
+
+        self.__patched.clear()
+        self.__last_frame = None
+        self.enabled = False
+
+    def reset(self):
+        """
+        Descarta os dados coletados.
+        """
+        self.__controls.clear()
+        self.__labels.clear()
+        self.__classes.clear()
+        self.frames.clear()
+        self.__last_frame = None
+
+    def end_frame(self):
+        """
+        Marca o fim de um quadro, registrando o tempo desde a marcação anterior.
+        """
+        now = perf_counter()
+        if self.__last_frame is not None:
+            self.frames.append(now - self.__last_frame)
+        self.__last_frame = now
+
+    def frame_time(self):
+        """Retorna a duração média, em segundos, dos últimos quadros.
+
+        Returns:
+            float: A duração média ou 0 se nenhum quadro foi marcado.
+        """
+        if not self.frames:
+            return 0.0
+
+        return sum(self.frames) / len(self.frames)
+
+    def top(self, n = 10, method = 'draw', key = 'own'):
+        """Retorna os controles que mais gastaram tempo.
+
+        Args:
+            n (int, optional): A quantidade de controles. Default é 10.
+            method (str, optional): 'draw' ou 'update'. Default é 'draw'.
+            key (str, optional): A coluna de ordenação: 'own', 'total' ou 'calls'. Default é 'own'.
+
+        Returns:
+            list[tuple]: Linhas (nome, chamadas, tempo total, tempo próprio), com tempos em segundos.
+        """
+        labels = self.__labels
+        items = [(labels.get(control, '?'), stats) for control, stats in list(self.__controls.items())]
+        return self.__rows(items, method, key)[:n]
+
+    def by_class(self, method = 'draw', key = 'own'):
+        """Retorna os dados agrupados por classe de controle.
+
+        Args:
+            method (str, optional): 'draw' ou 'update'. Default é 'draw'.
+            key (str, optional): A coluna de ordenação: 'own', 'total' ou 'calls'. Default é 'own'.
+
+        Returns:
+            list[tuple]: Linhas (classe, chamadas, tempo total, tempo próprio), com tempos em segundos.
+        """
+        return self.__rows(self.__classes.items(), method, key)
+
+    def report(self, n = 20):
+        """Retorna um relatório em texto com os dados por classe e os controles mais lentos.
+
+        Args:
+            n (int, optional): A quantidade de controles listados em cada método. Default é 20.
+
+        Returns:
+            str: O relatório.
+        """
+        lines = []
+        if self.frames:
+            frame = self.frame_time()
+            lines.append(f'quadros: {len(self.frames)}  média: {frame * 1000:.2f} ms  ({1 / frame:.0f} fps)')
+            lines.append('')
+
+        header = f"{'':<48} {'chamadas':>9} {'total ms':>10} {'próprio ms':>11} {'média µs':>9}"
+        for method in PROFILED_METHODS:
+            for title, rows in ((f'{method} por classe', self.by_class(method)),
+                                (f'{method} por controle (top {n})', self.top(n, method))):
+                lines.append(title)
+                lines.append(header)
+                for name, calls, total, own in rows:
+                    lines.append(f'{name[:48]:<48} {calls:>9} {total * 1000:>10.3f} {own * 1000:>11.3f} '
+                                 f'{total / calls * 1e6:>9.1f}')
+                lines.append('')
+
+        return '\n'.join(lines)
+
+    def dump(self, path):
+        """Salva todos os dados coletados em um arquivo JSON.
+
+        Args:
+            path (str): O caminho do arquivo.
+        """
+        labels = self.__labels
+        data = {
+            'frames': list(self.frames),
+            'classes': self.__classes,
+            'controls': {labels.get(control, '?'): stats for control, stats in list(self.__controls.items())},
+        }
+
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=2)
+
+
+# Profiler usado pelo StatsOverlay e disponível para a aplicação
+profiler = Profiler()
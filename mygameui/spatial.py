@@ -0,0 +1,165 @@
+from pygame import Rect
+
+
+class SpatialIndex:
+    """Índice espacial em grade uniforme usado para encontrar controles sob um ponto.
+
+    Os controles são registrados com o seu retângulo relativo ao controle pai, portanto
+    mover o controle pai não invalida o índice. Cada controle também recebe uma ordem
+    de profundidade (z), e a consulta retorna o controle visível mais à frente.
+
+    Attributes:
+        cell_size (int): O tamanho, em pixels, de cada célula da grade.
+
+    Methods:
+        insert(control): Adiciona um controle ao índice, à frente dos demais.
+        insert_many(controls): Adiciona vários controles ao índice, na ordem informada.
+        remove(control): Remove um controle do índice.
+        update(control): Atualiza as células ocupadas por um controle após mudar de posição ou tamanho.
+        bring_to_front(control): Coloca o controle à frente dos demais.
+        hit(x, y): Retorna o controle visível mais à frente que contém o ponto.
+    """
+
+    def __init__(self, cell_size = 64):
+        self.cell_size = cell_size
+        self._cells: dict[tuple, list] = {}
+        self._control_cells: dict = {}
+        self._z: dict = {}
+        self._next_z = 0
+
+    # ========== Private Function's =========
+
+    def _cells_of(self, rect: Rect):
+        """
+        Retorna as chaves das células da grade ocupadas por um retângulo.
+        """
+        size = self.cell_size
+        x1 = rect.left // size
+        x2 = (rect.right - 1) // size
+        y1 = rect.top // size
+        y2 = (rect.bottom - 1) // size
+        return [(cx, cy) for cx in range(x1, x2 + 1) for cy in range(y1, y2 + 1)]
+
+    def _place(self, control):
+        """
+        Registra o controle nas células ocupadas pelo seu retângulo atual.
+        """
+        rect = control.rect
+        if rect.width <= 0 or rect.height <= 0:
+            keys = []
+        else:
+            keys = self._cells_of(rect)
+
+        for key in keys:
+            self._cells.setdefault(key, []).append(control)
+        self._control_cells[control] = keys
+
+    def _unplace(self, control):
+        """
+        Remove o controle das células em que foi registrado.
+        """
+        for key in self._control_cells.pop(control, ()):
+            cell = self._cells[key]
+            cell.remove(control)
+            if not cell:
+                del self._cells[key]
+
+    # ========== Public Function's ============
+
+    def insert(self, control):
+        """Adiciona um controle ao índice, à frente dos demais.
+
+        Args:
+            control (Control): O controle a ser adicionado.
+        """
+        self._place(control)
+        self.bring_to_front(control)
+
+    def insert_many(self, controls):
+        """Adiciona vários controles ao índice, na ordem informada, cada um à frente dos anteriores.
+
+        Args:
+            controls (Iterable[Control]): Os controles a serem adicionados.
+        """
+        size = self.cell_size
+        cells = self._cells
+        control_cells = self._control_cells
+        z = self._z
+        next_z = self._next_z
+
+        for control in controls:
+            rect = control.rect
+            if rect.width <= 0 or rect.height <= 0:
+                keys = []
+            else:
+                x1, y1 = rect.left // size, rect.top // size
+                x2, y2 = (rect.right - 1) // size, (rect.bottom - 1) // size
+                if x1 == x2 and y1 == y2:
+                    keys = [(x1, y1)]
+                else:
+                    keys = [(cx, cy) for cx in range(x1, x2 + 1) for cy in range(y1, y2 + 1)]
+
+                for key in keys:
+                    cell = cells.get(key)
+                    if cell is None:
+                        cells[key] = [control]
+                    else:
+                        cell.append(control)
+
+            control_cells[control] = keys
+            z[control] = next_z
+            next_z += 1
+
+        self._next_z = next_z
+
+    def remove(self, control):
+        """Remove um controle do índice.
+
+        Args:
+            control (Control): O controle a ser removido.
+        """
+        self._unplace(control)
+        self._z.pop(control, None)
+
+    def update(self, control):
+        """Atualiza as células ocupadas por um controle após mudar de posição ou tamanho.
+
+        Args:
+            control (Control): O controle alterado.
+        """
+        if control in self._control_cells:
+            self._unplace(control)
+            self._place(control)
+
+    def bring_to_front(self, control):
+        """Coloca o controle à frente dos demais.
+
+        Args:
+            control (Control): O controle a ser trazido para frente.
+        """
+        self._z[control] = self._next_z
+        self._next_z += 1
+
+    def hit(self, x, y):
+        """Retorna o controle visível mais à frente que contém o ponto.
+
+        Args:
+            x (int): A coordenada x do ponto, relativa ao controle pai.
+            y (int): A coordenada y do ponto, relativa ao controle pai.
+
+        Returns:
+            Control: O controle encontrado ou None.
+        """
+        cell = self._cells.get((x // self.cell_size, y // self.cell_size))
+        if not cell:
+            return None
+
+        found = None
+        found_z = -1
+        for control in cell:
+            z = self._z[control]
+            if z > found_z and control._visible and control.rect.collidepoint(x, y):
+                found = control
+                found_z = z
+
+        return found
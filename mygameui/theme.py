@@ -0,0 +1,173 @@
+from contextlib import contextmanager
+from weakref import WeakSet, WeakKeyDictionary
+
+from pygame import Surface, display
+
+import mygameui.utils as ui_utils
+
+# Controles que usam um tema, para que a troca do tema global possa redesenhá-los
+live_controls = WeakSet()
+
+# Surfaces de nove regiões geradas dentro de um shared_slices, por (tema, região, largura, altura)
+_shared = None
+
+class Theme:
+    """Atlas de tema: uma imagem carregada uma única vez e dividida em regiões nomeadas.
+
+    As regiões são recortadas uma única vez e compartilhadas por todos os controles. A imagem é
+    convertida para o formato da tela (convert_alpha) assim que existe uma janela, evitando a
+    conversão de pixels a cada blit.
+
+    Attributes:
+        surface (Surface): A imagem do tema, já convertida quando possível.
+        REGIONS (dict): As regiões nomeadas do tema, no formato (x, y, largura, altura).
+
+    Methods:
+        region(name): Retorna a Surface de uma região nomeada.
+        nine_slice(name, width, height): Gera uma Surface de nove regiões a partir de uma região nomeada.
+        of(theme): Retorna o Theme correspondente a um Theme ou a uma Surface.
+    """
+
+    REGIONS = {
+        # Moldura do formulário (nove regiões de 16x16 que formam um bloco de 48x48)
+        'form': (0, 0, 48, 48),
+        'form_top_movable': (48, 0, 48, 16),
+        'close': (96, 0, 16, 16),
+        'close_hover': (112, 0, 16, 16),
+        'button': (48, 16, 16, 16),
+        'button_hover': (64, 16, 16, 16),
+        'button_click': (80, 16, 16, 16),
+        'textbox': (96, 16, 16, 16),
+        'textbox_active': (112, 16, 16, 16),
+        'checkbox': (48, 32, 16, 16),
+        'checkbox_hover': (64, 32, 16, 16),
+        'checkbox_checked': (80, 32, 16, 16),
+    }
+
+    # Temas criados automaticamente para Surfaces passadas diretamente aos controles
+    _wrapped = WeakKeyDictionary()
+
+    def __init__(self, surface: Surface):
+        self._source = surface
+        self._converted = False
+        self._regions: dict[str, Surface] = {}
+        self.surface = surface
+
+        self._convert()
+
+    # ========== Private Function's =========
+
+    def _convert(self):
+        """
+        Converte a imagem para o formato da tela e recorta as regiões, se já existir uma janela.
+        """
+        if self._converted or display.get_surface() is None:
+            return
+
+        self.surface = self._source.convert_alpha()
+        self._converted = True
+        self._slice()
+
+    def _slice(self):
+        """
+        Recorta todas as regiões nomeadas da imagem do tema.
+        """
+        self._regions = {name: self.surface.subsurface(rect) for name, rect in self.REGIONS.items()}
+
+        # Moldura do formulário móvel: a linha superior vem da barra de título móvel
+        movable = Surface((48, 48), self.surface.get_flags(), self.surface)
+        movable.fill((0, 0, 0, 0))
+        movable.blit(self._regions['form_top_movable'], (0, 0))
+        movable.blit(self.surface.subsurface(0, 16, 48, 32), (0, 16))
+        self._regions['form_movable'] = movable
+
+    # ========== Public Function's ============
+
+    def region(self, name) -> Surface:
+        """Retorna a Surface de uma região nomeada do tema.
+
+        Args:
+            name (str): O nome da região.
+
+        Returns:
+            Surface: A região do tema (compartilhada, somente leitura).
+        """
+        if not self._converted:
+            self._convert()
+            if not self._regions:
+                self._slice()
+
+        return self._regions[name]
+
+    def nine_slice(self, name, width, height) -> Surface:
+        """Gera uma Surface de nove regiões a partir de uma região nomeada do tema.
+
+        Args:
+            name (str): O nome da região de origem.
+            width (int): A largura da Surface gerada.
+            height (int): A altura da Surface gerada.
+
+        Returns:
+            Surface: A Surface gerada (compartilhada, somente leitura).
+        """
+        if _shared is not None:
+            key = (self, name, width, height)
+            surface = _shared.get(key)
+            if surface is None:
+                surface = _shared[key] = ui_utils.generate_surface_byrect(self.region(name), width, height)
+            return surface
+
+        return ui_utils.generate_surface_byrect(self.region(name), width, height)
+
+    @classmethod
+    def of(cls, theme):
+        """Retorna o Theme correspondente a um Theme ou a uma Surface.
+
+        Surfaces são envolvidas em um Theme uma única vez, de modo que as regiões não sejam
+        recortadas novamente a cada controle.
+
+        Args:
+            theme (Theme | Surface): O tema ou a imagem do tema.
+
+        Returns:
+            Theme: O tema.
+        """
+        if isinstance(theme, Theme):
+            return theme
+
+        wrapped = cls._wrapped.get(theme)
+        if wrapped is None:
+            wrapped = cls(theme)
+            cls._wrapped[theme] = wrapped
+
+        return wrapped
+
+@contextmanager
+def shared_slices():
+    """Contexto em que as Surfaces de nove regiões são buscadas em um dicionário local.
+
+    Dentro do contexto, os controles do mesmo tipo e tamanho recebem a Surface gerada para o
+    primeiro deles sem passar pelo cache global de recortes, o que acelera a criação de muitos
+    controles de uma só vez. O dicionário é descartado ao sair do contexto.
+    """
+    global _shared
+    if _shared is not None:
+        yield # Já dentro de um shared_slices
+        return
+
+    _shared = {}
+    try:
+        yield
+    finally:
+        _shared = None
+
+def apply_theme(old: Theme, new: Theme):
+    """Troca o tema de todos os controles vivos que usam o tema antigo, em uma única passada.
+
+    Args:
+        old (Theme): O tema a ser substituído.
+        new (Theme): O novo tema.
+    """
+    for control in list(live_controls):
+        if control._theme is old:
+            control.set_surface_theme(new)
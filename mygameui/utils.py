@@ -1,18 +1,101 @@
-from pygame import Surface
+from pygame import Rect, Surface, mouse, constants
+from pygame.event import Event
 from pygame.transform import scale
 
-def generate_surface_byrect(surface: Surface, width, height):
+import mygameui.cache as ui_cache
+
+def event_pos(event: Event):
+    """
+    Retorna a posição do cursor associada a um evento.
+
+    Usa a posição registrada no evento (event.pos) quando existir, o que mantém o resultado
+    correto para eventos enfileirados ou reproduzidos. Para eventos sem posição, como os
+    de teclado, usa a posição atual do mouse.
+
+    Args:
+        event (Event): O evento do pygame.
+
+    Returns:
+        tuple: As coordenadas x e y do cursor.
+    """
+    pos = getattr(event, 'pos', None)
+    if pos is None:
+        return mouse.get_pos()
+
+    return pos
+
+def coalesce_motion(events):
     """
-    Gera uma nova Surface dividindo a Surface fornecida em nove regiões
+    Junta eventos MOUSEMOTION consecutivos em um único evento.
+
+    O evento resultante mantém a posição e os botões do último movimento e o deslocamento
+    (rel) igual à soma dos deslocamentos de todos os movimentos juntados. Os demais eventos
+    são mantidos na ordem original.
+
+    Args:
+        events (list[Event]): Os eventos do quadro.
+
+    Returns:
+        list[Event]: Os eventos com os movimentos consecutivos do mouse juntados.
+    """
+    result = []
+    rel_x = rel_y = 0
+    last_motion = None
+
+    for event in events:
+        if event.type == constants.MOUSEMOTION:
+            rel = getattr(event, 'rel', (0, 0))
+            rel_x += rel[0]
+            rel_y += rel[1]
+            last_motion = event
+            continue
+
+        if last_motion:
+            result.append(Event(constants.MOUSEMOTION, last_motion.dict, rel=(rel_x, rel_y)))
+            rel_x = rel_y = 0
+            last_motion = None
+
+        result.append(event)
+
+    if last_motion:
+        result.append(Event(constants.MOUSEMOTION, last_motion.dict, rel=(rel_x, rel_y)))
+
+    return result
+
+def region_key(surface: Surface):
+    """
+    Retorna uma chave que identifica a região da imagem de origem de uma Surface.
+
+    Subsurfaces que apontam para a mesma região de uma mesma Surface geram a mesma chave,
+    mesmo sendo objetos diferentes.
+
+    Args:
+        surface (Surface): A Surface (ou subsurface) de origem.
+
+    Returns:
+        tuple: Tupla (superfície pai, deslocamento, tamanho) da região.
+    """
+    return (surface.get_abs_parent(), surface.get_abs_offset(), surface.get_size())
+
+def generate_surface_byrect(surface: Surface, width, height, copy = False):
+    """
+    Gera uma Surface dividindo a Surface fornecida em nove regiões
     e as compondo em uma nova Surface com a largura e altura especificadas.
 
+    O resultado é memorizado em ui_cache.slice_cache, com chave (região de origem, largura, altura),
+    e a mesma Surface é retornada para todos os controles do mesmo tamanho e tema. Essa Surface
+    compartilhada deve ser tratada como somente leitura; use copy=True para obter uma cópia
+    que pode ser alterada livremente. Com o cache em disco ativo (ui_cache.set_disk_cache), a
+    Surface que não está em memória é carregada do disco antes de ser gerada.
+
     Args:
         surface (Surface): A Surface original a ser dividida.
         width (int): A largura da nova Surface.
         height (int): A altura da nova Surface.
+        copy (bool, optional): Retorna uma cópia privada em vez da Surface compartilhada. Default é False.
 
     Returns:
-        Surface: Uma nova Surface composta por nove regiões da Surface original.
+        Surface: Uma Surface composta por nove regiões da Surface original.
 
     Observação:
         Espera-se que a Surface de entrada tenha um tamanho que seja múltiplo de três em ambas as dimensões.
@@ -22,6 +105,29 @@ def generate_surface_byrect(surface: Surface, width, height):
         - Os retângulos de canto mantêm seu tamanho original e são posicionados nos cantos da nova Surface.
         - Os retângulos restantes são escalonados para se ajustarem ao espaço disponível e são posicionados conforme necessário.
     """
+    key = (region_key(surface), width, height)
+    new_surface = ui_cache.slice_cache.get(key)
+    if new_surface is None:
+        disk_cache = ui_cache.disk_cache
+        if disk_cache is not None:
+            new_surface = disk_cache.load(surface, width, height)
+
+        if new_surface is None:
+            new_surface = _build_surface_byrect(surface, width, height)
+            if disk_cache is not None:
+                disk_cache.store(surface, width, height, new_surface)
+
+        ui_cache.slice_cache.put(key, new_surface, width * height * new_surface.get_bytesize())
+
+    if copy:
+        return new_surface.copy()
+
+    return new_surface
+
+def _build_surface_byrect(surface: Surface, width, height):
+    """
+    Compõe, sem usar o cache, a Surface de nove regiões descrita em generate_surface_byrect.
+    """
     new_surface = Surface((width, height)).convert_alpha()
     new_surface.fill((0,0,0,0))
 
@@ -85,4 +191,167 @@ def generate_surface_byrect(surface: Surface, width, height):
     pos = (width - t_width, height - t_height)
     new_surface.blit(sub_s, pos) 
 
-    return new_surface
\ No newline at end of file
+    return new_surface
+
+
+class NineSliceCanvas:
+    """Surface de nove regiões redimensionável, atualizada de forma incremental.
+
+    Produz o mesmo resultado de generate_surface_byrect, mas guarda a Surface e os pedaços
+    esticados entre um tamanho e outro: ao mudar apenas a largura, as bordas esquerda e direita
+    não são esticadas de novo (e vice-versa), e os pedaços que não mudaram de posição não são
+    desenhados de novo. A Surface de fundo cresce em passos de `step` pixels e é reutilizada
+    ao encolher, de modo que redimensionar continuamente (por exemplo, arrastando a borda de
+    um formulário) quase não aloca memória.
+
+    Com exact=False, os pedaços são esticados para tamanhos arredondados em passos de `step`
+    pixels e recortados, de modo que só são esticados de novo quando o tamanho passa para outro
+    passo. O resultado é uma aproximação, adequada enquanto o tamanho muda a cada quadro.
+
+    A Surface retornada por resize é uma subsurface da Surface de fundo e só é válida até a
+    próxima chamada.
+
+    Attributes:
+        source (Surface): A Surface original, dividida em nove regiões.
+        step (int): O passo, em pixels, com que a Surface de fundo e os pedaços aproximados crescem.
+
+    Methods:
+        resize(width, height, exact): Retorna a Surface com o tamanho informado.
+    """
+
+    __slots__ = ('source', 'step', '__backing', '__size', '__exact', '__scaled', '__center', '__tile', '__rest')
+
+    def __init__(self, source: Surface, step = 64):
+        self.source = source
+        self.step = step
+
+        self.__backing: Surface = None
+        self.__size = None
+        self.__exact = True
+        # Pedaços esticados, por nome: (tamanho, Surface)
+        self.__scaled = {}
+        # Último centro desenhado: (Surface esticada, área ocupada na Surface de fundo)
+        self.__center = None
+
+        t_width = source.get_width() // 3
+        t_height = source.get_height() // 3
+        self.__tile = (t_width, t_height)
+        self.__rest = (source.get_width() - t_width * 2, source.get_height() - t_height * 2)
+
+    # ========== Private Function's =========
+
+    def __round_up(self, value):
+        """
+        Arredonda o valor para cima, para o próximo múltiplo do passo.
+        """
+        return -(-value // self.step) * self.step
+
+    def __stretched(self, name, area, size):
+        """
+        Retorna um pedaço da origem esticado ao tamanho informado (ou ao passo seguinte, no modo
+        aproximado), esticando-o apenas se o tamanho mudou.
+        """
+        if not self.__exact:
+            # Bordas esticadas em uma só direção mantêm a outra dimensão exata
+            size = (self.__round_up(size[0]) if size[0] != area[2] else size[0],
+                    self.__round_up(size[1]) if size[1] != area[3] else size[1])
+
+        cached = self.__scaled.get(name)
+        if cached is not None and cached[0] == size:
+            return cached[1]
+
+        surface = scale(self.source.subsurface(area), size)
+        self.__scaled[name] = (size, surface)
+        return surface
+
+    def __put(self, surface: Surface, pos, size = None, area_pos = (0, 0)):
+        """
+        Copia um pedaço (ou a parte dele que começa em area_pos, com o tamanho informado) para a
+        Surface de fundo, substituindo os pixels anteriores.
+        """
+        rect = Rect(pos, size or surface.get_size())
+        self.__backing.fill((0, 0, 0, 0), rect)
+        self.__backing.blit(surface, rect, Rect(area_pos, rect.size))
+
+    def __put_center(self, center: Surface, rect: Rect):
+        """
+        Desenha o centro esticado. Se a Surface do centro é a mesma do último desenho, apenas a
+        parte que o centro anterior não cobria é desenhada.
+        """
+        previous = self.__center
+        self.__center = (center, rect)
+
+        if previous is None or previous[0] is not center:
+            self.__put(center, rect.topleft, rect.size)
+            return
+
+        old = previous[1]
+        if rect.right > old.right:
+            strip = Rect(old.right, rect.top, rect.right - old.right, rect.height)
+            self.__put(center, strip.topleft, strip.size, (strip.x - rect.x, 0))
+        if rect.bottom > old.bottom:
+            strip = Rect(rect.left, old.bottom, min(rect.right, old.right) - rect.left, rect.bottom - old.bottom)
+            self.__put(center, strip.topleft, strip.size, (0, strip.y - rect.y))
+
+    # ========== Public Function's ============
+
+    def resize(self, width, height, exact = True) -> Surface:
+        """Retorna a Surface de nove regiões com o tamanho informado.
+
+        Args:
+            width (int): A largura da Surface.
+            height (int): A altura da Surface.
+            exact (bool, optional): False para esticar os pedaços em passos, uma aproximação
+                mais rápida durante um redimensionamento contínuo. Default é True.
+
+        Returns:
+            Surface: A Surface gerada, válida até a próxima chamada.
+        """
+        if self.__size == (width, height) and self.__exact == exact:
+            return self.__backing.subsurface(0, 0, width, height)
+
+        backing = self.__backing
+        full = backing is None or width > backing.get_width() or height > backing.get_height()
+        if full:
+            self.__backing = Surface((self.__round_up(width), self.__round_up(height))).convert_alpha()
+            self.__backing.fill((0, 0, 0, 0))
+            self.__center = None
+
+        # Trocar de modo redesenha todos os pedaços esticados
+        if full or self.__exact != exact:
+            old_width = old_height = None
+        else:
+            old_width, old_height = self.__size
+        self.__exact = exact
+        width_changed = width != old_width
+        height_changed = height != old_height
+
+        t_width, t_height = self.__tile
+        r_width, r_height = self.__rest
+        right = t_width + r_width
+        bottom = t_height + r_height
+        middle = (width - t_width * 2, height - t_height * 2)
+        source = self.source
+
+        # Cantos: o superior esquerdo nunca se move; os demais acompanham a borda que mudou
+        if full:
+            self.__put(source.subsurface(0, 0, t_width, t_height), (0, 0))
+        if width_changed:
+            self.__put(source.subsurface(right, 0, t_width, t_height), (width - t_width, 0))
+            self.__put(self.__stretched('top', (t_width, 0, r_width, t_height), (middle[0], t_height)),
+                       (t_width, 0), (middle[0], t_height))
+        if height_changed:
+            self.__put(source.subsurface(0, bottom, t_width, t_height), (0, height - t_height))
+            self.__put(self.__stretched('left', (0, t_height, t_width, r_height), (t_width, middle[1])),
+                       (0, t_height), (t_width, middle[1]))
+        if width_changed or height_changed:
+            self.__put(source.subsurface(right, bottom, t_width, t_height), (width - t_width, height - t_height))
+            self.__put(self.__stretched('right', (right, t_height, t_width, r_height), (t_width, middle[1])),
+                       (width - t_width, t_height), (t_width, middle[1]))
+            self.__put(self.__stretched('bottom', (t_width, bottom, r_width, t_height), (middle[0], t_height)),
+                       (t_width, height - t_height), (middle[0], t_height))
+            self.__put_center(self.__stretched('center', (t_width, t_height, r_width, r_height), middle),
+                              Rect((t_width, t_height), middle))
+
+        self.__size = (width, height)
+        return self.__backing.subsurface(0, 0, width, height)
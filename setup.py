@@ -6,7 +6,7 @@ setup(
     description='Uma biblioteca para criação de interfaces de usuário em pygame',
     author='Eudivan de Melo e Silva Junior',
     author_email='eudivan.mjunior@gmail.com',
-    packages=find_packages(),
+    packages=find_packages(include=['mygameui', 'mygameui.*']),
     package_data={'mygameui': ['imgs/*.png']},
     install_requires=['pygame'],
 )
\ No newline at end of file